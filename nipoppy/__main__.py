@@ -0,0 +1,7 @@
+"""Entry point for running the CLI with ``python -m nipoppy``."""
+
+from nipoppy.cli.cli import cli
+from nipoppy.env import PROGRAM_NAME
+
+if __name__ == "__main__":
+    cli(prog_name=PROGRAM_NAME)
@@ -18,7 +18,10 @@ except ImportError:
         return decorator
 
 
-from nipoppy._version import __version__
+try:
+    from nipoppy._version import __version__
+except ImportError:
+    __version__ = "unknown"
 from nipoppy.cli import exception_handler
 from nipoppy.cli.groups import OrderedAliasedGroupWithDotenv
 from nipoppy.cli.options import (
@@ -26,11 +29,11 @@ from nipoppy.cli.options import (
     dep_params,
     global_options,
     layout_option,
-    pipeline_options,
+    multi_pipeline_options,
     runners_options,
 )
 from nipoppy.cli.pipeline_catalog import pipeline
-from nipoppy.env import FPATH_USER_CONFIG
+from nipoppy.env import FPATH_USER_CONFIG, LinkModeEnum
 
 click.rich_click.OPTION_GROUPS = {
     "nipoppy *": [
@@ -41,14 +44,20 @@ click.rich_click.OPTION_GROUPS = {
                 "--pipeline",
                 "--pipeline-version",
                 "--pipeline-step",
+                "--all-installed",
                 "--bids-source",
                 "--mode",
                 "--container-store",
                 "--default-config",
                 "--empty",
                 "--copy-files",
+                "--link-mode",
                 "--check-dicoms",
+                "--dedup",
+                "--prescan",
+                "--full",
                 "--tar",
+                "--track",
                 "--query",
                 "--size",
                 "--zenodo-id",
@@ -71,6 +80,10 @@ click.rich_click.OPTION_GROUPS = {
                 "--hpc",
                 "--write-subcohort",
                 "--n-jobs",
+                "--max-cores",
+                "--max-mem",
+                "--shard-size",
+                "--merge-only",
             ],
         },
         {
@@ -79,6 +92,9 @@ click.rich_click.OPTION_GROUPS = {
                 "--verbose",
                 "--dry-run",
                 "--simulate",
+                "--simulate-output",
+                "--timeout",
+                "--max-attempts",
                 "--keep-workdir",
             ],
         },
@@ -197,7 +213,20 @@ def track_curation(**params):
 @click.option(
     "--copy-files",
     is_flag=True,
-    help="Copy files when reorganizing (default: create symlinks).",
+    help=(
+        "Copy files when reorganizing (default: create symlinks)."
+        " Same as --link-mode copy."
+    ),
+)
+@click.option(
+    "--link-mode",
+    type=click.Choice([link_mode.value for link_mode in LinkModeEnum]),
+    help=(
+        "How reorganized files are created (default: symlink). 'hardlink' avoids "
+        "data copies but only works within a single filesystem. 'reflink' creates "
+        "copy-on-write clones on filesystems that support them (e.g. XFS, Btrfs) and "
+        "falls back on regular copies otherwise."
+    ),
 )
 @click.option(
     "--check-dicoms",
@@ -208,6 +237,31 @@ def track_curation(**params):
         "converters). The paths to the derived DICOMs will be written to the log."
     ),
 )
+@click.option(
+    "--dedup",
+    is_flag=True,
+    help=(
+        "Skip files whose content is identical to another file of the same "
+        "participant-session pair (e.g. data delivered twice under different "
+        "folder names). File contents are hashed in parallel and the hashes are "
+        "cached for later runs."
+    ),
+)
+@click.option(
+    "--prescan",
+    is_flag=True,
+    help=(
+        "List the files of all participant-session pairs to reorganize in a single "
+        "parallel scan before reorganizing them, and log the total number of files. "
+        "Cannot be used if some DICOM directories are archives."
+    ),
+)
+@click.option(
+    "--n-jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of parallel workers to use.",
+)
 @global_options
 @layout_option
 def reorg(**params):
@@ -223,6 +277,36 @@ def reorg(**params):
         workflow.run()
 
 
+@cli.command()
+@dataset_option
+@click.option(
+    "--n-jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of parallel workers to use.",
+)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Rebuild the index from scratch (default: only index new or modified files).",
+)
+@global_options
+@layout_option
+def index_dicoms(**params):
+    """Build or update an index of DICOM header fields.
+
+    The index covers all files in
+    ``<NIPOPPY_PROJECT_ROOT>/sourcedata/imaging/pre_reorg`` and is used by
+    ``nipoppy reorg --check-dicoms`` to avoid re-reading headers.
+    """
+    from nipoppy.workflows.dicom_index import DicomIndexWorkflow
+
+    params = dep_params(**params)
+    with exception_handler(DicomIndexWorkflow(**params)) as workflow:
+        workflow.run()
+
+
 @cli.command()
 @dataset_option
 @runners_options
@@ -249,6 +333,15 @@ def bidsify(**params):
         "in the tracker configuration file."
     ),
 )
+@click.option(
+    "--track",
+    is_flag=True,
+    help=(
+        "Check the outputs of each participant-session with the tracker "
+        "configuration file after it is run, and record its status in the "
+        "processing status file at the end of the run."
+    ),
+)
 @global_options
 @layout_option
 def process(**params):
@@ -262,21 +355,106 @@ def process(**params):
 
 @cli.command()
 @dataset_option
-@pipeline_options
+@multi_pipeline_options
+@click.option(
+    "--all-installed",
+    is_flag=True,
+    help=(
+        "Track all steps (with a tracker config file) of all installed versions of "
+        "all processing pipelines."
+    ),
+)
+@click.option(
+    "--use-subcohort",
+    type=click.Path(path_type=Path, exists=True, resolve_path=True, dir_okay=False),
+    help=(
+        "Path to a TSV file containing participant-session pairs to be tracked, "
+        "in the same format as for the pipeline runner commands."
+    ),
+)
+@click.option(
+    "--hpc",
+    help=(
+        "Submit HPC jobs instead of tracking participants and sessions directly. "
+        "The value should be the HPC cluster type (see the pipeline runner "
+        "commands). Each job adds its results to the processing status file when "
+        "it finishes."
+    ),
+)
+@click.option(
+    "--shard-size",
+    type=click.IntRange(min=1),
+    default=100,
+    help="Number of participant-session pairs tracked by each HPC job.",
+)
+# used by HPC jobs
+@click.option(
+    "--partial-status-file",
+    type=click.Path(path_type=Path, resolve_path=True, dir_okay=False),
+    hidden=True,
+)
+@click.option(
+    "--merge-only",
+    is_flag=True,
+    help=(
+        "Only merge the results of completed HPC jobs into the processing status "
+        "file, and discard the shards of HPC jobs that failed so that their "
+        "participants and sessions can be submitted again. Use this once all the "
+        "HPC jobs have ended."
+    ),
+)
 @click.option(
     "--n-jobs",
     type=int,
     default=1,
     help=("Number of parallel workers to use."),
 )
+@click.option(
+    "--full",
+    is_flag=True,
+    help=(
+        "Check all participants and sessions, including those whose output "
+        "directory has not changed since they were last tracked. Use this if "
+        "outputs may have changed in ways that are not detected (e.g. below a '**' "
+        "glob expression in the tracker configuration file)."
+    ),
+)
 @global_options
 @layout_option
 def track_processing(**params):
-    """Track the processing status of a pipeline."""
-    from nipoppy.workflows.tracker import PipelineTracker
+    """Track the processing status of one or more pipelines."""
+    from nipoppy.workflows.tracker import MultiPipelineTracker, PipelineTracker
 
     params = dep_params(**params)
-    with exception_handler(PipelineTracker(**params)) as workflow:
+    pipeline_names = params.pop("pipeline_name")
+    all_installed = params.pop("all_installed")
+
+    if len(pipeline_names) == 1 and not all_installed:
+        workflow = PipelineTracker(pipeline_name=pipeline_names[0], **params)
+    elif len(pipeline_names) == 0 and not all_installed:
+        raise click.UsageError("Missing option '--pipeline' (or '--all-installed').")
+    else:
+        # options that only make sense for a single pipeline
+        for option, param in {
+            "--pipeline-version": "pipeline_version",
+            "--pipeline-step": "pipeline_step",
+            "--hpc": "hpc",
+            "--partial-status-file": "partial_status_file",
+        }.items():
+            if params.pop(param) is not None:
+                raise click.UsageError(
+                    f"{option} cannot be used when tracking multiple pipelines."
+                )
+        if params.pop("merge_only"):
+            raise click.UsageError(
+                "--merge-only cannot be used when tracking multiple pipelines."
+            )
+        params.pop("shard_size")
+        workflow = MultiPipelineTracker(
+            pipeline_names=list(pipeline_names), all_installed=all_installed, **params
+        )
+
+    with exception_handler(workflow) as workflow:
         workflow.run()
 
 
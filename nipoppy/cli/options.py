@@ -72,42 +72,63 @@ def layout_option(func):
     return func
 
 
-def pipeline_options(func):
-    """Define pipeline options for the CLI."""
-    func = click.option(
-        "--session-id",
-        type=str,
-        help=f"Session ID (with or without the {BIDS_SESSION_PREFIX} prefix).",
-    )(func)
-    func = click.option(
-        "--participant-id",
-        type=str,
-        help=f"Participant ID (with or without the {BIDS_SUBJECT_PREFIX} prefix).",
-    )(func)
-    func = click.option(
-        "--pipeline-step",
-        type=str,
-        help=(
-            "Pipeline step, as specified in the pipeline config file "
-            "(default: first step)."
-        ),
-    )(func)
-    func = click.option(
-        "--pipeline-version",
-        type=str,
-        help=(
-            "Pipeline version, as specified in the pipeline config file "
-            "(default: latest out of the installed versions)."
-        ),
-    )(func)
-    func = click.option(
-        "--pipeline",
-        "pipeline_name",
-        type=str,
-        required=True,
-        help="Pipeline name, as specified in the config file.",
-    )(func)
-    return func
+def _get_pipeline_options(multiple_pipelines: bool = False):
+    """Get a decorator for the pipeline options of the CLI.
+
+    If ``multiple_pipelines`` is True, --pipeline can be given multiple times and is
+    not required.
+    """
+
+    def pipeline_options(func):
+        """Define pipeline options for the CLI."""
+        func = click.option(
+            "--session-id",
+            type=str,
+            help=f"Session ID (with or without the {BIDS_SESSION_PREFIX} prefix).",
+        )(func)
+        func = click.option(
+            "--participant-id",
+            type=str,
+            help=f"Participant ID (with or without the {BIDS_SUBJECT_PREFIX} prefix).",
+        )(func)
+        func = click.option(
+            "--pipeline-step",
+            type=str,
+            help=(
+                "Pipeline step, as specified in the pipeline config file "
+                "(default: first step)."
+            ),
+        )(func)
+        func = click.option(
+            "--pipeline-version",
+            type=str,
+            help=(
+                "Pipeline version, as specified in the pipeline config file "
+                "(default: latest out of the installed versions)."
+            ),
+        )(func)
+        func = click.option(
+            "--pipeline",
+            "pipeline_name",
+            type=str,
+            required=not multiple_pipelines,
+            multiple=multiple_pipelines,
+            help=(
+                "Pipeline name, as specified in the config file."
+                + (
+                    " Can be given multiple times to track several pipelines at once."
+                    if multiple_pipelines
+                    else ""
+                )
+            ),
+        )(func)
+        return func
+
+    return pipeline_options
+
+
+pipeline_options = _get_pipeline_options()
+multi_pipeline_options = _get_pipeline_options(multiple_pipelines=True)
 
 
 def runners_options(func):
@@ -148,6 +169,58 @@ def runners_options(func):
             "other cluster types supported by PySQA (https://pysqa.readthedocs.io/)."
         ),
     )(func)
+    func = click.option(
+        "--n-jobs",
+        type=click.IntRange(min=1),
+        default=1,
+        help=(
+            "Number of participant-session pairs to run in parallel, each in a "
+            "separate process with its own log file."
+        ),
+    )(func)
+    func = click.option(
+        "--max-cores",
+        type=click.IntRange(min=1),
+        help=(
+            "Maximum total number of CPUs used by the participant-session pairs run "
+            "in parallel, based on the CORES value in the pipeline step's HPC config. "
+            "If --n-jobs is greater than 1, it is used as an upper limit on the "
+            "number of parallel runs."
+        ),
+    )(func)
+    func = click.option(
+        "--max-mem",
+        help=(
+            "Maximum total amount of memory (e.g. 64G) used by the participant-session "
+            "pairs run in parallel, based on the MEMORY value in the pipeline step's "
+            "HPC config. If --n-jobs is greater than 1, it is used as an upper limit "
+            "on the number of parallel runs."
+        ),
+    )(func)
+    func = click.option(
+        "--timeout",
+        type=click.FloatRange(min=0, min_open=True),
+        help=(
+            "Maximum run time (in seconds) for each participant-session pair. Runs "
+            "that take longer are terminated and counted as failed. Overrides the "
+            "TIMEOUT field of the pipeline step configuration."
+        ),
+    )(func)
+    func = click.option(
+        "--max-attempts",
+        type=click.IntRange(min=1),
+        help=(
+            "Maximum number of times the pipeline is run for each participant-session"
+            " pair, with exponential backoff between attempts. Overrides the "
+            "RETRY.MAX_ATTEMPTS field of the pipeline step configuration."
+        ),
+    )(func)
+    # used by parallel local processes
+    func = click.option(
+        "--report-retryable",
+        is_flag=True,
+        hidden=True,
+    )(func)
     func = click.option(
         "--keep-workdir",
         is_flag=True,
@@ -161,6 +234,16 @@ def runners_options(func):
         is_flag=True,
         help="Simulate the pipeline run without executing the generated command-line.",
     )(func)
+    func = click.option(
+        "--simulate-output",
+        type=click.Path(path_type=Path, resolve_path=True, dir_okay=False),
+        help=(
+            "Path to a file to be written. If this is provided, the pipeline will be "
+            "simulated (see --simulate) and the command lines for all participants "
+            "and sessions will be generated in a single process and written to "
+            "this file."
+        ),
+    )(func)
     func = pipeline_options(func)
     return func
 
@@ -1,12 +1,34 @@
 """High-performance computing (HPC) job submission configuration."""
 
-from typing import ClassVar
+import re
+from typing import ClassVar, Optional
 
 from pydantic import BaseModel, ConfigDict, model_validator
 from typing_extensions import Self
 
 from nipoppy.exceptions import ConfigError
 
+# memory amounts in Slurm format: number with an optional unit suffix
+# (default: megabytes)
+_MEMORY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)B?\s*$", re.IGNORECASE)
+_MEMORY_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_memory(memory: str) -> int:
+    """
+    Convert a memory amount (e.g. "16G" or "500M") to bytes.
+
+    Amounts without a unit are in megabytes, like in Slurm.
+    """
+    match = _MEMORY_PATTERN.match(str(memory))
+    if match is None:
+        raise ConfigError(
+            f"Invalid memory amount: {memory}. Expected a number followed by an "
+            "optional unit (K, M, G or T), e.g. 16G"
+        )
+    value, unit = match.groups()
+    return int(float(value) * _MEMORY_UNITS[unit.upper() or "M"])
+
 
 class HpcConfig(BaseModel):
     r"""
@@ -47,3 +69,20 @@ class HpcConfig(BaseModel):
             if (value is not None) and not isinstance(value, str):
                 setattr(self, key, str(value))
         return self
+
+    def get_cores(self) -> Optional[int]:
+        """Get the number of CPUs requested for each job (CORES), if set."""
+        cores = getattr(self, "CORES", None)
+        if cores is None or cores == "":
+            return None
+        try:
+            return int(cores)
+        except ValueError as e:
+            raise ConfigError(f"Invalid number of cores in HPC config: {cores}") from e
+
+    def get_memory(self) -> Optional[int]:
+        """Get the amount of memory requested for each job (MEMORY) in bytes, if set."""
+        memory = getattr(self, "MEMORY", None)
+        if memory is None or memory == "":
+            return None
+        return parse_memory(memory)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from abc import ABC
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pydantic_core import to_jsonable_python
 
 from nipoppy.config.container import _SchemaWithContainerConfig
@@ -27,6 +28,78 @@ class AnalysisLevelType(str, Enum):
     group = "group"
 
 
+class RetryConfig(BaseModel):
+    """Schema for the retry configuration of a pipeline step."""
+
+    MAX_ATTEMPTS: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Maximum number of times the pipeline is run for a single "
+            "participant/session. By default, failed runs are not retried."
+        ),
+    )
+    BACKOFF_SECONDS: float = Field(
+        default=60,
+        ge=0,
+        description="Time (in seconds) to wait before the first retry",
+    )
+    BACKOFF_FACTOR: float = Field(
+        default=2,
+        ge=1,
+        description=(
+            "Factor by which the time to wait is multiplied after each retry "
+            "(exponential backoff)"
+        ),
+    )
+    EXIT_CODES: list[int] = Field(
+        default=[],
+        description=(
+            "Only retry runs whose pipeline command exited with one of these codes. "
+            "If neither EXIT_CODES nor STDERR_PATTERNS is set, all failed pipeline "
+            "commands are retried, except the ones that exceeded the time limit"
+        ),
+    )
+    STDERR_PATTERNS: list[str] = Field(
+        default=[],
+        description=(
+            "Only retry runs whose pipeline command wrote a line matching one of "
+            "these regular expressions to stderr. If EXIT_CODES is also set, runs "
+            "matching either condition are retried"
+        ),
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="after")
+    def validate_after(self):
+        """Make sure that the stderr patterns are valid regular expressions."""
+        for pattern in self.STDERR_PATTERNS:
+            try:
+                re.compile(pattern)
+            except re.error as exception:
+                raise ConfigError(
+                    f"Invalid regular expression in STDERR_PATTERNS: {pattern}"
+                    f" ({exception})"
+                )
+        return self
+
+    def get_delay(self, n_failed_attempts: int) -> float:
+        """Get the time (in seconds) to wait after a number of failed attempts."""
+        return self.BACKOFF_SECONDS * self.BACKOFF_FACTOR ** (n_failed_attempts - 1)
+
+    def matches(self, returncode: Optional[int], stderr: Optional[str]) -> bool:
+        """Check whether a failed pipeline command should be retried."""
+        if len(self.EXIT_CODES) == 0 and len(self.STDERR_PATTERNS) == 0:
+            return True
+        if returncode in self.EXIT_CODES:
+            return True
+        return stderr is not None and any(
+            re.search(pattern, stderr, flags=re.MULTILINE)
+            for pattern in self.STDERR_PATTERNS
+        )
+
+
 class BasePipelineStepConfig(_SchemaWithContainerConfig, ABC):
     """Schema for processing pipeline step configuration."""
 
@@ -67,6 +140,23 @@ class BasePipelineStepConfig(_SchemaWithContainerConfig, ABC):
             f"{DEFAULT_LAYOUT_INFO.dpath_hpc} directory."
         ),
     )
+    TIMEOUT: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Maximum run time (in seconds) of the pipeline for a single "
+            "participant/session. Runs that take longer are terminated (including "
+            "their child processes) and counted as failed. By default, there is no "
+            "time limit."
+        ),
+    )
+    RETRY: RetryConfig = Field(
+        default=RetryConfig(),
+        description=(
+            "How failed runs of the pipeline for a single participant/session are "
+            "retried. By default, failed runs are not retried."
+        ),
+    )
 
     @model_validator(mode="before")
     @classmethod
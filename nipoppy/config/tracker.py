@@ -51,7 +51,10 @@ class TrackerConfig(BaseModel):
     PARTICIPANT_SESSION_DIR: Optional[Path] = Field(
         default=None,
         description=(
-            "Path to the directory where participant-session results are expected"
+            "Path to the directory where participant-session results are expected. "
+            "If specified, participants/sessions whose outputs have not changed since "
+            "they were last tracked are skipped. Changes below a '**' glob expression "
+            "in PATHS are not detected (use --full to check all participants/sessions)"
         ),
     )
 
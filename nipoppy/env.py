@@ -49,7 +49,19 @@ FPATH_USER_CONFIG = "~/.nipoppy/config.json"
 
 # file extensions
 EXT_TAR = ".tar"
+EXT_TAR_MEMBERS = ".members.txt"
 EXT_LOG = ".log"
+# archives that can be reorganized without being extracted first
+EXTS_ARCHIVE = (
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tbz2",
+    ".tar.xz",
+    ".txz",
+)
 
 # dotenv files
 # from highest to lowest priority
@@ -64,6 +76,15 @@ class ContainerCommandEnum(str, Enum):
     SINGULARITY = "singularity"
 
 
+class LinkModeEnum(str, Enum):
+    """Ways of populating a directory with (links to) existing files."""
+
+    SYMLINK = "symlink"
+    HARDLINK = "hardlink"
+    REFLINK = "reflink"
+    COPY = "copy"
+
+
 class PipelineTypeEnum(str, Enum):
     """Pipeline types."""
 
@@ -35,6 +35,8 @@ class ReturnCode(IntEnum):
     NO_PARTICIPANTS_OR_SESSIONS_TO_RUN = 162
     CONTAINER_ERROR = 163
     PIPELINE_EXECUTION_ERROR = 164
+    PIPELINE_TIMEOUT = 165
+    PIPELINE_RETRYABLE_ERROR = 166
 
     # 170-199: reserved for future Nipoppy use
 
@@ -151,6 +153,16 @@ class ExecutionError(NipoppyError, RuntimeError):
     default_hint = "Inspect the pipeline logs to locate the failed step"
 
 
+class PipelineTimeoutError(ExecutionError):
+    """Exception for pipeline runs that exceed their time limit."""
+
+    code = ReturnCode.PIPELINE_TIMEOUT
+    default_hint = (
+        "Increase the TIMEOUT of the pipeline step (or the --timeout option), or "
+        "check whether the pipeline is stuck (e.g. waiting on a network file system)"
+    )
+
+
 class LayoutError(NipoppyError, ValueError):
     """Exception for layout validation errors."""
 
@@ -236,6 +236,18 @@ class DatasetLayout(Base):
         self.fpath_spec = Path(fpath_config)
         self.config = config
         self.dpath_nipoppy = self.dpath_root / NIPOPPY_DIR_NAME
+        self.fpath_dicom_index = self.dpath_nipoppy / "dicom_index.sqlite"
+        self.fpath_hash_index = self.dpath_nipoppy / "file_hashes.sqlite"
+        self.fpath_pipeline_index = self.dpath_nipoppy / "pipeline_index.sqlite"
+        self.dpath_validated_bundles = self.dpath_nipoppy / "validated_bundles"
+        self.fpath_run_times = self.dpath_nipoppy / "run_times.sqlite"
+        self.fpath_tracker_fingerprints = (
+            self.dpath_nipoppy / "tracker_fingerprints.sqlite"
+        )
+        self.fpath_processing_status_lock = (
+            self.dpath_nipoppy / "processing_status.lock"
+        )
+        self.fpath_curation_status_lock = self.dpath_nipoppy / "curation_status.lock"
 
         # directories
         self.dpath_bids: Path = self._prepend_study_path(self.config.dpath_bids.path)
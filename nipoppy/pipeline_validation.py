@@ -1,12 +1,19 @@
 """Pipeline store functions."""
 
+import hashlib
 import json
 import logging
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
+from typing import Optional
 
 import boutiques
 from pydantic_core import ValidationError
 
+try:
+    from nipoppy._version import __version__
+except ImportError:
+    __version__ = "unknown"
 from nipoppy.config.hpc import HpcConfig
 from nipoppy.config.pipeline import (
     BasePipelineConfig,
@@ -21,6 +28,7 @@ from nipoppy.env import ConfigType, PipelineTypeEnum, StrOrPathLike
 from nipoppy.exceptions import ConfigError, FileOperationError
 from nipoppy.layout import DatasetLayout, LayoutError
 from nipoppy.logger import get_logger
+from nipoppy.utils import fileops
 from nipoppy.utils.utils import TEMPLATE_REPLACE_PATTERN, load_json
 
 logger = get_logger()
@@ -303,3 +311,62 @@ def check_pipeline_bundle(
     _check_no_subdirectories(dpath_bundle)
 
     return config
+
+
+def _get_boutiques_version() -> str:
+    try:
+        return version("boutiques")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def get_bundle_digest(dpath_bundle: StrOrPathLike, *, strict: bool = False) -> str:
+    """
+    Compute a digest of a pipeline bundle for caching its validation.
+
+    The digest depends on the name and content of every file in the bundle
+    directory, on the Nipoppy and Boutiques versions, and on ``strict``.
+    """
+    digest = hashlib.sha256()
+    for value in (__version__, _get_boutiques_version(), fileops.HASH_ALGORITHM):
+        digest.update(f"{value}\0".encode())
+    digest.update(f"strict={strict}\0".encode())
+    for path in sorted(Path(dpath_bundle).iterdir()):
+        # subdirectories are not allowed, but they should still change the digest
+        content_hash = "directory" if path.is_dir() else fileops.hash_file(path)
+        digest.update(f"{path.name}\0{content_hash}\0".encode())
+    return digest.hexdigest()
+
+
+def check_pipeline_bundle_cached(
+    dpath_bundle: StrOrPathLike,
+    dpath_cache: StrOrPathLike,
+    *,
+    strict: bool = False,
+    dry_run: bool = False,
+) -> Optional[BasePipelineConfig]:
+    """
+    Validate a pipeline bundle, unless an identical bundle was already validated.
+
+    Successful validations are recorded as empty files named after the bundle digest
+    (see :func:`get_bundle_digest`) in ``dpath_cache``. Return the pipeline config if
+    the bundle was validated, or None if the validation was skipped.
+    """
+    dpath_bundle = Path(dpath_bundle)
+    if not dpath_bundle.is_dir():
+        # let the validation raise the appropriate error
+        return check_pipeline_bundle(dpath_bundle, strict=strict)
+
+    fpath_record = Path(dpath_cache) / get_bundle_digest(dpath_bundle, strict=strict)
+    if fpath_record.exists():
+        logger.debug(
+            f"Skipping validation of pipeline bundle {dpath_bundle}"
+            " (unchanged since last validated)"
+        )
+        return None
+
+    config = check_pipeline_bundle(dpath_bundle, strict=strict)
+    if not dry_run:
+        fileops.mkdir(fpath_record.parent)
+        fpath_record.touch()
+    return config
@@ -4,6 +4,7 @@ import json
 from collections import defaultdict
 from functools import cached_property
 from pathlib import Path
+from typing import Optional
 
 from nipoppy.base import Base
 from nipoppy.config.main import Config
@@ -15,6 +16,7 @@ from nipoppy.logger import get_logger
 from nipoppy.tabular.curation_status import CurationStatusTable
 from nipoppy.tabular.manifest import Manifest
 from nipoppy.tabular.processing_status import ProcessingStatusTable
+from nipoppy.utils.file_index import PipelineConfigIndex
 from nipoppy.utils.utils import load_json, process_template_str
 
 logger = get_logger()
@@ -40,6 +42,11 @@ class Study(Base):
         super().__init__()
         self.layout = layout
 
+        # installed pipeline bundles, indexed on first use
+        self._pipeline_bundles: Optional[
+            list[tuple[PipelineTypeEnum, str, str, Path]]
+        ] = None
+
     def __len__(self):
         """Get the number of unique participant-visit combinations in the study."""
         return len(self.manifest)
@@ -90,34 +97,111 @@ class Study(Base):
         logger.debug(f"Loading processing status table from {fpath_table}")
         return ProcessingStatusTable.load(fpath_table)
 
-    def _get_pipeline_info_map(
-        self,
-    ) -> dict[PipelineTypeEnum, defaultdict[str, list[str]]]:
-        pipeline_type_to_info_map = {}
-        for pipeline_type in PipelineTypeEnum:
-            pipeline_names_to_versions_map = defaultdict(list)
-            dpath_pipeline_bundles = (
-                self.layout.dpath_pipelines
-                / DatasetLayout.pipeline_type_to_dname_map[pipeline_type]
+    def _load_pipeline_name_and_version(self, fpath_config: Path) -> tuple[str, str]:
+        try:
+            pipeline_config = BasePipelineConfig(
+                **load_json(fpath_config, allow_json5=True)
             )
-            for fpath_config in sorted(
-                dpath_pipeline_bundles.glob(f"*/{self.layout.fname_pipeline_config}")
-            ):
-                try:
-                    pipeline_config = BasePipelineConfig(
-                        **load_json(fpath_config, allow_json5=True)
-                    )
-                except Exception as e:
-                    raise ConfigError(
-                        f"Error when loading pipeline config at {fpath_config}: {e}"
-                    ) from e
+        except Exception as e:
+            raise ConfigError(
+                f"Error when loading pipeline config at {fpath_config}: {e}"
+            ) from e
+        return pipeline_config.NAME, pipeline_config.VERSION
+
+    def get_pipeline_bundles(
+        self, refresh: bool = False
+    ) -> list[tuple[PipelineTypeEnum, str, str, Path]]:
+        """Get the type, name, version and config file path of installed pipelines.
+
+        Names and versions are read from the pipeline index file, which is updated
+        first with the config files that are new or that have been modified since
+        they were indexed. The index is not used if the dataset has not been
+        initialized. This is only done on the first call: later calls return the
+        same pipeline bundles without accessing the filesystem.
 
-                pipeline_names_to_versions_map[pipeline_config.NAME].append(
-                    pipeline_config.VERSION
-                )
+        Parameters
+        ----------
+        refresh : bool, optional
+            Look for new or modified config files again, by default False
 
-            pipeline_type_to_info_map[pipeline_type] = pipeline_names_to_versions_map
+        Returns
+        -------
+        list[tuple[nipoppy.env.PipelineTypeEnum, str, str, pathlib.Path]]
+            Pipeline bundles, sorted by type and by config file path
+        """
+        if refresh or self._pipeline_bundles is None:
+            self._pipeline_bundles = self._index_pipeline_bundles()
+        return list(self._pipeline_bundles)
 
+    def _index_pipeline_bundles(
+        self,
+    ) -> list[tuple[PipelineTypeEnum, str, str, Path]]:
+        """Update the pipeline index file and get the installed pipeline bundles."""
+        fpaths_by_type = {
+            pipeline_type: sorted(
+                (
+                    self.layout.dpath_pipelines
+                    / DatasetLayout.pipeline_type_to_dname_map[pipeline_type]
+                ).glob(f"*/{self.layout.fname_pipeline_config}")
+            )
+            for pipeline_type in PipelineTypeEnum
+        }
+        fpaths = [fpath for fpaths in fpaths_by_type.values() for fpath in fpaths]
+
+        if not self.layout.dpath_nipoppy.exists():
+            pipelines = {
+                fpath: self._load_pipeline_name_and_version(fpath) for fpath in fpaths
+            }
+        else:
+            with PipelineConfigIndex(
+                self.layout.fpath_pipeline_index, self.layout.dpath_pipelines
+            ) as index:
+                stale, _ = index.get_stale(fpaths)
+                for fpath, mtime_ns, size in stale:
+                    logger.debug(f"Indexing pipeline config {fpath}")
+                    index.update(
+                        fpath,
+                        mtime_ns,
+                        size,
+                        *self._load_pipeline_name_and_version(fpath),
+                    )
+                index.commit()
+                index.remove_missing(fpaths)
+                pipelines = index.get_pipelines(fpaths)
+
+        return [
+            (pipeline_type, *pipelines[fpath], fpath)
+            for pipeline_type, fpaths in fpaths_by_type.items()
+            for fpath in fpaths
+        ]
+
+    def add_to_pipeline_index(
+        self, fpath_config: Path, pipeline_name: str, pipeline_version: str
+    ):
+        """Add (or update) a pipeline config file in the pipeline index file."""
+        # installed pipeline bundles are indexed again on next use
+        self._pipeline_bundles = None
+        stat = fpath_config.stat()
+        with PipelineConfigIndex(
+            self.layout.fpath_pipeline_index, self.layout.dpath_pipelines
+        ) as index:
+            index.update(
+                fpath_config,
+                stat.st_mtime_ns,
+                stat.st_size,
+                pipeline_name,
+                pipeline_version,
+            )
+            index.commit()
+
+    def _get_pipeline_info_map(
+        self,
+    ) -> dict[PipelineTypeEnum, defaultdict[str, list[str]]]:
+        pipeline_type_to_info_map = {
+            pipeline_type: defaultdict(list) for pipeline_type in PipelineTypeEnum
+        }
+        for pipeline_type, name, version, _ in self.get_pipeline_bundles():
+            pipeline_type_to_info_map[pipeline_type][name].append(version)
         return pipeline_type_to_info_map
 
     def get_installed_pipelines(self) -> dict[str, dict[str, list[str]]]:
@@ -8,7 +8,7 @@ from typing import Optional
 from pydantic import Field
 from typing_extensions import Self
 
-from nipoppy.env import FAKE_SESSION_ID, StrOrPathLike
+from nipoppy.env import EXTS_ARCHIVE, FAKE_SESSION_ID, StrOrPathLike
 from nipoppy.exceptions import TabularError
 from nipoppy.logger import get_logger
 from nipoppy.tabular.dicom_dir_map import DicomDirMap
@@ -168,7 +168,10 @@ def generate_curation_status_table(
         else:
             dpath = Path(dpath)
             dpath_participant: Path = dpath / dname_subdirectory
-            if dpath_participant.exists():
+            if dpath_participant.is_file():
+                # session archive (other files are not reorganized)
+                status = dpath_participant.name.lower().endswith(EXTS_ARCHIVE)
+            elif dpath_participant.exists():
                 status = next(dpath_participant.iterdir(), None) is not None
             else:
                 status = False
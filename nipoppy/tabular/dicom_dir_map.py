@@ -33,7 +33,8 @@ class DicomDirMapModel(BaseTabularModel):
     participant_dicom_dir: str = Field(
         title="Participant's raw DICOM directory",
         description=(
-            "Path to the participant's source DICOM directory, relative to "
+            "Path to the participant's source DICOM directory (or zip/tar archive)"
+            ", relative to "
             f" {DEFAULT_LAYOUT_INFO.dpath_pre_reorg}"
         ),
     )
@@ -143,6 +143,23 @@ class ProcessingStatusTable(BaseTabular):
     # set the model
     model = ProcessingStatusModel
 
+    def get_tracked_participants_sessions(
+        self,
+        pipeline_name: str,
+        pipeline_version: str,
+        pipeline_step: str,
+    ):
+        """Get participant-session pairs that have a status for a pipeline step."""
+        subset = self.loc[
+            (self[self.col_pipeline_name] == pipeline_name)
+            & (self[self.col_pipeline_version] == pipeline_version)
+            & (self[self.col_pipeline_step] == pipeline_step)
+        ]
+
+        yield from subset[[self.col_participant_id, self.col_session_id]].itertuples(
+            index=False
+        )
+
     def get_completed_participants_sessions(
         self,
         pipeline_name: str,
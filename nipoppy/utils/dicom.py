@@ -0,0 +1,105 @@
+"""DICOM header utilities."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Optional, Sequence
+
+import pydicom
+from pydicom.filereader import read_partial
+from pydicom.tag import Tag
+
+from nipoppy.env import StrOrPathLike
+from nipoppy.utils.file_index import FileIndex
+
+# header fields needed to check for derived files and summarize them per series
+DICOM_HEADER_TAGS = (
+    "ImageType",
+    "SeriesInstanceUID",
+    "SeriesNumber",
+    "SeriesDescription",
+)
+
+# header fields stored in the DICOM header index
+DICOM_INDEX_TAGS = DICOM_HEADER_TAGS + ("Modality", "AcquisitionDate")
+
+
+def read_dicom_header(
+    fpath: StrOrPathLike | IO[bytes], tags: Sequence[str] = DICOM_HEADER_TAGS
+) -> pydicom.Dataset:
+    """
+    Read specific fields from a DICOM file's header.
+
+    Parsing stops right after the last requested tag, so the rest of the
+    dataset (including pixel data) is never read. ``fpath`` can also be a
+    (seekable) binary file object, e.g. an archive member.
+    """
+    tags = [Tag(tag) for tag in tags]
+    last_tag = max(tags)
+
+    def _read(file: IO[bytes]) -> pydicom.Dataset:
+        return read_partial(
+            file,
+            stop_when=lambda tag, vr, length: tag > last_tag,
+            specific_tags=tags,
+        )
+
+    if hasattr(fpath, "read"):
+        return _read(fpath)
+    with open(fpath, "rb") as file:
+        return _read(file)
+
+
+class DicomHeaderIndex(FileIndex):
+    """
+    SQLite index of DICOM header fields.
+
+    Multi-valued fields (e.g. ImageType) are stored as backslash-separated strings,
+    like in the DICOM standard. Files whose header could not be read are stored
+    with an error message instead.
+    """
+
+    table_name = "dicom_headers"
+    tags = DICOM_INDEX_TAGS
+    columns = ("error",) + DICOM_INDEX_TAGS
+
+    def update(
+        self,
+        fpath: Path,
+        mtime_ns: int,
+        size: int,
+        dcm_info: Optional[pydicom.Dataset] = None,
+        error: Optional[str] = None,
+    ):
+        """Add or replace the record of a file (not committed)."""
+        values = []
+        for tag in self.tags:
+            value = None if dcm_info is None else dcm_info.get(tag)
+            if value is not None:
+                if isinstance(value, pydicom.multival.MultiValue):
+                    value = "\\".join(str(item) for item in value)
+                else:
+                    value = str(value)
+            values.append(value)
+        self._upsert(fpath, mtime_ns, size, [error, *values])
+
+    def get_headers(self, fpaths: Sequence[Path]) -> dict[Path, pydicom.Dataset]:
+        """
+        Get indexed headers for files that have not changed since they were indexed.
+
+        Files that are not in the index, have changed, or could not be read when
+        they were indexed are not included in the output.
+        """
+        headers = {}
+        for fpath, (error, *values) in self.get_up_to_date(fpaths).items():
+            if error is not None:
+                continue
+            dcm_info = pydicom.Dataset()
+            for tag, value in zip(self.tags, values):
+                if value is None:
+                    continue
+                if tag == "ImageType":
+                    value = value.split("\\")
+                setattr(dcm_info, tag, value)
+            headers[fpath] = dcm_info
+        return headers
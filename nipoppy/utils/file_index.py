@@ -0,0 +1,303 @@
+"""Persistent (SQLite) indexes of per-file and per-run information."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+
+from nipoppy.env import StrOrPathLike
+from nipoppy.exceptions import FileOperationError
+from nipoppy.utils import fileops
+
+# seconds to wait for other processes (e.g. parallel runs) writing to an index
+SQLITE_TIMEOUT = 60
+
+
+class SqliteIndex:
+    """
+    Base class for indexes stored in a single SQLite table.
+
+    This handles the connection to the database file. Subclasses define the table
+    name and the table columns (see :meth:`_get_table_schema`).
+    """
+
+    table_name: str
+
+    def __init__(self, fpath: StrOrPathLike):
+        self.fpath = Path(fpath)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> SqliteIndex:
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the index database."""
+        if self._connection is None:
+            raise FileOperationError(f"Index is not open: {self.fpath}")
+        return self._connection
+
+    def open(self):
+        """Open the index, creating it if needed."""
+        fileops.mkdir(self.fpath.parent)
+        self._connection = sqlite3.connect(self.fpath, timeout=SQLITE_TIMEOUT)
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name}"
+            f" ({self._get_table_schema()})"
+        )
+        self._connection.commit()
+
+    def _get_table_schema(self) -> str:
+        """Get the column definitions of the table."""
+        raise NotImplementedError
+
+    def close(self):
+        """Close the index."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def commit(self):
+        """Commit pending updates."""
+        self.connection.commit()
+
+
+class FileIndex(SqliteIndex):
+    """
+    Base class for SQLite indexes of information computed from files.
+
+    Records are keyed by file path (relative to ``dpath_root``), modification time
+    and size, so that the information only needs to be recomputed for new or
+    modified files. Subclasses define the table name and the (text) columns
+    stored for each file.
+    """
+
+    columns: tuple[str, ...]
+
+    def __init__(self, fpath: StrOrPathLike, dpath_root: StrOrPathLike):
+        super().__init__(fpath)
+        self.dpath_root = Path(dpath_root)
+
+    def _get_table_schema(self) -> str:
+        columns = ", ".join(f"{column} TEXT" for column in self.columns)
+        return f"path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, {columns}"
+
+    def _get_key(self, fpath: Path) -> str:
+        return os.path.relpath(fpath, self.dpath_root)
+
+    def _load_records(self, keys: Optional[Iterable[str]] = None) -> dict[str, tuple]:
+        """Load records (all or for specific keys) as key -> row."""
+        query = (
+            f"SELECT path, mtime_ns, size, {', '.join(self.columns)}"
+            f" FROM {self.table_name}"
+        )
+        if keys is None:
+            rows = self.connection.execute(query).fetchall()
+        else:
+            keys = list(keys)
+            rows = []
+            # stay below the SQLite limit on the number of query parameters
+            for i_start in range(0, len(keys), 500):
+                keys_batch = keys[i_start : i_start + 500]
+                rows.extend(
+                    self.connection.execute(
+                        f"{query} WHERE path IN ({', '.join('?' * len(keys_batch))})",
+                        keys_batch,
+                    ).fetchall()
+                )
+        return {row[0]: row[1:] for row in rows}
+
+    def _upsert(self, fpath: Path, mtime_ns: int, size: int, values: Sequence[Any]):
+        """Add or replace the record of a file (not committed)."""
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO {self.table_name} "
+            f"(path, mtime_ns, size, {', '.join(self.columns)}) "
+            f"VALUES ({', '.join('?' * (3 + len(self.columns)))})",
+            [self._get_key(fpath), mtime_ns, size, *values],
+        )
+
+    def get_stale(
+        self, fpaths: Iterable[Path]
+    ) -> tuple[list[tuple[Path, int, int]], int]:
+        """
+        Find files that are not in the index or have changed since they were indexed.
+
+        Return a list of (file path, modification time, size) tuples for these
+        files and the number of files that are up-to-date.
+        """
+        records = self._load_records()
+        stale = []
+        n_up_to_date = 0
+        for fpath in fpaths:
+            stat = fpath.stat()
+            record = records.get(self._get_key(fpath))
+            if record is not None and record[:2] == (stat.st_mtime_ns, stat.st_size):
+                n_up_to_date += 1
+            else:
+                stale.append((fpath, stat.st_mtime_ns, stat.st_size))
+        return stale, n_up_to_date
+
+    def get_up_to_date(self, fpaths: Sequence[Path]) -> dict[Path, tuple]:
+        """
+        Get the stored values for files that have not changed since they were indexed.
+
+        Files that are not in the index or have changed are not included.
+        """
+        records = self._load_records(self._get_key(fpath) for fpath in fpaths)
+        values = {}
+        for fpath in fpaths:
+            record = records.get(self._get_key(fpath))
+            if record is None:
+                continue
+            try:
+                stat = fpath.stat()
+            except FileNotFoundError:
+                continue
+            if record[:2] == (stat.st_mtime_ns, stat.st_size):
+                values[fpath] = record[2:]
+        return values
+
+    def remove_missing(self, fpaths: Iterable[Path]) -> int:
+        """Remove records of files that are not in the given list."""
+        keys_present = {self._get_key(fpath) for fpath in fpaths}
+        keys_missing = [key for key in self._load_records() if key not in keys_present]
+        self.connection.executemany(
+            f"DELETE FROM {self.table_name} WHERE path = ?",
+            [(key,) for key in keys_missing],
+        )
+        self.connection.commit()
+        return len(keys_missing)
+
+
+class FileHashIndex(FileIndex):
+    """SQLite index of file content hashes."""
+
+    table_name = "file_hashes"
+    columns = ("algorithm", "hash")
+
+    def update(self, fpath: Path, mtime_ns: int, size: int, file_hash: str):
+        """Add or replace the hash of a file (not committed)."""
+        self._upsert(fpath, mtime_ns, size, [fileops.HASH_ALGORITHM, file_hash])
+
+    def get_hashes(self, fpaths: Sequence[Path]) -> dict[Path, str]:
+        """
+        Get hashes for files that have not changed since they were indexed.
+
+        Hashes computed with a different algorithm than the current one are
+        not included.
+        """
+        return {
+            fpath: file_hash
+            for fpath, (algorithm, file_hash) in self.get_up_to_date(fpaths).items()
+            if algorithm == fileops.HASH_ALGORITHM
+        }
+
+
+class PipelineConfigIndex(FileIndex):
+    """SQLite index of the name and version of installed pipeline bundles."""
+
+    table_name = "pipeline_configs"
+    columns = ("name", "version", "digest")
+
+    def update(self, fpath: Path, mtime_ns: int, size: int, name: str, version: str):
+        """Add or replace the record of a pipeline config file (not committed)."""
+        self._upsert(
+            fpath,
+            mtime_ns,
+            size,
+            [
+                name,
+                version,
+                f"{fileops.HASH_ALGORITHM}:{fileops.hash_file(fpath)}",
+            ],
+        )
+
+    def get_pipelines(self, fpaths: Iterable[Path]) -> dict[Path, tuple[str, str]]:
+        """
+        Get the name and version of indexed pipeline config files.
+
+        Unlike :meth:`get_up_to_date`, this does not check if the files have
+        changed since they were indexed.
+        """
+        records = self._load_records()
+        pipelines = {}
+        for fpath in fpaths:
+            record = records.get(self._get_key(fpath))
+            if record is not None:
+                pipelines[fpath] = tuple(record[2:4])
+        return pipelines
+
+
+class PipelineStepIndex(SqliteIndex):
+    """
+    Base class for SQLite indexes with one value per participant-session run.
+
+    Records are keyed by participant ID, session ID, pipeline name, pipeline
+    version and pipeline step. Missing participant/session IDs (e.g. for
+    participant-level runs) are stored as empty strings. Subclasses define the
+    table name and the name and type of the value column.
+    """
+
+    key_columns = (
+        "participant_id",
+        "session_id",
+        "pipeline_name",
+        "pipeline_version",
+        "pipeline_step",
+    )
+    value_column: str
+    value_type: str = "TEXT"
+
+    def _get_table_schema(self) -> str:
+        columns = ", ".join(f"{column} TEXT" for column in self.key_columns)
+        return (
+            f"{columns}, {self.value_column} {self.value_type}, "
+            f"PRIMARY KEY ({', '.join(self.key_columns)})"
+        )
+
+    def load(
+        self, pipeline_name: str, pipeline_version: str, pipeline_step: str
+    ) -> dict[tuple[Optional[str], Optional[str]], Any]:
+        """Get the values of a pipeline step, by participant and session."""
+        rows = self.connection.execute(
+            f"SELECT participant_id, session_id, {self.value_column}"
+            f" FROM {self.table_name} WHERE pipeline_name = ?"
+            " AND pipeline_version = ? AND pipeline_step = ?",
+            (pipeline_name, pipeline_version, pipeline_step),
+        ).fetchall()
+        return {
+            (participant_id or None, session_id or None): value
+            for participant_id, session_id, value in rows
+        }
+
+    def update(
+        self,
+        values: dict[tuple[Optional[str], Optional[str]], Any],
+        pipeline_name: str,
+        pipeline_version: str,
+        pipeline_step: str,
+    ):
+        """Add or replace the values of a pipeline step."""
+        self.connection.executemany(
+            f"INSERT OR REPLACE INTO {self.table_name} "
+            f"({', '.join(self.key_columns)}, {self.value_column})"
+            f" VALUES ({', '.join('?' * (len(self.key_columns) + 1))})",
+            [
+                (
+                    participant_id or "",
+                    session_id or "",
+                    pipeline_name,
+                    pipeline_version,
+                    pipeline_step,
+                    value,
+                )
+                for (participant_id, session_id), value in values.items()
+            ],
+        )
+        self.connection.commit()
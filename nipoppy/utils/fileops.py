@@ -1,17 +1,130 @@
 """File operations utility functions."""
 
+import contextlib
 import errno
+import fcntl
+import functools
+import hashlib
+import os
 import shutil
+import tarfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
 
+from nipoppy.env import EXT_TAR_MEMBERS
 from nipoppy.exceptions import FileOperationError
 from nipoppy.logger import get_logger
 
+try:
+    import xxhash
+
+    XXHASH_INSTALLED = True
+
+except ImportError as error:
+    if str(error).startswith("No module named 'xxhash'"):
+        XXHASH_INSTALLED = False
+    else:
+        raise
+
 logger = get_logger()
 
+# non-cryptographic xxHash (from the "xxhash" extra) is much faster, but BLAKE2 is
+# in the standard library. Digests from different algorithms cannot be compared,
+# so stored digests must be kept with the name of the algorithm
+HASH_ALGORITHM = "xxh3_128" if XXHASH_INSTALLED else "blake2b"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Linux ioctl request code for sharing data blocks between files
+# see https://man7.org/linux/man-pages/man2/ioctl_ficlone.2.html
+FICLONE = 0x40049409
+
 # TODO: Implement a dry-run decorator to avoid repeating dry_run checks
 
 
+def _get_dev_ino(path) -> tuple[int, int]:
+    """Get the device and inode numbers of a path (following symlinks)."""
+    stat = path.stat()
+    return stat.st_dev, stat.st_ino
+
+
+def _scan_directory(
+    dpath: Path, include_dirs: bool, follow_symlinks: bool
+) -> tuple[list[Path], list[tuple[Path, Optional[tuple[int, int]]]]]:
+    """
+    List the entries of a directory for :func:`list_files`.
+
+    Return the paths to list and the subdirectories to traverse, with their device
+    and inode numbers if following symlinks.
+    """
+    fpaths = []
+    dpaths_sub = []
+    with os.scandir(dpath) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                fpaths.append(Path(entry.path))
+            elif follow_symlinks:
+                dpaths_sub.append((Path(entry.path), _get_dev_ino(entry)))
+            elif not entry.is_symlink():
+                dpaths_sub.append((Path(entry.path), None))
+            elif include_dirs:
+                # listed but not traversed
+                fpaths.append(Path(entry.path))
+    return fpaths, dpaths_sub
+
+
+def list_files(
+    dpaths: Iterable[Path],
+    n_jobs: int = 1,
+    include_dirs: bool = False,
+    follow_symlinks: bool = False,
+) -> dict[Path, list[Path]]:
+    """
+    List all files under each of the given directories, in a single traversal.
+
+    Directories (including subdirectories) are scanned in parallel. Like
+    :func:`os.walk`, symlinks to directories are not followed, unless
+    ``follow_symlinks`` is True (a directory is then not traversed again if it
+    is one of its own ancestors, i.e. symlink loops are only listed once).
+    Paths that are not directories are ignored. Return a mapping from each given
+    directory to the (sorted) list of file paths under it. If ``include_dirs`` is
+    True, the subdirectories are also included in the lists.
+    """
+    fpaths_by_dpath = {dpath: [] for dpath in dpaths if dpath.is_dir()}
+    scan = functools.partial(
+        _scan_directory, include_dirs=include_dirs, follow_symlinks=follow_symlinks
+    )
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        # future -> (top-level directory, (st_dev, st_ino) of the directories
+        # from the top-level directory to the one being scanned)
+        pending = {
+            executor.submit(scan, dpath): (
+                dpath,
+                frozenset([_get_dev_ino(dpath)]) if follow_symlinks else frozenset(),
+            )
+            for dpath in fpaths_by_dpath
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dpath_top, ancestors = pending.pop(future)
+                fpaths, dpaths_sub = future.result()
+                fpaths_by_dpath[dpath_top].extend(fpaths)
+                for dpath_sub, dev_ino in dpaths_sub:
+                    if include_dirs:
+                        fpaths_by_dpath[dpath_top].append(dpath_sub)
+                    if dev_ino in ancestors:
+                        continue
+                    pending[executor.submit(scan, dpath_sub)] = (
+                        dpath_top,
+                        ancestors | {dev_ino} if follow_symlinks else ancestors,
+                    )
+
+    for fpaths in fpaths_by_dpath.values():
+        fpaths.sort()
+    return fpaths_by_dpath
+
+
 def mkdir(dpath: Path, dry_run=False):
     """Create a directory (including parents).
 
@@ -45,6 +158,130 @@ def copy(source: Path, target: Path, dry_run=False, exist_ok: bool = False):
             shutil.copytree(src=source, dst=target, dirs_exist_ok=exist_ok)
 
 
+def write_fileobj(source: IO[bytes], target: Path, dry_run=False):
+    """
+    Write the content of a (binary) file object to a new file.
+
+    Raise an error if the target path already exists.
+    """
+    if target.exists():
+        raise FileOperationError(f"Target already exists: {target}")
+
+    logger.debug(f"Writing {getattr(source, 'name', source)} to {target}")
+    if not dry_run:
+        with open(target, "xb") as file_target:
+            shutil.copyfileobj(source, file_target)
+
+
+def hash_file(fpath: Path) -> str:
+    """
+    Compute a hash of a file's content.
+
+    The hash function is given by ``HASH_ALGORITHM``: XXH3 (128 bits) if the
+    ``xxhash`` package is installed (``pip install "nipoppy[xxhash]"``), BLAKE2b
+    (128 bits) otherwise. The digest depends on the algorithm, so it should not
+    be stored without ``HASH_ALGORITHM``.
+    """
+    with open(fpath, "rb") as file:
+        return hash_fileobj(file)
+
+
+def hash_fileobj(file: IO[bytes]) -> str:
+    """Compute a hash of the (remaining) content of a binary file object.
+
+    See :func:`hash_file` for the hash function.
+    """
+    if XXHASH_INSTALLED:
+        file_hash = xxhash.xxh3_128()
+    else:
+        file_hash = hashlib.blake2b(digest_size=16)
+    while chunk := file.read(HASH_CHUNK_SIZE):
+        file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _clone_file(source: Path, target: Path):
+    """Copy a file's content, sharing data blocks with the source if possible.
+
+    Try (in order): a copy-on-write clone (FICLONE), an in-kernel copy
+    (copy_file_range), and a regular copy. Symlinked sources are followed.
+    """
+    with open(source, "rb") as file_source, open(target, "wb") as file_target:
+        fd_source = file_source.fileno()
+        fd_target = file_target.fileno()
+        try:
+            fcntl.ioctl(fd_target, FICLONE, fd_source)
+            return
+        except OSError as exception:
+            logger.debug(f"Cannot reflink {source} to {target}: {exception}")
+
+        try:
+            n_bytes_left = os.fstat(fd_source).st_size
+            while n_bytes_left > 0:
+                n_bytes_copied = os.copy_file_range(fd_source, fd_target, n_bytes_left)
+                if n_bytes_copied == 0:
+                    break
+                n_bytes_left -= n_bytes_copied
+            return
+        except (AttributeError, OSError) as exception:
+            # AttributeError if os.copy_file_range is not available (non-Linux)
+            logger.debug(
+                f"Cannot use copy_file_range for {source} to {target}: {exception}"
+            )
+
+        # start over with a regular copy
+        file_source.seek(0)
+        file_target.seek(0)
+        file_target.truncate()
+        shutil.copyfileobj(file_source, file_target)
+
+
+def reflink(source: Path, target: Path, dry_run=False):
+    """
+    Copy a file as a reflink (copy-on-write clone), with fallbacks.
+
+    On filesystems that support it (e.g. XFS, Btrfs), the new file shares data blocks
+    with the source file until either of them is modified. Otherwise, fall back on
+    copy_file_range and then on a regular copy. File metadata is copied as
+    in :func:`copy`.
+
+    Raise an error if the target path already exists.
+    """
+    if target.exists():
+        raise FileOperationError(f"Target already exists: {target}")
+
+    logger.debug(f"Creating a reflink from {target} to {source}")
+    if not dry_run:
+        _clone_file(source, target)
+        shutil.copystat(source, target)
+
+
+def hardlink(source: Path, target: Path, check_target: bool = True, dry_run=False):
+    """
+    Create a hard link: target -> source.
+
+    Raise an error if the target path already exists or if the source and target
+    are on different filesystems. The check on the target path can be skipped
+    with ``check_target=False`` if the caller already knows that it does not exist.
+    A symlinked source is not followed: resolve it first to link to the file it
+    points to.
+    """
+    if check_target and target.exists():
+        raise FileOperationError(f"Target already exists: {target}")
+
+    logger.debug(f"Creating a hard link from {target} to {source}")
+    if not dry_run:
+        try:
+            os.link(source, target)
+        except OSError as exception:
+            if exception.errno == errno.EXDEV:
+                raise FileOperationError(
+                    f"Cannot create a hard link from {target} to {source}"
+                    " because they are on different filesystems"
+                ) from exception
+            raise
+
+
 def movetree(source: Path, target: Path, dry_run=False):
     """Move directory tree."""
     logger.debug(f"Moving {source} to {target}")
@@ -55,21 +292,32 @@ def movetree(source: Path, target: Path, dry_run=False):
         source.rmdir()
 
 
-def symlink(source: Path, target: Path, force: bool = False, dry_run=False):
-    """Create a symlink: target (symlink) -> source."""
-    if target.exists():
-        if force:
-            rm(target, dry_run=dry_run)
-        else:
-            raise FileOperationError(
-                "Symlink target already exists. Set force=True to overwrite."
-            )
+def symlink(
+    source: Path,
+    target: Path,
+    force: bool = False,
+    check_target: bool = True,
+    dry_run=False,
+):
+    """Create a symlink: target (symlink) -> source.
 
-    # ensure parent directory of symlink exists
-    mkdir(target.parent, dry_run=dry_run)
+    If ``check_target`` is False, the target path is not checked and its parent
+    directory is not created. This avoids per-file metadata operations when
+    creating many symlinks in a directory that is known to exist.
+    """
+    if check_target:
+        if target.exists():
+            if force:
+                rm(target, dry_run=dry_run)
+            else:
+                raise FileOperationError(
+                    "Symlink target already exists. Set force=True to overwrite."
+                )
+
+        # ensure parent directory of symlink exists
+        mkdir(target.parent, dry_run=dry_run)
 
     logger.debug(f"Creating a symlink from {target} to {source}")
-    mkdir(target.parent, dry_run=dry_run)
     if not dry_run:
         target.symlink_to(source)
 
@@ -92,3 +340,62 @@ def rm(path: Path, dry_run=False):
             shutil.rmtree(path, onerror=_ignore_oserror_empty_dir)
         else:
             path.unlink()
+
+
+@contextlib.contextmanager
+def lock(fpath_lock: Path, dry_run=False) -> Iterator[None]:
+    """Hold an exclusive lock on a file, waiting for other processes to release it.
+
+    The lock file is created if needed and is not removed afterwards.
+    """
+    if dry_run:
+        yield
+        return
+    mkdir(fpath_lock.parent)
+    with open(fpath_lock, "a") as file:
+        logger.debug(f"Acquiring lock {fpath_lock}")
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def get_fpath_tar_members(fpath_tar: Path) -> Path:
+    """Get the path to the member listing file of a tarball."""
+    return fpath_tar.with_name(f"{fpath_tar.name}{EXT_TAR_MEMBERS}")
+
+
+def write_tar_members(fpath_tar: Path, dry_run=False) -> list[str]:
+    """
+    Write the member names of a tarball to a text file next to it (one per line).
+
+    Return the member names.
+    """
+    with tarfile.open(fpath_tar) as tarball:
+        names = tarball.getnames()
+
+    fpath_members = get_fpath_tar_members(fpath_tar)
+    logger.debug(f"Writing member names of {fpath_tar} to {fpath_members}")
+    if not dry_run:
+        # write to a temporary file first so that readers never see a partial list
+        fpath_tmp = fpath_members.with_name(f"{fpath_members.name}.{os.getpid()}")
+        fpath_tmp.write_text("".join(f"{name}\n" for name in names))
+        fpath_tmp.replace(fpath_members)
+    return names
+
+
+def load_tar_members(fpath_tar: Path, dry_run=False) -> list[str]:
+    """
+    Load the member names of a tarball from its member listing file.
+
+    The listing file is (re)created if it does not exist or is older than the
+    tarball.
+    """
+    fpath_members = get_fpath_tar_members(fpath_tar)
+    try:
+        if fpath_members.stat().st_mtime_ns >= fpath_tar.stat().st_mtime_ns:
+            return fpath_members.read_text().splitlines()
+    except FileNotFoundError:
+        pass
+    return write_tar_members(fpath_tar, dry_run=dry_run)
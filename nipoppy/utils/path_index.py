@@ -0,0 +1,203 @@
+"""In-memory indexes of the paths under a directory, for fast glob matching."""
+
+from __future__ import annotations
+
+import os
+import re
+from bisect import bisect_left
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+from nipoppy.env import StrOrPathLike
+from nipoppy.utils import fileops
+
+_MAGIC_CHARS = re.compile(r"[*?[]")
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate a glob pattern for a single path component into a regex."""
+    i_char = 0
+    n_chars = len(segment)
+    parts = []
+    while i_char < n_chars:
+        char = segment[i_char]
+        i_char += 1
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            # like fnmatch, a "]" right after "[" or "[!" is part of the set
+            i_end = i_char
+            if i_end < n_chars and segment[i_end] == "!":
+                i_end += 1
+            if i_end < n_chars and segment[i_end] == "]":
+                i_end += 1
+            i_end = segment.find("]", i_end)
+            if i_end == -1:
+                parts.append(re.escape(char))
+                continue
+            chars = segment[i_char:i_end].replace("\\", "\\\\")
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            elif chars.startswith("^"):
+                chars = "\\" + chars
+            parts.append(f"[{chars}]")
+            i_char = i_end + 1
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def compile_glob(pattern: str) -> tuple[str, Optional[re.Pattern]]:
+    """
+    Compile a relative glob pattern into a matcher.
+
+    Return the literal (non-wildcard) leading part of the pattern and a compiled
+    regex matching full relative paths (with ``/`` separators), or ``None`` if
+    the pattern has no wildcards. ``*``, ``?`` and ``[...]`` do not match across
+    path components, and a ``**`` component matches zero or more directories, as
+    with :meth:`pathlib.Path.glob`.
+    """
+    segments = Path(pattern).as_posix().split("/")
+
+    i_magic = next(
+        (i for i, segment in enumerate(segments) if _MAGIC_CHARS.search(segment)),
+        None,
+    )
+    if i_magic is None:
+        return "/".join(segments), None
+    prefix = "".join(f"{segment}/" for segment in segments[:i_magic])
+    if segments[i_magic:] == ["**"]:
+        # the directory itself also matches
+        prefix = prefix[:-1]
+
+    regex = ""
+    for i_segment, segment in enumerate(segments):
+        is_last = i_segment == len(segments) - 1
+        if segment == "**":
+            if not is_last:
+                regex += "(?:[^/]+/)*"
+            elif regex.endswith("/"):
+                regex = regex[:-1] + "(?:/.*)?"
+            else:
+                regex += ".*"
+        else:
+            regex += _translate_segment(segment) + ("" if is_last else "/")
+    return prefix, re.compile(regex, flags=re.DOTALL)
+
+
+class PathIndex:
+    """
+    Sorted list of relative paths (files and directories) under a directory.
+
+    Glob patterns are matched against the list instead of the filesystem, so
+    the directory only needs to be traversed once no matter how many patterns
+    are checked. Only the paths starting with the literal leading part of a
+    pattern (e.g. a participant directory) are compared to it.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        self.paths = sorted(paths)
+        self._paths_set = set(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @classmethod
+    def from_directory(cls, dpath: StrOrPathLike, n_jobs: int = 1) -> PathIndex:
+        """Index all paths under a directory, scanning subdirectories in parallel."""
+        dpath = Path(dpath)
+        paths = fileops.list_files(
+            [dpath], n_jobs=n_jobs, include_dirs=True, follow_symlinks=True
+        ).get(dpath, [])
+        n_chars_root = len(str(dpath)) + 1
+        return cls(str(path)[n_chars_root:].replace(os.sep, "/") for path in paths)
+
+    def match(self, pattern: str) -> list[str]:
+        """Get the indexed paths matching a relative glob pattern."""
+        prefix, regex = compile_glob(pattern)
+        if regex is None:
+            return [prefix] if prefix in self._paths_set else []
+
+        matches = []
+        for i_path in range(bisect_left(self.paths, prefix), len(self.paths)):
+            path = self.paths[i_path]
+            # paths sharing the prefix are contiguous in the sorted list
+            if not path.startswith(prefix):
+                break
+            if regex.fullmatch(path):
+                matches.append(path)
+        return matches
+
+
+class DirectoryIndex:
+    """
+    Index of the paths under a directory, built one top-level entry at a time.
+
+    A top-level entry (e.g. a participant directory) is only traversed the first
+    time a pattern that could match paths under it is checked, and its paths are
+    then kept in memory. Patterns starting with a wildcard need the whole
+    directory, which is then indexed in a single parallel traversal. Like
+    :meth:`pathlib.Path.glob`, symlinks to directories are followed.
+    """
+
+    def __init__(self, dpath: StrOrPathLike, n_jobs: int = 1):
+        self.dpath = Path(dpath)
+        self.n_jobs = n_jobs
+        # top-level entry name -> index of the paths under it (including itself)
+        self._indexes: dict[str, PathIndex] = {}
+        self._fully_indexed = False
+
+    def __len__(self) -> int:
+        """Return the number of paths indexed so far."""
+        return sum(len(index) for index in list(self._indexes.values()))
+
+    def _index_entries(self, names: Iterable[str]):
+        """Index top-level entries that are not already indexed."""
+        dpaths = []
+        for name in names:
+            if name in self._indexes:
+                continue
+            path = self.dpath / name
+            if name == ".." or not os.path.lexists(path):
+                self._indexes[name] = PathIndex([])
+            elif path.is_dir():
+                dpaths.append(path)
+            else:
+                self._indexes[name] = PathIndex([name])
+        if not dpaths:
+            return
+
+        n_chars_root = len(str(self.dpath)) + 1
+        for dpath, paths in fileops.list_files(
+            dpaths, n_jobs=self.n_jobs, include_dirs=True, follow_symlinks=True
+        ).items():
+            self._indexes[dpath.name] = PathIndex(
+                [dpath.name]
+                + [str(path)[n_chars_root:].replace(os.sep, "/") for path in paths]
+            )
+
+    def index_all(self):
+        """Index all top-level entries."""
+        if self._fully_indexed:
+            return
+        try:
+            names = os.listdir(self.dpath)
+        except FileNotFoundError:
+            names = []
+        self._index_entries(names)
+        self._fully_indexed = True
+
+    def match(self, pattern: str) -> list[str]:
+        """Get the paths matching a relative glob pattern."""
+        prefix, _ = compile_glob(pattern)
+        if prefix == "":
+            self.index_all()
+            names = sorted(self._indexes)
+        else:
+            names = [prefix.split("/")[0]]
+            self._index_entries(names)
+        return [path for name in names for path in self._indexes[name].match(pattern)]
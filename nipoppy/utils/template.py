@@ -0,0 +1,155 @@
+"""Compiled templates with [[NIPOPPY_*]] placeholders."""
+
+from __future__ import annotations
+
+import json
+import warnings
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from nipoppy.exceptions import NipoppyError
+from nipoppy.utils.utils import TEMPLATE_REPLACE_PATTERN
+
+_MISSING = object()
+
+
+class TemplateValues:
+    """
+    Replacement values for the placeholders of templates.
+
+    Values are taken from keyword arguments first, then from the attributes of
+    ``objs`` (in order). Each value is only looked up (and converted to a string)
+    once, no matter how many placeholders or templates use it.
+    """
+
+    def __init__(
+        self, resolve_paths: bool = True, objs: Optional[list] = None, **kwargs
+    ):
+        self.resolve_paths = resolve_paths
+        self.objs = [] if objs is None else objs
+        self.kwargs = kwargs
+        self._cache: dict[str, Optional[str]] = {}
+
+    def _lookup(self, key: str, to_replace: str) -> Optional[str]:
+        if key in self.kwargs:
+            value = self.kwargs[key]
+        else:
+            for obj in self.objs:
+                value = getattr(obj, key, _MISSING)
+                if value is not _MISSING:
+                    break
+            else:
+                return None
+        if value is None:
+            warnings.warn(f"Replacing {to_replace} with None")
+        if self.resolve_paths and isinstance(value, Path):
+            value = value.resolve()
+        return str(value)
+
+    def get(self, key: str, to_replace: str) -> Optional[str]:
+        """Get the replacement for a placeholder, or None if there is no value."""
+        if key not in self._cache:
+            self._cache[key] = self._lookup(key, to_replace)
+        return self._cache[key]
+
+
+class StrTemplate:
+    """
+    String with placeholders, split into literal parts and placeholder slots.
+
+    Use :func:`compile_str_template` to get a (cached) template for a string.
+    """
+
+    def __init__(self, template_str: str):
+        self.template_str = template_str
+        # literal strings and (placeholder, lowercase key) tuples, in order
+        self.parts: list[str | tuple[str, str]] = []
+
+        i_start = 0
+        for match in TEMPLATE_REPLACE_PATTERN.finditer(template_str):
+            key = match.group(1).lower()  # always convert to lowercase
+            if not str.isidentifier(key):
+                raise NipoppyError(f"Invalid identifier name {key} in {template_str}")
+            if match.start() > i_start:
+                self.parts.append(template_str[i_start : match.start()])
+            self.parts.append((match.group(), key))
+            i_start = match.end()
+        if i_start < len(template_str):
+            self.parts.append(template_str[i_start:])
+
+    def render(self, values: TemplateValues) -> str:
+        """Fill the placeholder slots."""
+        rendered = []
+        for part in self.parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+            to_replace, key = part
+            replacement = values.get(key, to_replace)
+            if replacement is None:
+                warnings.warn(f"Unable to replace {to_replace} in {self.template_str}")
+                replacement = to_replace
+            rendered.append(replacement)
+        return "".join(rendered)
+
+
+@lru_cache(maxsize=4096)
+def compile_str_template(template_str: str) -> StrTemplate | str:
+    """Compile a string template, or return the string if it has no placeholders."""
+    if "[[" not in template_str:
+        return template_str
+    template = StrTemplate(template_str)
+    if all(isinstance(part, str) for part in template.parts):
+        return template_str
+    return template
+
+
+def _compile_json(obj: Any) -> Any:
+    if isinstance(obj, str):
+        return compile_str_template(obj)
+    if isinstance(obj, dict):
+        return {_compile_json(key): _compile_json(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_compile_json(item) for item in obj]
+    return obj
+
+
+def _render_json(node: Any, values: TemplateValues) -> Any:
+    if isinstance(node, StrTemplate):
+        return node.render(values)
+    if isinstance(node, dict):
+        return {
+            _render_json(key, values): _render_json(value, values)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_render_json(item, values) for item in node]
+    return node
+
+
+class JsonTemplate:
+    """
+    JSON object with placeholders in its strings (including keys).
+
+    The object is parsed once, and rendering only fills the placeholder slots of
+    the strings that have any. Replacement values are inserted as-is in the
+    strings (i.e., they are never parsed as JSON).
+    """
+
+    def __init__(self, template_json: dict | list):
+        self._compiled = _compile_json(template_json)
+
+    def render(
+        self,
+        resolve_paths: bool = True,
+        objs: Optional[list] = None,
+        return_str: bool = False,
+        **kwargs,
+    ) -> dict | list | str:
+        """Replace placeholders with values from kwargs or objects."""
+        rendered = _render_json(
+            self._compiled,
+            TemplateValues(resolve_paths=resolve_paths, objs=objs, **kwargs),
+        )
+        return json.dumps(rendered) if return_str else rendered
@@ -7,6 +7,7 @@ import json
 import os
 import re
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -255,19 +256,43 @@ def process_template_str(
     return template_str
 
 
+@lru_cache(maxsize=128)
+def _compile_substitutions(
+    substitutions: tuple[tuple[str, str], ...],
+) -> tuple[re.Pattern, dict[str, str]]:
+    """Compile substitution keys into a single pattern (longest keys first)."""
+    mapping = dict(substitutions)
+    keys = sorted((key for key in mapping if key), key=len, reverse=True)
+    return re.compile("|".join(re.escape(key) for key in keys)), mapping
+
+
+@lru_cache(maxsize=256)
+def _substitute_text(json_text: str, substitutions: tuple[tuple[str, str], ...]) -> str:
+    """Apply substitutions to a string in a single pass."""
+    pattern, mapping = _compile_substitutions(substitutions)
+    return pattern.sub(lambda match: mapping[match.group()], json_text)
+
+
 def apply_substitutions_to_json(
     json_obj: dict | list, substitutions: dict[str, str]
 ) -> dict | list:
-    """Apply substitutions to a JSON object."""
-    # convert json_obj to string
-    json_text = json.dumps(json_obj)
+    """
+    Apply substitutions to a JSON object.
+
+    All substitutions are applied in a single pass over the JSON text. If several
+    keys match at the same position, the longest one is used. Replaced text is not
+    substituted again.
+    """
     for key, value in substitutions.items():
         if not isinstance(value, str):
             raise ConfigError(
                 f"Substitution value must be a string, got {type(value)} for key '{key}'"  # noqa: E501
             )
-        json_text = json_text.replace(key, value)
-    return json.loads(json_text)
+    # convert json_obj to string
+    json_text = json.dumps(json_obj)
+    if not any(substitutions):
+        return json.loads(json_text)
+    return json.loads(_substitute_text(json_text, tuple(substitutions.items())))
 
 
 def get_today():
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import logging
+import os
 import shlex
+import signal
 import subprocess
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import Optional, Protocol, Sequence
+from typing import Iterator, Optional, Protocol, Sequence
 
 from nipoppy.base import Base
 from nipoppy.env import EXT_LOG, PROGRAM_NAME, StrOrPathLike
@@ -61,6 +66,85 @@ class CommandRunner(Protocol):
         ...
 
 
+# time between SIGTERM and SIGKILL when terminating a process group
+TERMINATION_GRACE_PERIOD = 10
+# number of stderr lines kept for the exception raised when a command fails
+STDERR_MAX_LINES = 1000
+
+
+def _terminate_process_group(
+    process: subprocess.Popen, grace_period: Optional[float] = None
+):
+    """
+    Terminate a process and all the processes in its group (e.g. container children).
+
+    SIGTERM is sent first, then SIGKILL if the process is still running after
+    ``grace_period`` seconds (default: TERMINATION_GRACE_PERIOD). The process must
+    be the leader of its group.
+    """
+    if grace_period is None:
+        grace_period = TERMINATION_GRACE_PERIOD
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            # the process group no longer exists
+            return
+        try:
+            process.wait(timeout=grace_period)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+
+
+@contextmanager
+def _process_group_timeout(
+    process: subprocess.Popen, timeout: Optional[float]
+) -> Iterator[threading.Event]:
+    """
+    Terminate the process group of a process if it runs for longer than timeout.
+
+    Yields an event that is set if the timeout expired. The process group is also
+    terminated if an exception (e.g. KeyboardInterrupt) is raised in the context.
+    """
+    timed_out = threading.Event()
+    if timeout is None:
+        yield timed_out
+        return
+
+    def _on_timeout():
+        timed_out.set()
+        _terminate_process_group(process)
+
+    timer = threading.Timer(timeout, _on_timeout)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield timed_out
+    except BaseException:
+        # the new process group does not get signals sent to the terminal
+        timer.cancel()
+        _terminate_process_group(process)
+        raise
+    finally:
+        timer.cancel()
+
+
+def _process_output(output_source, log_prefix: str, log_level=logging.INFO, lines=None):
+    """Consume lines from an IO stream and log them (and append them to lines)."""
+    for line in output_source:
+        line = line.strip("\n")
+        if lines is not None:
+            lines.append(line)
+        # using extra={"markup": False} in case the output contains substrings
+        # that would be interpreted as closing tags by the RichHandler
+        logger.log(
+            level=log_level,
+            msg=f"{log_prefix} {line}",
+            extra={"markup": False},
+        )
+
+
 def _run_command(
     command_or_args: Sequence[str] | str,
     /,
@@ -68,6 +152,7 @@ def _run_command(
     check: bool = True,
     quiet: bool = False,
     dry_run: bool = False,
+    timeout: Optional[float] = None,
     **kwargs,
 ) -> subprocess.Popen[str] | str:
     """Run a command in a subprocess.
@@ -85,9 +170,14 @@ def _run_command(
         The command to run.
     check : bool, optional
         If True, raise an error if the process exits with a non-zero code,
-        by default True
+        by default True. The last lines of stderr output are available in the
+        ``stderr`` attribute of the error.
     quiet : bool, optional
         If True, do not log the command, by default False
+    timeout : float, optional
+        Maximum run time in seconds. If the command is still running after this
+        time, its whole process group is terminated and subprocess.TimeoutExpired
+        is raised. By default, there is no time limit.
     **kwargs
         Passed to `subprocess.Popen`.
 
@@ -95,19 +185,6 @@ def _run_command(
     -------
     subprocess.Popen or str
     """
-
-    def process_output(output_source, log_prefix: str, log_level=logging.INFO):
-        """Consume lines from an IO stream and log them."""
-        for line in output_source:
-            line = line.strip("\n")
-            # using extra={"markup": False} in case the output contains substrings
-            # that would be interpreted as closing tags by the RichHandler
-            logger.log(
-                level=log_level,
-                msg=f"{log_prefix} {line}",
-                extra={"markup": False},
-            )
-
     # build command string
     if not isinstance(command_or_args, str):
         args = [str(arg) for arg in command_or_args]
@@ -124,6 +201,10 @@ def _run_command(
         _log_command(command)
 
     if not dry_run:
+        if timeout is not None:
+            # run in a new process group so that the command and all its children
+            # (e.g. container processes) can be terminated together
+            kwargs["start_new_session"] = True
         process: subprocess.Popen[str] = subprocess.Popen(
             command_or_args,
             stdout=subprocess.PIPE,
@@ -132,20 +213,32 @@ def _run_command(
             **kwargs,
         )
 
-        while process.poll() is None:
-            process_output(
-                process.stdout,
-                LogPrefix.RUN_STDOUT,
-            )
+        # last stderr lines, attached to the exception if the command fails
+        stderr_lines: deque[str] = deque(maxlen=STDERR_MAX_LINES)
+        with _process_group_timeout(process, timeout) as timed_out:
+            # read the outputs at least once, even if the process has already exited
+            while True:
+                _process_output(
+                    process.stdout,
+                    LogPrefix.RUN_STDOUT,
+                )
 
-            process_output(
-                process.stderr,
-                LogPrefix.RUN_STDERR,
-                log_level=logging.ERROR,
-            )
+                _process_output(
+                    process.stderr,
+                    LogPrefix.RUN_STDERR,
+                    log_level=logging.ERROR,
+                    lines=stderr_lines,
+                )
+                if process.poll() is not None:
+                    break
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
 
         if check and process.returncode != 0:
-            raise subprocess.CalledProcessError(process.returncode, command)
+            raise subprocess.CalledProcessError(
+                process.returncode, command, stderr="\n".join(stderr_lines)
+            )
 
         run_output = process
 
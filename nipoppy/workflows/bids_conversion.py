@@ -10,6 +10,8 @@ from nipoppy.config.pipeline import BIDSificationPipelineConfig
 from nipoppy.config.pipeline_step import BidsPipelineStepConfig
 from nipoppy.env import PipelineTypeEnum, StrOrPathLike
 from nipoppy.exceptions import WorkflowError
+from nipoppy.tabular.curation_status import CurationStatusTable
+from nipoppy.utils import fileops
 from nipoppy.workflows.runner import Runner
 
 
@@ -28,9 +30,16 @@ class BIDSificationRunner(Runner):
         session_id: str = None,
         use_subcohort: Optional[StrOrPathLike] = None,
         simulate: bool = False,
+        simulate_output: Optional[StrOrPathLike] = None,
         keep_workdir: bool = False,
         hpc: Optional[str] = None,
         write_subcohort: Optional[StrOrPathLike] = None,
+        n_jobs: int = 1,
+        max_cores: Optional[int] = None,
+        max_mem: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        report_retryable: bool = False,
         fpath_layout: Optional[StrOrPathLike] = None,
         verbose: bool = False,
         dry_run: bool = False,
@@ -46,13 +55,22 @@ class BIDSificationRunner(Runner):
             session_id=session_id,
             use_subcohort=use_subcohort,
             simulate=simulate,
+            simulate_output=simulate_output,
             keep_workdir=keep_workdir,
             hpc=hpc,
             write_subcohort=write_subcohort,
+            n_jobs=n_jobs,
+            max_cores=max_cores,
+            max_mem=max_mem,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            report_retryable=report_retryable,
             fpath_layout=fpath_layout,
             verbose=verbose,
             dry_run=dry_run,
         )
+        # participants/sessions BIDSified by this process
+        self._bidsified_participants_sessions: list[tuple[str, str]] = []
 
     @cached_property
     def dpath_pipeline(self):
@@ -93,6 +111,14 @@ class BIDSificationRunner(Runner):
             if participant_session not in participants_sessions_bidsified:
                 yield participant_session
 
+    def get_dpath_inputs(
+        self, participant_id: Optional[str], session_id: Optional[str]
+    ) -> Optional[Path]:
+        """Get the reorganized DICOM directory of a participant/session."""
+        return self._get_dpath_participant_session(
+            self.study.layout.dpath_post_reorg, participant_id, session_id
+        )
+
     def run_single(self, participant_id: str, session_id: str):
         """Run BIDS conversion on a single participant/session."""
         # get container command
@@ -124,16 +150,39 @@ class BIDSificationRunner(Runner):
                 col=self.curation_status_table.col_in_bids,
                 status=True,
             )
+            self._bidsified_participants_sessions.append((participant_id, session_id))
 
         return invocation_and_descriptor
 
     def _write_status_file(self):
-        """Write the updated curation status table to disk."""
-        if self.pipeline_step_config.UPDATE_STATUS and not self.simulate:
-            self.curation_status_table.save_with_backup(
-                self.study.layout.fpath_curation_status,
-                dry_run=self.dry_run,
-            )
+        """
+        Write the updated curation status table to disk.
+
+        If the file already exists, it is reloaded while holding its lock and only
+        the participants/sessions BIDSified by this process are updated, so that
+        updates made by other processes (e.g. parallel runs with --n-jobs) are
+        not lost.
+        """
+        if not self.pipeline_step_config.UPDATE_STATUS or self.simulate:
+            return
+        fpath_table = self.study.layout.fpath_curation_status
+        with fileops.lock(
+            self.study.layout.fpath_curation_status_lock, dry_run=self.dry_run
+        ):
+            if fpath_table.exists():
+                if len(self._bidsified_participants_sessions) == 0:
+                    return
+                table = CurationStatusTable.load(fpath_table)
+                for participant_id, session_id in self._bidsified_participants_sessions:
+                    table.set_status(
+                        participant_id=participant_id,
+                        session_id=session_id,
+                        col=table.col_in_bids,
+                        status=True,
+                    )
+            else:
+                table = self.curation_status_table
+            table.save_with_backup(fpath_table, dry_run=self.dry_run)
 
     def run_main(self):
         """Run the BIDSification pipeline."""
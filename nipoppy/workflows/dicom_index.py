@@ -0,0 +1,106 @@
+"""Workflow for indexing DICOM headers."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from nipoppy.env import StrOrPathLike
+from nipoppy.logger import get_logger
+from nipoppy.utils import fileops
+from nipoppy.utils.dicom import DicomHeaderIndex, read_dicom_header
+from nipoppy.workflows.base import BaseDatasetWorkflow
+
+# number of files read between commits to the index
+# so that progress is not lost if the workflow is interrupted
+BATCH_SIZE = 1000
+
+logger = get_logger()
+
+
+class DicomIndexWorkflow(BaseDatasetWorkflow):
+    """Workflow for building/updating an index of DICOM header fields."""
+
+    def __init__(
+        self,
+        dpath_root: StrOrPathLike,
+        n_jobs: int = 1,
+        force: bool = False,
+        fpath_layout: Optional[StrOrPathLike] = None,
+        verbose: bool = False,
+        dry_run: bool = False,
+    ):
+        """Initialize the workflow."""
+        super().__init__(
+            dpath_root=dpath_root,
+            name="index_dicoms",
+            fpath_layout=fpath_layout,
+            verbose=verbose,
+            dry_run=dry_run,
+        )
+        self.n_jobs = n_jobs
+        self.force = force
+
+    def get_fpaths_to_index(self) -> list[Path]:
+        """Get all file paths under the pre-reorg directory."""
+        dpath_pre_reorg = self.study.layout.dpath_pre_reorg
+        return fileops.list_files([dpath_pre_reorg], n_jobs=self.n_jobs).get(
+            dpath_pre_reorg, []
+        )
+
+    @staticmethod
+    def _read_header(fpath: Path):
+        """Read a DICOM header, returning the exception instead of raising it."""
+        try:
+            return read_dicom_header(fpath, tags=DicomHeaderIndex.tags), None
+        except Exception as exception:
+            return None, str(exception)
+
+    def run_main(self):
+        """Add new or modified files to the index and remove deleted ones."""
+        fpath_index = self.study.layout.fpath_dicom_index
+        fpaths = self.get_fpaths_to_index()
+        logger.info(f"Found {len(fpaths)} files in {self.study.layout.dpath_pre_reorg}")
+
+        if self.force and fpath_index.exists() and not self.dry_run:
+            logger.info(f"Rebuilding DICOM header index {fpath_index}")
+            fpath_index.unlink()
+
+        if self.dry_run:
+            logger.info(f"Not updating DICOM header index {fpath_index} (dry run)")
+            return
+
+        with DicomHeaderIndex(fpath_index, self.study.layout.dpath_pre_reorg) as index:
+            stale, n_up_to_date = index.get_stale(fpaths)
+            logger.info(
+                f"{len(stale)} new or modified files to index"
+                f" ({n_up_to_date} already up-to-date)"
+            )
+
+            n_errors = 0
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                results = executor.map(
+                    self._read_header, [fpath for fpath, _, _ in stale]
+                )
+                for i_file, ((fpath, mtime_ns, size), (dcm_info, error)) in enumerate(
+                    zip(stale, results), start=1
+                ):
+                    if error is not None:
+                        logger.debug(f"Cannot read DICOM header for {fpath}: {error}")
+                        n_errors += 1
+                    index.update(fpath, mtime_ns, size, dcm_info=dcm_info, error=error)
+                    if i_file % BATCH_SIZE == 0:
+                        index.commit()
+                        logger.info(f"Indexed {i_file}/{len(stale)} files")
+            index.commit()
+
+            n_removed = index.remove_missing(fpaths)
+
+        if n_errors > 0:
+            logger.warning(
+                f"Could not read the DICOM header of {n_errors} files"
+                " (see the log with --verbose for details)"
+            )
+        logger.success(
+            f"Updated DICOM header index {fpath_index}"
+            f" ({len(stale)} files indexed, {n_removed} removed)"
+        )
@@ -2,12 +2,17 @@
 
 import hashlib
 import os
+import tarfile
+import threading
+import zipfile
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from stat import S_ISLNK
+from typing import IO, Iterator, Optional
 
-import pydicom
-
-from nipoppy.env import StrOrPathLike
+from nipoppy.env import LinkModeEnum, StrOrPathLike
 from nipoppy.exceptions import FileOperationError, ReturnCode, WorkflowError
 from nipoppy.logger import get_logger
 from nipoppy.tabular.curation_status import update_curation_status_table
@@ -16,24 +21,137 @@ from nipoppy.utils.bids import (
     participant_id_to_bids_participant_id,
     session_id_to_bids_session_id,
 )
+from nipoppy.utils.dicom import DicomHeaderIndex, read_dicom_header
+from nipoppy.utils.file_index import FileHashIndex
 from nipoppy.workflows.base import BaseDatasetWorkflow
 
 HASH_LENGTH = 7
+EXT_JOURNAL = ".tsv"
 
 logger = get_logger()
 
 
+@lru_cache(maxsize=4096)
+def hash_dpath(dpath: str) -> str:
+    """Get a short hash of a directory path (cached since files share parents)."""
+    return hashlib.md5(dpath.encode("UTF-8")).hexdigest()[:HASH_LENGTH]
+
+
+@lru_cache(maxsize=4096)
+def _resolve_dpath(dpath: Path) -> Path:
+    """Resolve a source directory (cached since files share parents)."""
+    return dpath.resolve()
+
+
+@lru_cache(maxsize=4096)
+def _get_relpath_resolved(dpath_source: Path, dpath_start: Path) -> str:
+    """Get the path of a resolved source directory relative to another directory."""
+    return os.path.relpath(_resolve_dpath(dpath_source), dpath_start)
+
+
+def _list_fnames(dpath: Path) -> set[str]:
+    """List the names in a directory with a single scandir call."""
+    if not dpath.is_dir():
+        return set()
+    with os.scandir(dpath) as entries:
+        return {entry.name for entry in entries}
+
+
+def is_archive(fpath: Path) -> bool:
+    """Check if a path is a zip or tar archive (possibly compressed)."""
+    return fpath.is_file() and (zipfile.is_zipfile(fpath) or tarfile.is_tarfile(fpath))
+
+
+def iter_archive_members(
+    fpath_archive: Path,
+) -> Iterator[tuple[str, int, IO[bytes]]]:
+    """
+    Iterate over the regular files in a zip or tar archive.
+
+    Yield the member name, its (uncompressed) size and a file object to read its
+    content from. Members are read in archive order, without extracting the
+    archive to disk.
+    """
+    if zipfile.is_zipfile(fpath_archive):
+        with zipfile.ZipFile(fpath_archive) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as file:
+                    yield info.filename, info.file_size, file
+    else:
+        with tarfile.open(fpath_archive, "r:*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                with archive.extractfile(member) as file:
+                    yield member.name, member.size, file
+
+
 def is_derived_dicom(fpath: Path) -> bool:
     """
     Read a DICOM file's header and check if it is a derived file.
 
     Some BIDS converters (e.g. Heudiconv) do not support derived DICOM files.
     """
-    dcm_info = pydicom.dcmread(fpath)
+    dcm_info = read_dicom_header(fpath, tags=["ImageType"])
     img_types = dcm_info.ImageType
     return "DERIVED" in img_types
 
 
+class ReorgJournal:
+    """
+    Append-only record of the files reorganized for a participant-session pair.
+
+    Each line contains the source path, the destination path and the size and
+    inode number of the source file at the time it was reorganized. Lines are
+    flushed as soon as they are written so that the journal reflects the files
+    that were fully reorganized if a run is interrupted.
+    """
+
+    def __init__(self, fpath: StrOrPathLike, dry_run: bool = False):
+        self.fpath = Path(fpath)
+        self.dry_run = dry_run
+        self._file = None
+        self._lock = threading.Lock()
+
+    def load(self) -> dict[Path, tuple[Path, int, int]]:
+        """Return a mapping from destination path to (source path, size, inode)."""
+        entries = {}
+        if not self.fpath.exists():
+            return entries
+        with self.fpath.open() as file:
+            for line in file:
+                fields = line.rstrip("\n").split("\t")
+                # skip lines that were only partially written
+                if len(fields) != 4:
+                    continue
+                source, dest, size, inode = fields
+                entries[Path(dest)] = (Path(source), int(size), int(inode))
+        return entries
+
+    def open(self):
+        """Create the journal file if needed and open it for appending."""
+        if self.dry_run:
+            return
+        fileops.mkdir(self.fpath.parent)
+        self._file = self.fpath.open("a")
+
+    def record(self, fpath_source: Path, fpath_dest: Path, size: int, inode: int):
+        """Add an entry to the journal."""
+        if self._file is None:
+            return
+        with self._lock:
+            self._file.write(f"{fpath_source}\t{fpath_dest}\t{size}\t{inode}\n")
+            self._file.flush()
+
+    def close(self):
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class DicomReorgWorkflow(BaseDatasetWorkflow):
     """Workflow for organizing raw DICOM files."""
 
@@ -41,7 +159,11 @@ class DicomReorgWorkflow(BaseDatasetWorkflow):
         self,
         dpath_root: StrOrPathLike,
         copy_files: bool = False,
+        link_mode: Optional[LinkModeEnum] = None,
         check_dicoms: bool = False,
+        dedup: bool = False,
+        prescan: bool = False,
+        n_jobs: int = 1,
         fpath_layout: Optional[StrOrPathLike] = None,
         verbose: bool = False,
         dry_run: bool = False,
@@ -54,13 +176,57 @@ class DicomReorgWorkflow(BaseDatasetWorkflow):
             verbose=verbose,
             dry_run=dry_run,
         )
-        self.copy_files = copy_files
+        if copy_files:
+            if link_mode not in (None, LinkModeEnum.COPY):
+                raise WorkflowError(
+                    f"Cannot use link mode {LinkModeEnum(link_mode).value} when "
+                    "copy_files is True"
+                )
+            link_mode = LinkModeEnum.COPY
+        elif link_mode is None:
+            link_mode = LinkModeEnum.SYMLINK
+
+        self.link_mode = LinkModeEnum(link_mode)
         self.check_dicoms = check_dicoms
+        self.dedup = dedup
+        self.prescan = prescan
+        self.n_jobs = n_jobs
+
+        # raw DICOM directory -> files in it
+        # only populated if prescan is True
+        self.fpaths_by_dicom_dir: dict[Path, list[Path]] = {}
+
+        # (participant_id, session_id, series) -> [n_derived, n_total]
+        # only populated if check_dicoms is True
+        self.derived_dicom_counts: dict[tuple[str, str, str], list[int]] = {}
+
+        # journals of sessions that were fully reorganized
+        # they are deleted once the curation status table is saved
+        self._fpaths_journal_done: list[Path] = []
+
+        # archives are extracted in parallel across sessions
+        self._status_lock = threading.Lock()
 
         # the message logged in run_cleanup will depend on
         # the final values for these attributes (updated in run_main)
         self.n_success = 0
         self.n_total = 0
+        self.n_duplicates = 0
+
+    @property
+    def copy_files(self) -> bool:
+        """Whether files are copied instead of symlinked."""
+        return self.link_mode == LinkModeEnum.COPY
+
+    @copy_files.setter
+    def copy_files(self, copy_files: bool):
+        self.link_mode = LinkModeEnum.COPY if copy_files else LinkModeEnum.SYMLINK
+
+    def get_path_downloaded(self, participant_id: str, session_id: str) -> Path:
+        """Get the path to the raw DICOM directory (or archive) of a session."""
+        return self.study.layout.dpath_pre_reorg / self.dicom_dir_map.get_dicom_dir(
+            participant_id=participant_id, session_id=session_id
+        )
 
     def get_fpaths_to_reorg(
         self,
@@ -68,12 +234,11 @@ class DicomReorgWorkflow(BaseDatasetWorkflow):
         session_id: str,
     ) -> list[Path]:
         """Get file paths to reorganize for a single participant and session."""
-        dpath_downloaded = (
-            self.study.layout.dpath_pre_reorg
-            / self.dicom_dir_map.get_dicom_dir(
-                participant_id=participant_id, session_id=session_id
-            )
-        )
+        dpath_downloaded = self.get_path_downloaded(participant_id, session_id)
+
+        # use the file list from the initial scan if there is one
+        if dpath_downloaded in self.fpaths_by_dicom_dir:
+            return list(self.fpaths_by_dicom_dir[dpath_downloaded])
 
         # make sure directory exists
         if not dpath_downloaded.exists():
@@ -88,6 +253,17 @@ class DicomReorgWorkflow(BaseDatasetWorkflow):
             fpaths.extend(Path(dpath, fname) for fname in fnames)
         return fpaths
 
+    def get_fpath_journal(self, participant_id: str, session_id: str) -> Path:
+        """Get the path to the reorg journal for a participant and session."""
+        return (
+            self.study.layout.dpath_work
+            / self.name
+            / (
+                f"{participant_id_to_bids_participant_id(participant_id)}_"
+                f"{session_id_to_bids_session_id(session_id)}{EXT_JOURNAL}"
+            )
+        )
+
     def apply_fname_mapping(
         self, fpath_source: StrOrPathLike, participant_id: str, session_id: str
     ) -> str:
@@ -98,16 +274,447 @@ class DicomReorgWorkflow(BaseDatasetWorkflow):
         DICOM series, while ensuring short filenames in nested directory structures.
         """
         fpath_source = Path(fpath_source)
-        hash_prefix = hashlib.md5(str(fpath_source.parent).encode("UTF-8")).hexdigest()[
-            :HASH_LENGTH
-        ]
+        hash_prefix = hash_dpath(str(fpath_source.parent))
 
         return f"{hash_prefix}_{fpath_source.name}"
 
+    def check_dicom_headers(
+        self,
+        dicom_headers: dict[Path, Future],
+        participant_id: str,
+        session_id: str,
+    ):
+        """Check for derived DICOM files and count them per series.
+
+        ``dicom_headers`` maps file paths to futures returning the DICOM header.
+        """
+        counts = defaultdict(lambda: [0, 0])
+        for fpath, future in dicom_headers.items():
+            # only error out if DICOM cannot be read
+            try:
+                dcm_info = future.result()
+                is_derived = "DERIVED" in dcm_info.ImageType
+            except Exception as e:
+                raise WorkflowError(f"Error checking DICOM file {fpath}: {e}") from e
+
+            series = (
+                f"{dcm_info.get('SeriesNumber', '')}"
+                f" {dcm_info.get('SeriesDescription', '')}"
+                f" ({dcm_info.get('SeriesInstanceUID', 'unknown UID')})"
+            ).strip()
+            counts[series][1] += 1
+            if is_derived:
+                logger.warning(f"Derived DICOM file detected: {fpath}")
+                counts[series][0] += 1
+
+        for series, (n_derived, n_total) in counts.items():
+            if n_derived > 0:
+                self.derived_dicom_counts[(participant_id, session_id, series)] = [
+                    n_derived,
+                    n_total,
+                ]
+
+    def reorganize_file(
+        self, fpath_source: Path, fpath_dest: Path, check_target: bool = True
+    ):
+        """Link or copy a single file, depending on the link mode.
+
+        If ``check_target`` is False, links are created without checking the
+        destination path first (copies are always checked).
+        """
+        if self.link_mode == LinkModeEnum.SYMLINK:
+            # only the source directory is resolved, once for all files in it
+            fileops.symlink(
+                source=os.path.join(
+                    _get_relpath_resolved(fpath_source.parent, fpath_dest.parent),
+                    fpath_source.name,
+                ),
+                target=fpath_dest,
+                check_target=check_target,
+                dry_run=self.dry_run,
+            )
+        elif self.link_mode in (LinkModeEnum.HARDLINK, LinkModeEnum.REFLINK):
+            # link to (or clone) the file in the resolved source directory, which
+            # is resolved once for all files in it
+            fpath_source = _resolve_dpath(fpath_source.parent) / fpath_source.name
+            if self.link_mode == LinkModeEnum.HARDLINK:
+                fileops.hardlink(
+                    fpath_source,
+                    fpath_dest,
+                    check_target=check_target,
+                    dry_run=self.dry_run,
+                )
+            else:
+                fileops.reflink(fpath_source, fpath_dest, dry_run=self.dry_run)
+        else:
+            fileops.copy(fpath_source, fpath_dest, dry_run=self.dry_run)
+
+    def is_reorganized(
+        self,
+        fpath_source: Path,
+        fpath_dest: Path,
+        journal_entry: Optional[tuple[Path, int, int]],
+    ) -> bool:
+        """
+        Check whether a file was already reorganized by a previous (partial) run.
+
+        The destination must have been recorded in the journal for the same source
+        file, the source file must not have changed since, and the destination must
+        still be consistent with the current link mode.
+        """
+        if journal_entry is None:
+            return False
+        fpath_source_journal, size, inode = journal_entry
+        if fpath_source_journal != fpath_source:
+            return False
+        try:
+            stat_source = fpath_source.stat()
+            stat_dest = fpath_dest.stat()
+        except FileNotFoundError:
+            return False
+        if (stat_source.st_size, stat_source.st_ino) != (size, inode):
+            return False
+
+        if self.link_mode == LinkModeEnum.SYMLINK:
+            return fpath_dest.is_symlink() and fpath_dest.resolve() == (
+                fpath_source.resolve()
+            )
+        if fpath_dest.is_symlink():
+            return False
+        if self.link_mode == LinkModeEnum.HARDLINK:
+            return (stat_dest.st_dev, stat_dest.st_ino) == (
+                stat_source.st_dev,
+                stat_source.st_ino,
+            )
+        return stat_dest.st_size == stat_source.st_size
+
+    def is_extracted(
+        self,
+        fpath_source: Path,
+        fpath_dest: Path,
+        journal_entry: Optional[tuple[Path, int, int]],
+        size: int,
+        inode: int,
+    ) -> bool:
+        """
+        Check whether an archive member was already extracted by a previous run.
+
+        ``fpath_source`` is the path of the member inside the archive, ``size`` the
+        size of the member and ``inode`` the inode number of the archive.
+        """
+        if journal_entry != (fpath_source, size, inode):
+            return False
+        return (
+            fpath_dest.is_file()
+            and not fpath_dest.is_symlink()
+            and fpath_dest.stat().st_size == size
+        )
+
+    def _clear_destination(self, fpath_source: Path, fpath_dest: Path, resuming: bool):
+        """Make sure a new file can be created at the destination path."""
+        if not (fpath_dest.exists() or fpath_dest.is_symlink()):
+            return
+        # do not overwrite existing files, unless they are leftovers
+        # from an interrupted run (e.g. an incomplete copy)
+        if not resuming:
+            raise FileOperationError(
+                f"Cannot move file {fpath_source} to {fpath_dest}"
+                " because it already exists"
+            )
+        logger.warning(f"Replacing incomplete or outdated file {fpath_dest}")
+        fileops.rm(fpath_dest, dry_run=self.dry_run)
+
+    def _reorganize_and_record(
+        self, fpath_source: Path, fpath_dest: Path, journal: ReorgJournal
+    ):
+        """Reorganize a single file and add it to the journal.
+
+        The destination path must already have been checked by the caller.
+        Symlinked source files are resolved (only when hard linking or
+        reflinking) so that the link/clone points to the file itself.
+        """
+        # the journal needs the source stat anyway, and lstat gives the same
+        # result for regular files, so only symlinks need another stat
+        stat_source = os.lstat(fpath_source)
+        fpath_linked = fpath_source
+        if S_ISLNK(stat_source.st_mode):
+            stat_source = os.stat(fpath_source)
+            if self.link_mode in (LinkModeEnum.HARDLINK, LinkModeEnum.REFLINK):
+                fpath_linked = fpath_source.resolve()
+        self.reorganize_file(fpath_linked, fpath_dest, check_target=False)
+        journal.record(
+            fpath_source, fpath_dest, stat_source.st_size, stat_source.st_ino
+        )
+
+    def _get_indexed_dicom_headers(self, fpaths: list[Path]) -> dict[Path, Future]:
+        """
+        Get DICOM headers from the DICOM header index, if it exists.
+
+        Only files that have not changed since they were indexed are included.
+        Headers are wrapped in (completed) futures for consistency with headers
+        that are read from the files.
+        """
+        fpath_index = self.study.layout.fpath_dicom_index
+        if not fpath_index.exists():
+            return {}
+
+        with DicomHeaderIndex(fpath_index, self.study.layout.dpath_pre_reorg) as index:
+            headers = index.get_headers(fpaths)
+        logger.debug(f"Found {len(headers)} DICOM headers in index {fpath_index}")
+
+        dicom_headers = {}
+        for fpath, dcm_info in headers.items():
+            dicom_headers[fpath] = future = Future()
+            future.set_result(dcm_info)
+        return dicom_headers
+
+    def get_content_hashes(self, fpaths: list[Path]) -> dict[Path, str]:
+        """
+        Compute content hashes for files, in parallel.
+
+        Hashes of files that have not changed since they were last hashed are
+        taken from the persistent hash index instead of being recomputed.
+        """
+        if self.dry_run:
+            # do not create/update the index
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                return dict(zip(fpaths, executor.map(fileops.hash_file, fpaths)))
+
+        with FileHashIndex(
+            self.study.layout.fpath_hash_index, self.study.layout.dpath_pre_reorg
+        ) as index:
+            hashes = index.get_hashes(fpaths)
+            stale = [(fpath, fpath.stat()) for fpath in fpaths if fpath not in hashes]
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                for (fpath, stat), file_hash in zip(
+                    stale,
+                    executor.map(fileops.hash_file, [fpath for fpath, _ in stale]),
+                ):
+                    hashes[fpath] = file_hash
+                    index.update(fpath, stat.st_mtime_ns, stat.st_size, file_hash)
+            index.commit()
+        return hashes
+
+    def deduplicate_fpaths(self, fpaths: list[Path]) -> list[Path]:
+        """
+        Remove files whose content is identical to that of another file in the list.
+
+        The first file (in path order) of each group of identical files is kept.
+        Only files that have the same size as another file need to be hashed.
+        """
+        fpaths_by_size = defaultdict(list)
+        for fpath in sorted(fpaths):
+            fpaths_by_size[fpath.stat().st_size].append(fpath)
+        fpaths_to_hash = [
+            fpath
+            for group in fpaths_by_size.values()
+            if len(group) > 1
+            for fpath in group
+        ]
+        hashes = self.get_content_hashes(fpaths_to_hash)
+
+        fpaths_kept = {}
+        duplicates = set()
+        for fpath in fpaths_to_hash:
+            fpath_kept = fpaths_kept.setdefault(hashes[fpath], fpath)
+            if fpath_kept != fpath:
+                logger.debug(f"Skipping {fpath} (duplicate of {fpath_kept})")
+                duplicates.add(fpath)
+
+        self.n_duplicates += len(duplicates)
+        return [fpath for fpath in fpaths if fpath not in duplicates]
+
+    def _reorganize_files(
+        self,
+        fpaths_to_reorg: list[Path],
+        dpath_reorganized: Path,
+        participant_id: str,
+        session_id: str,
+        journal: ReorgJournal,
+        resuming: bool,
+    ):
+        """Reorganize files from a raw DICOM directory.
+
+        If ``check_dicoms`` is set, all DICOM headers are read (in parallel) and
+        checked before any file is reorganized, so that an unreadable file does not
+        leave a partially reorganized directory behind.
+        """
+        if self.check_dicoms:
+            # only read headers that are not already in the index
+            dicom_headers = self._get_indexed_dicom_headers(fpaths_to_reorg)
+            header_executor = ThreadPoolExecutor(max_workers=self.n_jobs)
+            try:
+                for fpath in fpaths_to_reorg:
+                    if fpath not in dicom_headers:
+                        dicom_headers[fpath] = header_executor.submit(
+                            read_dicom_header, fpath
+                        )
+                self.check_dicom_headers(dicom_headers, participant_id, session_id)
+            finally:
+                header_executor.shutdown(cancel_futures=True)
+
+        journal_entries = journal.load()
+
+        # list existing files once instead of checking each destination path
+        existing_fnames = _list_fnames(dpath_reorganized)
+
+        # copy file contents in a separate (bounded) pool
+        copy_executor = ThreadPoolExecutor(max_workers=self.n_jobs)
+        try:
+            # do reorg
+            copy_futures = []
+            for fpath_source in fpaths_to_reorg:
+                # the destination path is under dpath_reorganized
+                fname_dest = self.apply_fname_mapping(
+                    fpath_source,
+                    participant_id=participant_id,
+                    session_id=session_id,
+                )
+                fpath_dest = dpath_reorganized / fname_dest
+
+                if fname_dest in existing_fnames:
+                    # files recorded by a previous interrupted run can be skipped
+                    if self.is_reorganized(
+                        fpath_source, fpath_dest, journal_entries.get(fpath_dest)
+                    ):
+                        continue
+                    self._clear_destination(fpath_source, fpath_dest, resuming)
+                existing_fnames.add(fname_dest)
+
+                # links are cheap but copies involve data transfer
+                if self.link_mode in (LinkModeEnum.COPY, LinkModeEnum.REFLINK):
+                    copy_futures.append(
+                        copy_executor.submit(
+                            self._reorganize_and_record,
+                            fpath_source,
+                            fpath_dest,
+                            journal,
+                        )
+                    )
+                else:
+                    self._reorganize_and_record(fpath_source, fpath_dest, journal)
+
+            # raise exceptions from the copy pool, if any
+            for future in copy_futures:
+                future.result()
+        finally:
+            copy_executor.shutdown(cancel_futures=True)
+
+    def _extract_archive(
+        self,
+        fpath_archive: Path,
+        dpath_reorganized: Path,
+        participant_id: str,
+        session_id: str,
+        journal: ReorgJournal,
+        resuming: bool,
+    ):
+        """
+        Extract the files in a session archive directly into the reorganized directory.
+
+        Members are streamed in archive order (compressed archives cannot be read
+        efficiently out of order) and always written as regular files, since they
+        cannot be linked. Members are named as if the archive were a directory.
+        If ``check_dicoms`` or ``dedup`` is set, the archive is read a first time
+        (see :meth:`_scan_archive`) before any member is written.
+        """
+        duplicates = set()
+        if self.check_dicoms or self.dedup:
+            duplicates = self._scan_archive(fpath_archive, participant_id, session_id)
+            if len(duplicates) > 0:
+                logger.info(
+                    f"Skipping {len(duplicates)} duplicate files for participant"
+                    f" {participant_id} session {session_id}"
+                )
+
+        journal_entries = journal.load()
+        existing_fnames = _list_fnames(dpath_reorganized)
+        inode = fpath_archive.stat().st_ino
+
+        for member_name, size, file in iter_archive_members(fpath_archive):
+            if member_name in duplicates:
+                continue
+            fpath_source = fpath_archive / member_name
+            fname_dest = self.apply_fname_mapping(
+                fpath_source,
+                participant_id=participant_id,
+                session_id=session_id,
+            )
+            fpath_dest = dpath_reorganized / fname_dest
+
+            if fname_dest in existing_fnames:
+                if self.is_extracted(
+                    fpath_source,
+                    fpath_dest,
+                    journal_entries.get(fpath_dest),
+                    size,
+                    inode,
+                ):
+                    continue
+                self._clear_destination(fpath_source, fpath_dest, resuming)
+            existing_fnames.add(fname_dest)
+
+            fileops.write_fileobj(file, fpath_dest, dry_run=self.dry_run)
+            journal.record(fpath_source, fpath_dest, size, inode)
+
+    def _scan_archive(
+        self, fpath_archive: Path, participant_id: str, session_id: str
+    ) -> set[str]:
+        """
+        Check the DICOM headers and/or find duplicate members of a session archive.
+
+        If ``check_dicoms`` is set, the headers of all members are read and checked,
+        so that an unreadable file does not leave a partially extracted directory
+        behind. If ``dedup`` is set, the content of each member is hashed and the
+        names of the members whose content is identical to that of another member
+        are returned (the first member, in name order, of each group is kept).
+        """
+        dicom_headers = {}
+        members_by_content = defaultdict(list)
+        for member_name, size, file in iter_archive_members(fpath_archive):
+            if self.check_dicoms:
+                dicom_headers[fpath_archive / member_name] = future = Future()
+                try:
+                    future.set_result(read_dicom_header(file))
+                except Exception as exception:
+                    future.set_exception(exception)
+                file.seek(0)
+            if self.dedup:
+                members_by_content[(size, fileops.hash_fileobj(file))].append(
+                    member_name
+                )
+
+        if self.check_dicoms:
+            self.check_dicom_headers(dicom_headers, participant_id, session_id)
+
+        duplicates = set()
+        for member_names in members_by_content.values():
+            member_name_kept, *member_names_duplicate = sorted(member_names)
+            for member_name in member_names_duplicate:
+                logger.debug(
+                    f"Skipping {fpath_archive / member_name}"
+                    f" (duplicate of {fpath_archive / member_name_kept})"
+                )
+            duplicates.update(member_names_duplicate)
+        self.n_duplicates += len(duplicates)
+        return duplicates
+
     def run_single(self, participant_id: str, session_id: str):
         """Reorganize downloaded DICOM files for a single participant and session."""
+        path_downloaded = self.get_path_downloaded(participant_id, session_id)
+        from_archive = is_archive(path_downloaded)
+
         # get paths to reorganize
-        fpaths_to_reorg = self.get_fpaths_to_reorg(participant_id, session_id)
+        if not from_archive:
+            fpaths_to_reorg = self.get_fpaths_to_reorg(participant_id, session_id)
+            if self.dedup:
+                n_files = len(fpaths_to_reorg)
+                fpaths_to_reorg = self.deduplicate_fpaths(fpaths_to_reorg)
+                if len(fpaths_to_reorg) < n_files:
+                    logger.info(
+                        f"Skipping {n_files - len(fpaths_to_reorg)} duplicate files for"
+                        f" participant {participant_id} session {session_id}"
+                    )
 
         dpath_reorganized: Path = (
             self.study.layout.dpath_post_reorg
@@ -115,55 +722,52 @@ class DicomReorgWorkflow(BaseDatasetWorkflow):
             / session_id_to_bids_session_id(session_id)
         )
         fileops.mkdir(dpath_reorganized, dry_run=self.dry_run)
+        # resolve the directory path to avoid issues with symlinks
+        dpath_reorganized = dpath_reorganized.resolve()
 
-        # do reorg
-        for fpath_source in fpaths_to_reorg:
-            # check file (though only error out if DICOM cannot be read)
-            if self.check_dicoms:
-                try:
-                    if is_derived_dicom(fpath_source):
-                        logger.warning(f"Derived DICOM file detected: {fpath_source}")
-                except Exception as e:
-                    raise WorkflowError(
-                        f"Error checking DICOM file {fpath_source}: {e}"
-                    ) from e
-
-            # the destination path is under dpath_reorganized
-            # resolve the path to avoid issues with symlinks
-            fpath_dest = (
-                dpath_reorganized
-                / self.apply_fname_mapping(
-                    fpath_source, participant_id=participant_id, session_id=session_id
-                )
-            ).resolve()
+        # files recorded by a previous interrupted run can be skipped
+        journal = ReorgJournal(
+            self.get_fpath_journal(participant_id, session_id), dry_run=self.dry_run
+        )
+        resuming = journal.fpath.exists()
+        if resuming:
+            logger.info(
+                f"Resuming reorganization for participant {participant_id} session"
+                f" {session_id}"
+            )
 
-            # do not overwrite existing files
-            if fpath_dest.exists():
-                raise FileOperationError(
-                    f"Cannot move file {fpath_source} to {fpath_dest}"
-                    " because it already exists"
+        journal.open()
+        try:
+            if from_archive:
+                self._extract_archive(
+                    path_downloaded,
+                    dpath_reorganized,
+                    participant_id,
+                    session_id,
+                    journal,
+                    resuming,
                 )
-
-            # either create symlinks or copy original files
-            if self.copy_files:
-                fileops.copy(fpath_source, fpath_dest, dry_run=self.dry_run)
             else:
-                fpath_source = os.path.relpath(
-                    fpath_source.resolve(), fpath_dest.parent
-                )
-                fileops.symlink(
-                    source=fpath_source,
-                    target=fpath_dest,
-                    dry_run=self.dry_run,
+                self._reorganize_files(
+                    fpaths_to_reorg,
+                    dpath_reorganized,
+                    participant_id,
+                    session_id,
+                    journal,
+                    resuming,
                 )
+        finally:
+            journal.close()
 
         # update curation status
-        self.curation_status_table.set_status(
-            participant_id=participant_id,
-            session_id=session_id,
-            col=self.curation_status_table.col_in_post_reorg,
-            status=True,
-        )
+        with self._status_lock:
+            self.curation_status_table.set_status(
+                participant_id=participant_id,
+                session_id=session_id,
+                col=self.curation_status_table.col_in_post_reorg,
+                status=True,
+            )
+        self._fpaths_journal_done.append(journal.fpath)
 
     def get_participants_sessions_to_run(self):
         """Return participant-session pairs to reorganize."""
@@ -188,32 +792,118 @@ class DicomReorgWorkflow(BaseDatasetWorkflow):
             dpath_bidsified=self.study.layout.dpath_bids,
         )
 
+    def _check_no_archives(self, participants_sessions: list[tuple[str, str]]):
+        """Raise an error if any participant-session pair has an archive."""
+        fpaths_archive = [
+            path_downloaded
+            for path_downloaded in (
+                self.get_path_downloaded(participant_id, session_id)
+                for participant_id, session_id in participants_sessions
+            )
+            if is_archive(path_downloaded)
+        ]
+        if len(fpaths_archive) > 0:
+            raise WorkflowError(
+                "--prescan cannot be used with archives, which are read directly"
+                f" instead of being scanned. Found {len(fpaths_archive)} archives"
+                f" to reorganize (e.g. {fpaths_archive[0]})"
+            )
+
+    def scan_dicom_dirs(self, participants_sessions: list[tuple[str, str]]):
+        """
+        List the files of all raw DICOM directories to reorganize in a single pass.
+
+        Directories are scanned in parallel (see ``n_jobs``) and the file lists
+        are used by :meth:`get_fpaths_to_reorg` instead of walking each directory
+        separately.
+        """
+        dpaths = {
+            self.get_path_downloaded(participant_id, session_id)
+            for participant_id, session_id in participants_sessions
+        }
+        self.fpaths_by_dicom_dir = fileops.list_files(dpaths, n_jobs=self.n_jobs)
+        n_files = sum(len(fpaths) for fpaths in self.fpaths_by_dicom_dir.values())
+        logger.info(
+            f"Found {n_files} files to reorganize in"
+            f" {len(self.fpaths_by_dicom_dir)} DICOM directories"
+        )
+
     def run_main(self):
         """Reorganize all downloaded DICOM files."""
-        for (
-            participant_id,
-            session_id,
-        ) in self.get_participants_sessions_to_run():
-            self.n_total += 1
-            try:
-                self.run_single(participant_id, session_id)
-                self.n_success += 1
-            except Exception as exception:
-                self.return_code = ReturnCode.PARTIAL_SUCCESS
-                logger.error(
-                    "Error reorganizing DICOM files for participant "
-                    f"{participant_id} session {session_id}: {exception}"
-                )
+
+        def _log_error(participant_id: str, session_id: str, exception: Exception):
+            self.return_code = ReturnCode.PARTIAL_SUCCESS
+            logger.error(
+                "Error reorganizing DICOM files for participant "
+                f"{participant_id} session {session_id}: {exception}"
+            )
+
+        participants_sessions = list(self.get_participants_sessions_to_run())
+        if self.prescan:
+            self._check_no_archives(participants_sessions)
+            self.scan_dicom_dirs(participants_sessions)
+
+        # archives have to be read sequentially, so they are extracted
+        # in parallel across sessions instead
+        archive_futures: dict[tuple[str, str], Future] = {}
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as archive_executor:
+            for participant_id, session_id in participants_sessions:
+                self.n_total += 1
+                if is_archive(self.get_path_downloaded(participant_id, session_id)):
+                    archive_futures[(participant_id, session_id)] = (
+                        archive_executor.submit(
+                            self.run_single, participant_id, session_id
+                        )
+                    )
+                    continue
+                try:
+                    self.run_single(participant_id, session_id)
+                    self.n_success += 1
+                except Exception as exception:
+                    _log_error(participant_id, session_id, exception)
+
+            for (participant_id, session_id), future in archive_futures.items():
+                try:
+                    future.result()
+                    self.n_success += 1
+                except Exception as exception:
+                    _log_error(participant_id, session_id, exception)
 
         self.curation_status_table.save_with_backup(
             self.study.layout.fpath_curation_status,
             dry_run=self.dry_run,
         )
 
+        # completed sessions will not be rerun so their journals are not needed
+        for fpath_journal in self._fpaths_journal_done:
+            if fpath_journal.exists():
+                fileops.rm(fpath_journal, dry_run=self.dry_run)
+
         self._log_summary_message()
 
+    def _log_derived_dicom_summary(self):
+        """Log the number of derived DICOM files found in each series."""
+        if not self.derived_dicom_counts:
+            return
+
+        logger.warning(
+            f"Found derived DICOM files in {len(self.derived_dicom_counts)} series:"
+        )
+        for (participant_id, session_id, series), (
+            n_derived,
+            n_total,
+        ) in self.derived_dicom_counts.items():
+            logger.warning(
+                f"\tParticipant {participant_id}, session {session_id}"
+                f", series {series}: {n_derived}/{n_total} derived files"
+            )
+
     def _log_summary_message(self):
         """Log a summary message about the run."""
+        self._log_derived_dicom_summary()
+        if self.n_duplicates > 0:
+            logger.info(f"Skipped {self.n_duplicates} duplicate files in total")
+
         if self.n_total == 0:
             logger.warning(
                 "No participant-session pairs to reorganize. Make sure there are no "
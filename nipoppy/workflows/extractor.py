@@ -31,9 +31,16 @@ class ExtractionRunner(Runner):
         session_id: str = None,
         use_subcohort: Optional[StrOrPathLike] = None,
         simulate: bool = False,
+        simulate_output: Optional[StrOrPathLike] = None,
         keep_workdir: bool = False,
         hpc: Optional[str] = None,
         write_subcohort: Optional[StrOrPathLike] = None,
+        n_jobs: int = 1,
+        max_cores: Optional[int] = None,
+        max_mem: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        report_retryable: bool = False,
         fpath_layout: Optional[StrOrPathLike] = None,
         verbose: bool = False,
         dry_run: bool = False,
@@ -49,9 +56,16 @@ class ExtractionRunner(Runner):
             session_id=session_id,
             use_subcohort=use_subcohort,
             simulate=simulate,
+            simulate_output=simulate_output,
             keep_workdir=keep_workdir,
             hpc=hpc,
             write_subcohort=write_subcohort,
+            n_jobs=n_jobs,
+            max_cores=max_cores,
+            max_mem=max_mem,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            report_retryable=report_retryable,
             fpath_layout=fpath_layout,
             verbose=verbose,
             dry_run=dry_run,
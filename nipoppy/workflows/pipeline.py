@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import re
 import sys
 from abc import ABC, abstractmethod
@@ -19,6 +18,7 @@ from nipoppy.config.boutiques import (
     BoutiquesConfig,
     get_boutiques_config_from_descriptor,
 )
+from nipoppy.config.hpc import HpcConfig
 from nipoppy.config.pipeline import (
     BasePipelineConfig,
     BIDSificationPipelineConfig,
@@ -43,7 +43,6 @@ from nipoppy.exceptions import (
     ReturnCode,
     WorkflowError,
 )
-from nipoppy.layout import DatasetLayout
 from nipoppy.logger import get_logger
 from nipoppy.utils import fileops
 from nipoppy.utils.bids import (
@@ -54,11 +53,11 @@ from nipoppy.utils.bids import (
     participant_id_to_bids_participant_id,
     session_id_to_bids_session_id,
 )
+from nipoppy.utils.template import JsonTemplate
 from nipoppy.utils.utils import (
     apply_substitutions_to_json,
     get_pipeline_tag,
     load_json,
-    process_template_str,
 )
 from nipoppy.workflows.base import BaseDatasetWorkflow
 
@@ -78,43 +77,15 @@ except ImportError as error:
 logger = get_logger()
 
 
-def get_pipeline_version(
-    pipeline_name: str,
-    dpath_pipelines: StrOrPathLike,
+def _get_latest_version(
+    pipeline_name: str, installed_pipelines: list[tuple[str, str]]
 ) -> str:
-    """Get the latest version associated with a pipeline.
-
-    Parameters
-    ----------
-    pipeline_name : str
-        Name of the pipeline, as specified in the config
-    dpath_pipelines : nipoppy.env.StrOrPathLike
-        Path to directory containing pipeline bundle subdirectories
-
-    Returns
-    -------
-    str
-        The pipeline version
-    """
-    installed_pipelines = []
-    pipeline_config_latest = None
-    for fpath_pipeline_config in Path(dpath_pipelines).glob(
-        f"*/{DatasetLayout.fname_pipeline_config}"
-    ):
-        pipeline_config = BasePipelineConfig(
-            **load_json(fpath_pipeline_config, allow_json5=True)
-        )
-        if pipeline_config.NAME == pipeline_name:
-            if pipeline_config_latest is None:
-                pipeline_config_latest = pipeline_config
-            elif Version(pipeline_config.VERSION) > Version(
-                pipeline_config_latest.VERSION
-            ):
-                pipeline_config_latest = pipeline_config
-        installed_pipelines.append((pipeline_config.NAME, pipeline_config.VERSION))
-
-    if pipeline_config_latest is not None:
-        return pipeline_config_latest.VERSION
+    """Get the latest version of a pipeline from (name, version) pairs."""
+    versions = [
+        version for name, version in installed_pipelines if name == pipeline_name
+    ]
+    if len(versions) > 0:
+        return max(versions, key=Version)
     else:
         raise WorkflowError(
             f"No config found for pipeline with NAME={pipeline_name}"
@@ -140,6 +111,10 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
 
     progress_bar_description = "Working..."  # default description used by rich
 
+    # if True, participants/sessions are run in separate processes (each with its
+    # own log file) when n_jobs > 1, instead of in threads of the current process
+    _n_jobs_in_subprocesses = False
+
     def __init__(
         self,
         dpath_root: StrOrPathLike,
@@ -165,7 +140,11 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
                 "are mutually exclusive."
             )
 
-        if n_jobs is not None and not _skip_logfile:
+        if (
+            n_jobs is not None
+            and not _skip_logfile
+            and not self._n_jobs_in_subprocesses
+        ):
             raise WorkflowError("n_jobs is not supported when _skip_logfile is False.")
         if n_jobs is None:
             n_jobs = 1
@@ -197,7 +176,11 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
 
         self.run_single_results = None
 
-        if not JOBLIB_INSTALLED and self.n_jobs not in (None, 1):
+        if (
+            not JOBLIB_INSTALLED
+            and self.n_jobs not in (None, 1)
+            and not self._n_jobs_in_subprocesses
+        ):
             logger.error(
                 "An additional dependency is required to enable local parallelization "
                 "with --n-jobs. Install it with: pip install nipoppy[parallel]",
@@ -344,6 +327,20 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
         )
         return invocation
 
+    @cached_property
+    def hpc_config(self) -> HpcConfig:
+        """Load the pipeline step's HPC configuration."""
+        fname_hpc_config = self.pipeline_step_config.HPC_CONFIG_FILE
+        if fname_hpc_config is None:
+            data = {}
+        else:
+            fpath_hpc_config = self.dpath_pipeline_bundle / fname_hpc_config
+            logger.info(f"Loading HPC config from {fpath_hpc_config}")
+            data = self.process_template_json(
+                load_json(fpath_hpc_config, allow_json5=True)
+            )
+        return HpcConfig(**data)
+
     @cached_property
     def tracker_config(self) -> TrackerConfig:
         """Load the pipeline step's tracker configuration."""
@@ -358,6 +355,11 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
         logger.info(f"Loading tracker config from {fpath_tracker_config}")
         return TrackerConfig(**load_json(fpath_tracker_config, allow_json5=True))
 
+    @cached_property
+    def tracker_config_template(self) -> JsonTemplate:
+        """Tracker configuration, parsed once for all participants/sessions."""
+        return self.compile_template_json(self.tracker_config.model_dump(mode="json"))
+
     @cached_property
     def pybids_ignore_patterns(self) -> list[str]:
         """
@@ -453,9 +455,26 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
 
         return self.study.config.propagate_container_config_to_pipeline(pipeline_config)
 
+    def compile_template_json(
+        self, template_json: dict | list, with_substitutions: bool = True
+    ) -> JsonTemplate:
+        """
+        Parse a JSON object with template strings for repeated processing.
+
+        User-defined substitutions (if requested) are applied before parsing, since
+        they do not depend on the participant/session.
+        """
+        if with_substitutions:
+            # apply user-defined substitutions to maintain compatibility with older
+            # pipeline config files that do not use the new pipeline variables
+            template_json = apply_substitutions_to_json(
+                template_json, self.study.config.SUBSTITUTIONS
+            )
+        return JsonTemplate(template_json)
+
     def process_template_json(
         self,
-        template_json: dict,
+        template_json: dict | JsonTemplate,
         participant_id: Optional[str] = None,
         session_id: Optional[str] = None,
         bids_participant_id: Optional[str] = None,
@@ -465,12 +484,16 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
         with_substitutions: bool = True,
         **kwargs,
     ):
-        """Replace template strings in a JSON object."""
-        if with_substitutions:
-            # apply user-defined substitutions to maintain compatibility with older
-            # pipeline config files that do not use the new pipeline variables
-            template_json = apply_substitutions_to_json(
-                template_json, self.study.config.SUBSTITUTIONS
+        """
+        Replace template strings in a JSON object.
+
+        ``template_json`` can also be a template from ``compile_template_json``,
+        to avoid parsing the same JSON object for every participant/session (in
+        which case ``with_substitutions`` is ignored).
+        """
+        if not isinstance(template_json, JsonTemplate):
+            template_json = self.compile_template_json(
+                template_json, with_substitutions=with_substitutions
             )
         if participant_id is not None:
             if bids_participant_id is None:
@@ -486,9 +509,7 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
             kwargs["session_id"] = session_id
             kwargs["bids_session_id"] = bids_session_id
 
-        if objs is None:
-            objs = []
-        objs.extend([self, self.study.layout])
+        objs = [*(objs or []), self, self.study.layout]
 
         if kwargs:
             logger.debug("Available replacement strings: ")
@@ -497,13 +518,7 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
                 logger.debug(f"\t{k}:".ljust(max_len + 3) + v)
             logger.debug(f"\t+ all attributes in: {objs}")
 
-        template_json_str = process_template_str(
-            json.dumps(template_json),
-            objs=objs,
-            **kwargs,
-        )
-
-        return template_json_str if return_str else json.loads(template_json_str)
+        return template_json.render(objs=objs, return_str=return_str, **kwargs)
 
     def set_up_bids_db(
         self,
@@ -561,11 +576,15 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
     def check_pipeline_version(self):
         """Set the pipeline version based on the config if it is not given."""
         if self.pipeline_version is None:
-            self.pipeline_version = get_pipeline_version(
-                pipeline_name=self.pipeline_name,
-                dpath_pipelines=self.study.layout.get_dpath_pipeline_store(
-                    self._pipeline_type
-                ),
+            self.pipeline_version = _get_latest_version(
+                self.pipeline_name,
+                [
+                    (name, version)
+                    for pipeline_type, name, version, _ in (
+                        self.study.get_pipeline_bundles()
+                    )
+                    if pipeline_type == self._pipeline_type
+                ],
             )
             logger.warning(
                 f"Pipeline version not specified, using version {self.pipeline_version}"
@@ -645,6 +664,10 @@ class BasePipelineWorkflow(BaseDatasetWorkflow, ABC):
                 return_as="generator",
             )(results_generator)
 
+        return self._track_progress(results_generator, n_total)
+
+    def _track_progress(self, results_generator, n_total: int):
+        """Show a progress bar for the results (if enabled)."""
         if self._show_progress and n_total != 0:
             results_generator = rich.progress.track(
                 results_generator,
@@ -279,6 +279,13 @@ class PipelineInstallWorkflow(BaseDatasetWorkflow):
                 dry_run=self.dry_run,
             )
 
+        if not self.dry_run:
+            self.study.add_to_pipeline_index(
+                dpath_target / self.study.layout.fname_pipeline_config,
+                pipeline_config.NAME,
+                pipeline_config.VERSION,
+            )
+
         # update global config with new pipeline variables
         self._update_config_and_save(pipeline_config)
 
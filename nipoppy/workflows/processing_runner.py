@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from functools import cached_property
 from pathlib import Path
 from tarfile import is_tarfile
@@ -11,9 +12,16 @@ from nipoppy.config.tracker import TrackerConfig
 from nipoppy.env import BIDS_PATH_INJECTION_PREFIX, EXT_TAR, StrOrPathLike
 from nipoppy.exceptions import ConfigError, FileOperationError, WorkflowError
 from nipoppy.logger import get_logger
+from nipoppy.tabular.processing_status import ProcessingStatusTable
 from nipoppy.utils import fileops
+from nipoppy.utils.path_index import DirectoryIndex
 from nipoppy.workflows.base import _run_command
 from nipoppy.workflows.runner import Runner
+from nipoppy.workflows.tracker import (
+    PipelineTracker,
+    TrackerFingerprints,
+    update_processing_status_file,
+)
 
 if TYPE_CHECKING:
     import bids
@@ -50,9 +58,17 @@ class ProcessingRunner(Runner):
         session_id: str = None,
         use_subcohort: Optional[StrOrPathLike] = None,
         simulate: bool = False,
+        simulate_output: Optional[StrOrPathLike] = None,
         keep_workdir: bool = False,
         tar: bool = False,
+        track: bool = False,
         write_subcohort: Optional[StrOrPathLike] = None,
+        n_jobs: int = 1,
+        max_cores: Optional[int] = None,
+        max_mem: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        report_retryable: bool = False,
         fpath_layout: Optional[StrOrPathLike] = None,
         verbose: bool = False,
         dry_run: bool = False,
@@ -69,14 +85,28 @@ class ProcessingRunner(Runner):
             session_id=session_id,
             use_subcohort=use_subcohort,
             write_subcohort=write_subcohort,
+            n_jobs=n_jobs,
+            max_cores=max_cores,
+            max_mem=max_mem,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            report_retryable=report_retryable,
             fpath_layout=fpath_layout,
             verbose=verbose,
             dry_run=dry_run,
             hpc=hpc,
             simulate=simulate,
+            simulate_output=simulate_output,
             keep_workdir=keep_workdir,
         )
         self.tar = tar
+        self.track = track
+
+        # processing status records and output fingerprints of the
+        # participants/sessions run so far (if track is True)
+        self._status_records: list[dict] = []
+        self._fingerprints: dict[tuple[str, str], str] = {}
+        self._status_records_lock = threading.Lock()
 
     @cached_property
     def dpaths_to_check(self) -> list[Path]:
@@ -110,6 +140,34 @@ class ProcessingRunner(Runner):
                 f"{self.pipeline_step_config.TRACKER_CONFIG_FILE}"
             )
 
+    def _check_track_conditions(self):
+        """Make sure that there is a tracker config file if tracking is requested."""
+        if self.track and self.pipeline_step_config.TRACKER_CONFIG_FILE is None:
+            raise ConfigError(
+                "Tracking requested but there is no tracker config file. "
+                "Specify the TRACKER_CONFIG_FILE field for the pipeline step in "
+                "the pipeline config file."
+            )
+
+    @cached_property
+    def tracker(self) -> PipelineTracker:
+        """Tracker for checking the outputs of each participant/session.
+
+        It shares the study and pipeline config of the runner.
+        """
+        tracker = PipelineTracker(
+            dpath_root=self.dpath_root,
+            pipeline_name=self.pipeline_name,
+            pipeline_version=self.pipeline_version,
+            pipeline_step=self.pipeline_step,
+            fpath_layout=self.fpath_layout,
+            verbose=self.verbose,
+            dry_run=self.dry_run,
+        )
+        tracker.study = self.study
+        tracker.pipeline_config = self.pipeline_config
+        return tracker
+
     def tar_directory(self, dpath: StrOrPathLike) -> Path:
         """Tar a directory and delete it."""
         dpath = Path(dpath)
@@ -129,6 +187,8 @@ class ProcessingRunner(Runner):
         # make sure that the tarfile was created successfully before removing
         # original directory
         if fpath_tarred.exists() and is_tarfile(fpath_tarred):
+            # so that the tracker does not need to read through the tarball
+            fileops.write_tar_members(fpath_tarred, dry_run=self.dry_run)
             fileops.rm(dpath, dry_run=self.dry_run)
         else:
             logger.error(f"Failed to tar {dpath} to {fpath_tarred}")
@@ -169,13 +229,19 @@ class ProcessingRunner(Runner):
         return self.hpc_runner.generate_cli_command(
             participant_id=participant_id,
             session_id=session_id,
-            extra_flags=["--tar"] if self.tar else None,
+            extra_flags=[
+                flag
+                for flag, value in (("--tar", self.tar), ("--track", self.track))
+                if value
+            ]
+            or None,
         )
 
     def run_setup(self):
         """Run pipeline runner setup."""
         to_return = super().run_setup()
         self._check_tar_conditions()
+        self._check_track_conditions()
 
         # fail early if container file is specified but not found
         # otherwise, the exception will be caught in the run_main loop
@@ -189,6 +255,14 @@ class ProcessingRunner(Runner):
 
         return to_return
 
+    def get_dpath_inputs(
+        self, participant_id: Optional[str], session_id: Optional[str]
+    ) -> Optional[Path]:
+        """Get the BIDS directory of a participant/session."""
+        return self._get_dpath_participant_session(
+            self.study.layout.dpath_bids, participant_id, session_id
+        )
+
     def run_single(self, participant_id: str, session_id: str):
         """Run pipeline on a single participant/session."""
         logger.info(f"Running for participant {participant_id}, session {session_id}")
@@ -235,7 +309,7 @@ class ProcessingRunner(Runner):
         if self.tar and not self.simulate:
             tracker_config = TrackerConfig(
                 **self.process_template_json(
-                    self.tracker_config.model_dump(mode="json"),
+                    self.tracker_config_template,
                     participant_id=participant_id,
                     session_id=session_id,
                 )
@@ -246,6 +320,85 @@ class ProcessingRunner(Runner):
 
         return invocation_and_descriptor
 
+    def _finish_single_run(self, participant_id, session_id, success, result):
+        """Record the processing status of a participant/session that was run."""
+        if self.track and not self.simulate:
+            self._track_single(participant_id, session_id, success)
+        return success, result
+
+    def _track_single(self, participant_id: str, session_id: str, success: bool):
+        """
+        Check the outputs of a participant/session that was just run.
+
+        The status is FAIL if the run failed, otherwise it is determined by the
+        tracker config. Records are added to the processing status file at the end
+        of the run.
+        """
+        fingerprint = None
+        if success:
+            try:
+                # new index since the outputs have just been created
+                status_record = self.tracker.run_single(
+                    participant_id,
+                    session_id,
+                    output_index=DirectoryIndex(self.dpath_pipeline_output),
+                )
+                fingerprint = self.tracker.get_fingerprint(participant_id, session_id)
+            except Exception as exception:
+                logger.error(
+                    f"Error tracking {self.pipeline_name} {self.pipeline_version}"
+                    f" on participant {participant_id}, session {session_id}"
+                    f": {exception}"
+                )
+                return
+        else:
+            status_record = {
+                ProcessingStatusTable.col_participant_id: participant_id,
+                ProcessingStatusTable.col_session_id: session_id,
+                ProcessingStatusTable.col_pipeline_name: self.pipeline_name,
+                ProcessingStatusTable.col_pipeline_version: self.pipeline_version,
+                ProcessingStatusTable.col_pipeline_step: self.pipeline_step,
+                ProcessingStatusTable.col_status: ProcessingStatusTable.status_fail,
+            }
+        logger.info(
+            f"Status for participant {participant_id}, session {session_id}: "
+            f"{status_record[ProcessingStatusTable.col_status]}"
+        )
+
+        with self._status_records_lock:
+            self._status_records.append(status_record)
+            if fingerprint is not None:
+                self._fingerprints[(participant_id, session_id)] = fingerprint
+
+    def _update_status_file(self):
+        """Add the statuses recorded during the run to the processing status file."""
+        if len(self._status_records) == 0:
+            return
+        self.processing_status_table = update_processing_status_file(
+            self._status_records, self.study.layout, dry_run=self.dry_run
+        )
+        logger.info(
+            f"Updated the processing status of {len(self._status_records)}"
+            f" participants or sessions in {self.study.layout.fpath_processing_status}"
+        )
+        if self.dry_run or len(self._fingerprints) == 0:
+            return
+        with TrackerFingerprints(
+            self.study.layout.fpath_tracker_fingerprints
+        ) as fingerprints_table:
+            fingerprints_table.update(
+                self._fingerprints,
+                self.pipeline_name,
+                self.pipeline_version,
+                self.pipeline_step,
+            )
+
+    def run_main(self):
+        """Run the pipeline and record the processing statuses if requested."""
+        super().run_main()
+        if self.track:
+            self._update_status_file()
+
     def run_cleanup(self):
         """Run pipeline runner cleanup."""
         if self.n_success == self.n_total:
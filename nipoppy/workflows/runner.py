@@ -1,27 +1,56 @@
 """Abstract class for workflow runners and runner utilities."""
 
+from __future__ import annotations
+
 import copy
+import functools
+import heapq
+import itertools
 import json
+import os
 import shlex
+import subprocess
+import sys
+import time
 from abc import ABC
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import cached_property
 from pathlib import Path
+from typing import Any, Callable, Optional
 
 from boutiques import bosh
+from boutiques.invocationSchemaHandler import generateInvocationSchema, validateSchema
+from boutiques.localExec import addDefaultValues
 from typing_extensions import override
 
 from nipoppy.config.boutiques import BoutiquesConfig
 from nipoppy.config.container import ContainerConfig
-from nipoppy.config.hpc import HpcConfig
+from nipoppy.config.hpc import parse_memory
+from nipoppy.config.pipeline_step import RetryConfig
 from nipoppy.container import ContainerHandler, get_container_handler
 from nipoppy.env import ContainerCommandEnum, StrOrPathLike
+from nipoppy.exceptions import (
+    ExecutionError,
+    PipelineTimeoutError,
+    ReturnCode,
+    WorkflowError,
+)
 from nipoppy.logger import get_logger
-from nipoppy.pipeline_validation import check_pipeline_bundle
-from nipoppy.utils.utils import TEMPLATE_REPLACE_PATTERN, get_pipeline_tag, load_json
-from nipoppy.workflows.base import _run_command
+from nipoppy.pipeline_validation import check_pipeline_bundle_cached
+from nipoppy.utils import fileops
+from nipoppy.utils.bids import (
+    participant_id_to_bids_participant_id,
+    session_id_to_bids_session_id,
+)
+from nipoppy.utils.file_index import PipelineStepIndex
+from nipoppy.utils.template import JsonTemplate
+from nipoppy.utils.utils import TEMPLATE_REPLACE_PATTERN, get_pipeline_tag
+from nipoppy.workflows.base import _log_command, _run_command
 from nipoppy.workflows.pipeline import BasePipelineWorkflow
 from nipoppy.workflows.services.boutiques import (
     BoshRunnerCallable,
+    CommandLineSimulator,
     run_bosh_launch,
     run_bosh_simulate,
 )
@@ -30,28 +59,93 @@ from nipoppy.workflows.services.hpc import HPCRunner
 logger = get_logger()
 
 
+class RunTimes(PipelineStepIndex):
+    """
+    SQLite table of the run times of participant-session pipeline runs.
+
+    There is one run time (in seconds) per participant, session, pipeline name,
+    pipeline version and pipeline step, from the last successful run.
+    """
+
+    table_name = "run_times"
+    value_column = "run_time"
+    value_type = "REAL"
+
+
 class Runner(BasePipelineWorkflow, ABC):
     """Abstract class for workflow runners."""
 
     # TODO Generic type for pipeline config and pipeline step config attributes
 
+    _n_jobs_in_subprocesses = True
+
     def __init__(
         self,
         subcommand: str,
         simulate: bool = False,
         keep_workdir: bool = False,
+        simulate_output: Optional[StrOrPathLike] = None,
+        max_cores: Optional[int] = None,
+        max_mem: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        report_retryable: bool = False,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if self.hpc and simulate_output is not None:
+            raise WorkflowError(
+                "HPC job submission and writing simulated command lines are "
+                "mutually exclusive."
+            )
+        if (
+            self.n_jobs != 1 or max_cores is not None or max_mem is not None
+        ) and simulate_output is not None:
+            raise WorkflowError(
+                "Running in parallel processes and writing simulated command lines "
+                "are mutually exclusive."
+            )
         self.subcommand = subcommand
-        self.simulate = simulate
+        self.simulate = simulate or simulate_output is not None
         self.keep_workdir = keep_workdir
+        self.simulate_output = simulate_output
+        self.max_cores = max_cores
+        self.max_mem = max_mem
+        # fail early if the memory budget is invalid
+        self._max_mem_bytes = None if max_mem is None else parse_memory(max_mem)
+        # overrides the TIMEOUT of the pipeline step if set
+        self.timeout = timeout
+        # overrides the RETRY.MAX_ATTEMPTS of the pipeline step if set
+        self.max_attempts = max_attempts
+        # set in parallel local processes: failed runs are not retried, but are
+        # reported with a specific return code so that the parent process can
+        # retry them later
+        self.report_retryable = report_retryable
+
+        # (participant ID, session ID) -> command line (if simulate_output is set)
+        self._simulated_command_lines: dict[tuple[str, str], str] = {}
+        self._command_line_simulators: dict[str, CommandLineSimulator] = {}
+
+        # descriptor string -> (descriptor, invocation schema)
+        self._validated_descriptors: dict[str, tuple[dict, dict]] = {}
+
+        # (participant ID, session ID) -> run time (in seconds) of successful runs
+        self._run_times: dict[tuple[str, str], float] = {}
+        # participants/sessions whose run exceeded the time limit
+        self._timed_out: set[tuple[str, str]] = set()
+        # participants/sessions whose failed run could be retried
+        self._retryable: set[tuple[str, str]] = set()
 
     def run_setup(self):
         """Run pipeline setup and validate the pipeline bundle."""
         to_return = super().run_setup()
-        check_pipeline_bundle(self.dpath_pipeline_bundle, strict=False)
+        check_pipeline_bundle_cached(
+            self.dpath_pipeline_bundle,
+            self.study.layout.dpath_validated_bundles,
+            strict=False,
+            dry_run=self.dry_run,
+        )
         return to_return
 
     @cached_property
@@ -73,20 +167,6 @@ class Runner(BasePipelineWorkflow, ABC):
             verbose=self.verbose,
         )
 
-    @cached_property
-    def hpc_config(self) -> HpcConfig:
-        """Load the pipeline step's HPC configuration."""
-        fname_hpc_config = self.pipeline_step_config.HPC_CONFIG_FILE
-        if fname_hpc_config is None:
-            data = {}
-        else:
-            fpath_hpc_config = self.dpath_pipeline_bundle / fname_hpc_config
-            logger.info(f"Loading HPC config from {fpath_hpc_config}")
-            data = self.process_template_json(
-                load_json(fpath_hpc_config, allow_json5=True)
-            )
-        return HpcConfig(**data)
-
     def _generate_cli_command_for_hpc(
         self, participant_id: str | None = None, session_id: str | None = None
     ) -> list[str]:
@@ -96,6 +176,440 @@ class Runner(BasePipelineWorkflow, ABC):
             session_id=session_id,
         )
 
+    def _generate_cli_command_for_subprocess(
+        self, participant_id: str | None = None, session_id: str | None = None
+    ) -> list[str]:
+        """
+        Generate the CLI command to be run in a parallel local process.
+
+        The command uses the same Python interpreter (and therefore the same
+        Nipoppy installation) as the current process.
+        """
+        command = self._generate_cli_command_for_hpc(
+            participant_id=participant_id, session_id=session_id
+        )
+        # replace the program name found on the PATH
+        command = [sys.executable, "-m", "nipoppy"] + command[1:]
+        if self.simulate:
+            command.append("--simulate")
+        if self.timeout is not None:
+            command.extend(["--timeout", str(self.timeout)])
+        if self.run_retry_config.MAX_ATTEMPTS > 1:
+            # failed runs are retried by this process
+            command.append("--report-retryable")
+        elif self.max_attempts is not None:
+            command.extend(["--max-attempts", str(self.max_attempts)])
+        return command
+
+    def _run_single_in_subprocess(
+        self,
+        participant_id: str | None,
+        session_id: str | None,
+        n_failed_attempts: int = 0,
+    ) -> tuple[bool, None, Optional[float]]:
+        """
+        Run a single participant/session in a separate nipoppy process.
+
+        The process writes its own log file. Returns (success, None, delay), where
+        delay is the time to wait before retrying the run (None if it should not be
+        retried).
+        """
+        command = self._generate_cli_command_for_subprocess(
+            participant_id=participant_id, session_id=session_id
+        )
+        _log_command(shlex.join(command))
+        if self.dry_run:
+            return True, None, None
+
+        try:
+            return_code = subprocess.run(
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            ).returncode
+        except OSError as exception:
+            logger.error(
+                f"Error running {self.pipeline_name} {self.pipeline_version}"
+                f" on participant {participant_id}, session {session_id}"
+                f": could not start process: {exception}"
+            )
+            return False, None, None
+        if return_code == ReturnCode.SUCCESS:
+            return True, None, None
+
+        message = (
+            f"Error running {self.pipeline_name} {self.pipeline_version}"
+            f" on participant {participant_id}, session {session_id}"
+            f": process exited with return code {return_code}"
+        )
+        n_failed_attempts += 1
+        if (
+            return_code == ReturnCode.PIPELINE_RETRYABLE_ERROR
+            and n_failed_attempts < self.run_retry_config.MAX_ATTEMPTS
+        ):
+            return False, None, self._get_retry_delay(message, n_failed_attempts)
+        if return_code == ReturnCode.PIPELINE_TIMEOUT:
+            self._timed_out.add((participant_id, session_id))
+        logger.error(
+            f"{message}. See the log file for this participant/session in"
+            f" {self.dpath_logs_pipeline}"
+        )
+        return False, None, None
+
+    def _run_in_subprocesses(self, participants_sessions: list, n_jobs: int):
+        """Run participants/sessions in up to n_jobs parallel processes."""
+        logger.info(
+            f"Running {len(participants_sessions)} participants or sessions in up to"
+            f" {n_jobs} parallel processes. Log files for each participant or"
+            f" session will be written to {self.dpath_logs_pipeline}"
+        )
+        yield from self._run_with_retries(
+            participants_sessions, n_jobs, self._run_single_in_subprocess
+        )
+
+    def _run_with_retries(
+        self,
+        participants_sessions: list,
+        n_jobs: int,
+        run_attempt: Callable[[str, str, int], tuple[bool, Any, Optional[float]]],
+    ):
+        """
+        Run participants/sessions in up to n_jobs threads, retrying failed runs.
+
+        run_attempt(participant_id, session_id, n_failed_attempts) runs a
+        participant/session once and returns (success, result, delay). If delay is
+        not None, the participant/session is put back in the queue and started again
+        once the delay has passed. Workers run the other participants/sessions in
+        the meantime. Yields (success, result) in order of completion.
+        """
+        # (participant ID, session ID, number of failed attempts)
+        queue = deque(
+            (participant_id, session_id, 0)
+            for participant_id, session_id in participants_sessions
+        )
+        # heap of (not before time, tiebreaker, participant ID, session ID, number
+        # of failed attempts)
+        retries = []
+        tiebreaker = itertools.count()
+        running = {}
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            while queue or retries or running:
+                while retries and retries[0][0] <= time.monotonic():
+                    queue.append(heapq.heappop(retries)[2:])
+                if not queue and not running:
+                    # nothing else to run until the next retry
+                    not_before, _, *item = heapq.heappop(retries)
+                    time.sleep(max(not_before - time.monotonic(), 0))
+                    queue.append(tuple(item))
+                while queue and len(running) < n_jobs:
+                    item = queue.popleft()
+                    running[executor.submit(run_attempt, *item)] = item
+                done, _ = wait(
+                    running,
+                    timeout=(
+                        max(retries[0][0] - time.monotonic(), 0) if retries else None
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    participant_id, session_id, n_failed_attempts = running.pop(future)
+                    success, result, delay = future.result()
+                    if delay is None:
+                        yield success, result
+                    else:
+                        heapq.heappush(
+                            retries,
+                            (
+                                time.monotonic() + delay,
+                                next(tiebreaker),
+                                participant_id,
+                                session_id,
+                                n_failed_attempts + 1,
+                            ),
+                        )
+
+    def _get_retry_delay(self, message: str, n_failed_attempts: int) -> float:
+        """Log a failed attempt and get the delay before the next one."""
+        delay = self.run_retry_config.get_delay(n_failed_attempts)
+        logger.warning(
+            f"{message} (attempt {n_failed_attempts}"
+            f"/{self.run_retry_config.MAX_ATTEMPTS}). Retrying in {delay:g} seconds"
+        )
+        return delay
+
+    def _get_n_parallel_jobs(self) -> int:
+        """
+        Get the maximum number of participants/sessions to run at the same time.
+
+        If core and/or memory budgets are set, this is the number of runs whose
+        resources (CORES and MEMORY in the HPC config) fit within the budgets,
+        capped by n_jobs if it is greater than 1. Otherwise, it is n_jobs.
+        """
+        if self.max_cores is None and self._max_mem_bytes is None:
+            return self.n_jobs
+
+        n_jobs_max = []
+        if self.max_cores is not None:
+            n_cores = self.hpc_config.get_cores() or 1
+            if n_cores > self.max_cores:
+                raise WorkflowError(
+                    f"Each run requires {n_cores} cores (CORES in the HPC config)"
+                    f", which exceeds the maximum number of cores ({self.max_cores})"
+                )
+            n_jobs_max.append(self.max_cores // n_cores)
+        if self._max_mem_bytes is not None:
+            memory = self.hpc_config.get_memory()
+            if memory is None:
+                raise WorkflowError(
+                    "MEMORY must be set in the HPC config of the pipeline step to "
+                    "limit the total amount of memory"
+                )
+            if memory > self._max_mem_bytes:
+                raise WorkflowError(
+                    f"Each run requires {self.hpc_config.MEMORY} of memory (MEMORY in"
+                    " the HPC config), which exceeds the maximum amount of memory"
+                    f" ({self.max_mem})"
+                )
+            n_jobs_max.append(self._max_mem_bytes // memory)
+        if self.n_jobs > 1:
+            n_jobs_max.append(self.n_jobs)
+
+        n_parallel_jobs = min(n_jobs_max)
+        logger.info(
+            f"Running up to {n_parallel_jobs} participants or sessions at the same"
+            " time based on the resources requested in the HPC config"
+        )
+        return n_parallel_jobs
+
+    def _get_results_generator(self, participants_sessions):
+        """Run in parallel processes if possible, otherwise in this process."""
+        participants_sessions = list(participants_sessions)
+        n_parallel_jobs = (
+            1 if len(participants_sessions) < 2 else self._get_n_parallel_jobs()
+        )
+        if n_parallel_jobs == 1:
+            # one at a time, even if n_jobs is greater than 1
+            return self._track_progress(
+                self._run_with_retries(
+                    participants_sessions, 1, self._run_single_attempt
+                ),
+                len(participants_sessions),
+            )
+        return self._run_in_subprocesses(
+            self._order_longest_first(participants_sessions), n_parallel_jobs
+        )
+
+    def _run_single_wrapper(self, participant_id, session_id):
+        """Run a single participant/session, retrying it if it fails."""
+        return next(
+            self._run_with_retries(
+                [(participant_id, session_id)], 1, self._run_single_attempt
+            )
+        )
+
+    def _run_single_attempt(
+        self, participant_id, session_id, n_failed_attempts: int = 0
+    ) -> tuple[bool, Any, Optional[float]]:
+        """
+        Run a single participant/session once and record its run time.
+
+        Returns (success, result, delay), where delay is the time to wait before
+        retrying the run (None if it should not be retried).
+        """
+        time_start = time.monotonic()
+        try:
+            result = self.run_single(participant_id, session_id)
+        except Exception as exception:
+            message = (
+                f"Error running {self.pipeline_name} {self.pipeline_version}"
+                f" on participant {participant_id}, session {session_id}"
+                f": {exception}"
+            )
+            n_failed_attempts += 1
+            if self._should_retry(exception, n_failed_attempts):
+                return False, None, self._get_retry_delay(message, n_failed_attempts)
+            if self.report_retryable and self._is_retryable(exception):
+                self._retryable.add((participant_id, session_id))
+            logger.error(message)
+            success, result = self._finish_single_run(
+                participant_id, session_id, False, None
+            )
+            return success, result, None
+
+        if not self.simulate:
+            self._run_times[(participant_id, session_id)] = (
+                time.monotonic() - time_start
+            )
+        success, result = self._finish_single_run(
+            participant_id, session_id, True, result
+        )
+        return success, result, None
+
+    def _finish_single_run(
+        self, participant_id, session_id, success: bool, result
+    ) -> tuple[bool, Any]:
+        """Handle the final outcome of a participant/session run (once retried)."""
+        return success, result
+
+    def _should_retry(self, exception: Exception, n_failed_attempts: int) -> bool:
+        """Check whether a failed run should be retried by this process."""
+        if self.report_retryable:
+            return False
+        if n_failed_attempts >= self.run_retry_config.MAX_ATTEMPTS:
+            return False
+        return self._is_retryable(exception)
+
+    def _is_retryable(self, exception: Exception) -> bool:
+        """
+        Check whether a failed run can be retried.
+
+        Only failed pipeline commands are retried (not e.g. invalid invocations or
+        runs that exceeded the time limit), and only if they match the exit codes
+        and/or stderr patterns of the retry configuration (if any).
+        """
+        if self.dry_run or self.simulate:
+            return False
+        if not isinstance(exception, ExecutionError) or isinstance(
+            exception, PipelineTimeoutError
+        ):
+            return False
+        cause = exception.__cause__
+        if isinstance(cause, subprocess.CalledProcessError):
+            return self.run_retry_config.matches(cause.returncode, cause.stderr)
+        return self.run_retry_config.matches(None, None)
+
+    def get_dpath_inputs(
+        self, participant_id: Optional[str], session_id: Optional[str]
+    ) -> Optional[Path]:
+        """
+        Get the input directory of a participant/session, if known.
+
+        The size of this directory is used to estimate which runs will take the
+        longest when no run time has been recorded yet.
+        """
+        return None
+
+    @staticmethod
+    def _get_dpath_participant_session(
+        dpath_parent: Path, participant_id: Optional[str], session_id: Optional[str]
+    ) -> Optional[Path]:
+        """Get the BIDS-style subdirectory of a participant (and session)."""
+        if participant_id is None:
+            return None
+        dpath = dpath_parent / participant_id_to_bids_participant_id(participant_id)
+        if session_id is not None:
+            dpath = dpath / session_id_to_bids_session_id(session_id)
+        return dpath
+
+    def _get_input_sizes(
+        self, participants_sessions: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], int]:
+        """Get the total size of the input files of participants/sessions."""
+        dpaths_inputs = {
+            participant_session: self.get_dpath_inputs(*participant_session)
+            for participant_session in participants_sessions
+        }
+        fpaths_by_dpath = fileops.list_files(
+            [dpath for dpath in dpaths_inputs.values() if dpath is not None],
+            n_jobs=self.n_jobs,
+        )
+
+        sizes = {}
+        for participant_session, dpath_inputs in dpaths_inputs.items():
+            size = 0
+            for fpath in fpaths_by_dpath.get(dpath_inputs, []):
+                try:
+                    size += os.stat(fpath).st_size
+                except OSError:
+                    # e.g. broken symlink
+                    continue
+            sizes[participant_session] = size
+        return sizes
+
+    def _order_longest_first(
+        self, participants_sessions: list[tuple[str, str]]
+    ) -> list[tuple[str, str]]:
+        """
+        Order participants/sessions so that the longest runs are started first.
+
+        Runs are ordered by their last recorded run time. Participants/sessions
+        without a recorded run time are put first (since they could be the longest),
+        ordered by the total size of their input files.
+        """
+        run_times = {}
+        if self.study.layout.fpath_run_times.exists():
+            with RunTimes(self.study.layout.fpath_run_times) as run_times_table:
+                run_times = run_times_table.load(
+                    self.pipeline_name, self.pipeline_version, self.pipeline_step
+                )
+
+        sizes = self._get_input_sizes(
+            [
+                participant_session
+                for participant_session in participants_sessions
+                if participant_session not in run_times
+            ]
+        )
+        logger.debug(
+            f"Ordering {len(participants_sessions)} participants or sessions by run"
+            f" time ({len(participants_sessions) - len(sizes)} with a recorded run"
+            " time)"
+        )
+
+        # sorted() is stable, so ties keep their original order
+        return sorted(
+            participants_sessions,
+            key=lambda participant_session: (
+                (0, -sizes[participant_session])
+                if participant_session in sizes
+                else (1, -run_times[participant_session])
+            ),
+        )
+
+    def _save_run_times(self):
+        """Add the run times recorded during the run to the run time table."""
+        if len(self._run_times) == 0 or self.dry_run:
+            return
+        with RunTimes(self.study.layout.fpath_run_times) as run_times_table:
+            run_times_table.update(
+                self._run_times,
+                self.pipeline_name,
+                self.pipeline_version,
+                self.pipeline_step,
+            )
+
+    @cached_property
+    def run_timeout(self) -> Optional[float]:
+        """Maximum run time (in seconds) for a single participant/session."""
+        if self.timeout is not None:
+            return self.timeout
+        return self.pipeline_step_config.TIMEOUT
+
+    @cached_property
+    def run_retry_config(self) -> RetryConfig:
+        """Retry configuration for failed participant/session runs."""
+        retry_config = self.pipeline_step_config.RETRY
+        if self.max_attempts is not None:
+            retry_config = retry_config.model_copy(
+                update={"MAX_ATTEMPTS": self.max_attempts}
+            )
+        return retry_config
+
+    def _run_locally(self, participants_sessions: list) -> None:
+        """Run pipeline locally and flag runs that exceeded the time limit."""
+        super()._run_locally(participants_sessions)
+        if len(self._timed_out) > 0:
+            logger.error(
+                f"{len(self._timed_out)} participants or sessions exceeded the time"
+                f" limit: {sorted(self._timed_out, key=str)}"
+            )
+            self.return_code = ReturnCode.PIPELINE_TIMEOUT
+        elif len(self._retryable) > 0:
+            self.return_code = ReturnCode.PIPELINE_RETRYABLE_ERROR
+
+    @cached_property
+    def dpath_logs_pipeline(self) -> Path:
+        """Directory with the log files of the pipeline runs."""
+        return self.generate_fpath_log().parent
+
     def _submit_hpc_job(self, participants_sessions):
         """Submit jobs to a HPC cluster for processing."""
         # generate the list of nipoppy commands for a shell array
@@ -137,6 +651,28 @@ class Runner(BasePipelineWorkflow, ABC):
         self.n_success += n_submitted_jobs
         self.n_total += len(job_array_commands)
 
+    @cached_property
+    def descriptor_template(self) -> JsonTemplate:
+        """Boutiques descriptor, parsed once for all participants/sessions."""
+        return self.compile_template_json(self.descriptor)
+
+    @cached_property
+    def invocation_template(self) -> JsonTemplate:
+        """Boutiques invocation, parsed once for all participants/sessions."""
+        return self.compile_template_json(self.invocation)
+
+    @cached_property
+    def container_config_template(self) -> JsonTemplate:
+        """Container configuration, parsed once for all participants/sessions."""
+        return self.compile_template_json(
+            self.pipeline_step_config.get_container_config().model_dump()
+        )
+
+    @cached_property
+    def boutiques_config_template(self) -> JsonTemplate:
+        """Boutiques configuration, parsed once for all participants/sessions."""
+        return self.compile_template_json(self.boutiques_config.model_dump())
+
     @cached_property
     def bosh_runner(self) -> BoshRunnerCallable:
         """Get the bosh exec command."""
@@ -158,6 +694,40 @@ class Runner(BasePipelineWorkflow, ABC):
             }
         return descriptor
 
+    def validate_descriptor(self, descriptor_str: str) -> tuple[dict, dict]:
+        """
+        Validate a Boutiques descriptor and get its invocation schema.
+
+        Results are memoized by descriptor content, so a descriptor that is the same
+        for every participant/session is only validated once per run.
+        """
+        if descriptor_str not in self._validated_descriptors:
+            logger.info("Validating the JSON descriptor")
+            bosh(["validate", descriptor_str])
+            descriptor = json.loads(descriptor_str)
+            invocation_schema = descriptor.get(
+                "invocation-schema"
+            ) or generateInvocationSchema(descriptor)
+            self._validated_descriptors[descriptor_str] = (
+                descriptor,
+                invocation_schema,
+            )
+        return self._validated_descriptors[descriptor_str]
+
+    def validate_invocation(self, invocation_str: str, descriptor_str: str):
+        """
+        Validate a Boutiques invocation against a descriptor.
+
+        This is equivalent to ``bosh invocation``, but reuses the parsed descriptor
+        and invocation schema from :meth:`validate_descriptor`.
+        """
+        descriptor, invocation_schema = self.validate_descriptor(descriptor_str)
+        logger.info("Validating the JSON invocation")
+        validateSchema(
+            invocation_schema,
+            addDefaultValues(descriptor, json.loads(invocation_str)),
+        )
+
     def launch_boutiques_run(
         self,
         participant_id: str,
@@ -177,7 +747,7 @@ class Runner(BasePipelineWorkflow, ABC):
         if TEMPLATE_REPLACE_PATTERN.search(self.descriptor["command-line"]):
             logger.info("Processing the JSON descriptor")
             descriptor_str = self.process_template_json(
-                self.descriptor,
+                self.descriptor_template,
                 participant_id=participant_id,
                 session_id=session_id,
                 objs=objs,
@@ -235,13 +805,12 @@ class Runner(BasePipelineWorkflow, ABC):
 
         # validate the descriptor
         logger.debug(f"Descriptor string: {descriptor_str}")
-        logger.info("Validating the JSON descriptor")
-        bosh(["validate", descriptor_str])
+        self.validate_descriptor(descriptor_str)
 
         # process and validate the invocation
         logger.info("Processing the JSON invocation")
         invocation_str = self.process_template_json(
-            self.invocation,
+            self.invocation_template,
             participant_id=participant_id,
             session_id=session_id,
             objs=objs,
@@ -249,21 +818,68 @@ class Runner(BasePipelineWorkflow, ABC):
             return_str=True,
         )
         logger.debug(f"Invocation string: {invocation_str}")
-        logger.info("Validating the JSON invocation")
-        bosh(["invocation", "-i", invocation_str, descriptor_str])
+        self.validate_invocation(invocation_str, descriptor_str)
+
+        if self.simulate_output is not None:
+            # generate the command line in-process, to be written in a single file
+            if descriptor_str not in self._command_line_simulators:
+                self._command_line_simulators[descriptor_str] = CommandLineSimulator(
+                    descriptor_str
+                )
+            command_line = self._command_line_simulators[
+                descriptor_str
+            ].get_command_line(invocation_str)
+            logger.info(f"Simulated command line: {command_line}")
+            self._simulated_command_lines[(participant_id, session_id)] = command_line
+            return descriptor_str, invocation_str
 
         # run as a subprocess so that stdout/error are captured in the log
         # by default, this will raise an exception if the command fails
-        self.bosh_runner(
-            invocation_str=invocation_str,
-            descriptor_str=descriptor_str,
-            bosh_exec_launch_args=bosh_exec_launch_args,
-            run_command=_run_command,
-            dry_run=self.dry_run,
-        )
+        run_command = _run_command
+        if self.run_timeout is not None:
+            run_command = functools.partial(_run_command, timeout=self.run_timeout)
+        try:
+            self.bosh_runner(
+                invocation_str=invocation_str,
+                descriptor_str=descriptor_str,
+                bosh_exec_launch_args=bosh_exec_launch_args,
+                run_command=run_command,
+                dry_run=self.dry_run,
+            )
+        except PipelineTimeoutError:
+            self._timed_out.add((participant_id, session_id))
+            raise
 
         return descriptor_str, invocation_str
 
+    def run_main(self):
+        """Run the pipeline and record run times/simulated command lines."""
+        super().run_main()
+        self._save_run_times()
+        if self.simulate_output is not None and self.write_subcohort is None:
+            self._write_simulated_command_lines()
+
+    def _write_simulated_command_lines(self):
+        """Write the simulated command lines of all participants/sessions to a file."""
+        lines = [
+            f"# {self.pipeline_name} {self.pipeline_version}, step {self.pipeline_step}"
+        ]
+        for (participant_id, session_id), command_line in sorted(
+            self._simulated_command_lines.items(),
+            key=lambda item: (item[0][0] or "", item[0][1] or ""),
+        ):
+            lines.append(f"# participant_id={participant_id} session_id={session_id}")
+            lines.append(command_line)
+
+        fpath_output = Path(self.simulate_output)
+        logger.info(
+            f"Writing {len(self._simulated_command_lines)} simulated command lines"
+            f" to {fpath_output}"
+        )
+        if not self.dry_run:
+            fileops.mkdir(fpath_output.parent)
+            fpath_output.write_text("\n".join(lines) + "\n")
+
     def process_container_config(
         self,
         participant_id: str,
@@ -278,10 +894,9 @@ class Runner(BasePipelineWorkflow, ABC):
         bind_paths = [self.study.layout.dpath_root] + bind_paths
 
         # get and process container config
-        container_config = self.pipeline_step_config.get_container_config()
         container_config = ContainerConfig(
             **self.process_template_json(
-                container_config.model_dump(),
+                self.container_config_template,
                 participant_id=participant_id,
                 session_id=session_id,
             )
@@ -291,7 +906,7 @@ class Runner(BasePipelineWorkflow, ABC):
         # get and process Boutiques config
         boutiques_config = BoutiquesConfig(
             **self.process_template_json(
-                self.boutiques_config.model_dump(),
+                self.boutiques_config_template,
                 participant_id=participant_id,
                 session_id=session_id,
             )
@@ -327,6 +942,6 @@ class Runner(BasePipelineWorkflow, ABC):
         if self.write_subcohort is not None:
             self._write_subcohort_to_file(participants_sessions)
         elif self.hpc:
-            self._submit_hpc_job(participants_sessions)
+            self._submit_hpc_job(self._order_longest_first(participants_sessions))
         else:
             self._run_locally(participants_sessions)
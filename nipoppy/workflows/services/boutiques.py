@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 from typing import Protocol
 
-from nipoppy.exceptions import ExecutionError
+from boutiques.localExec import LocalExecutor, addDefaultValues
+
+from nipoppy.exceptions import ExecutionError, PipelineTimeoutError
 from nipoppy.logger import get_logger
 from nipoppy.workflows.base import CommandRunner
 
@@ -87,7 +90,12 @@ def _run_bosh_command(
     try:
         run_command(command, quiet=True, dry_run=dry_run)
     except subprocess.CalledProcessError as exception:
-        raise ExecutionError(error_message_builder(exception.returncode))
+        # keep the original exception (exit code and stderr) for retries
+        raise ExecutionError(error_message_builder(exception.returncode)) from exception
+    except subprocess.TimeoutExpired as exception:
+        raise PipelineTimeoutError(
+            f"Pipeline execution timed out after {exception.timeout} seconds"
+        ) from exception
 
     return 0
 
@@ -201,3 +209,53 @@ def run_bosh_simulate(
         error_message_builder=error_message_builder,
     )
     return rv
+
+
+class _SimulationExecutor(LocalExecutor):
+    """Boutiques executor that generates command lines without writing any file."""
+
+    def _writeConfigurationFiles(self):
+        # configuration files (outputs with a file-template) are only needed to
+        # actually run the pipeline
+        pass
+
+
+class CommandLineSimulator:
+    """
+    Generate command lines for a Boutiques descriptor, in-process.
+
+    This gives the same command lines as ``bosh exec simulate``, but the descriptor
+    is only parsed once, no subprocess is started for each invocation and no
+    configuration file is written. This relies on internals of Boutiques'
+    ``LocalExecutor`` (hence the upper bound on the Boutiques version).
+    """
+
+    def __init__(self, descriptor_str: str):
+        # same options as bosh exec simulate
+        self.executor = _SimulationExecutor(
+            descriptor_str,
+            None,
+            {
+                "forcePathType": True,
+                "destroyTempScripts": True,
+                "changeUser": True,
+                "skipDataCollect": True,
+                "requireComplete": False,
+                "sandbox": False,
+            },
+        )
+
+    def get_command_line(self, invocation_str: str) -> str:
+        """
+        Get the command line for an invocation.
+
+        The invocation is assumed to have already been validated against the
+        descriptor.
+        """
+        self.executor.in_dict = addDefaultValues(
+            self.executor.desc_dict, json.loads(invocation_str)
+        )
+        # output file names are cached by the executor, reset them so that they are
+        # generated from this invocation
+        self.executor.out_dict = {}
+        return self.executor._generateCmdLineFromInDict()
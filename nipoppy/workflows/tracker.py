@@ -1,20 +1,128 @@
 """PipelineTracker workflow."""
 
-import tarfile
+from __future__ import annotations
+
+import csv
+import datetime
+import hashlib
+import json
+import os
+import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
+import pandas as pd
+import rich
+
 from nipoppy.config.pipeline_step import AnalysisLevelType
 from nipoppy.config.tracker import TrackerConfig
-from nipoppy.env import EXT_TAR, StrOrPathLike
-from nipoppy.exceptions import NipoppyError
+from nipoppy.console import _INDENT, CONSOLE_STDOUT
+from nipoppy.env import EXT_TAR, PipelineTypeEnum, StrOrPathLike
+from nipoppy.exceptions import (
+    NipoppyError,
+    ReturnCode,
+    WorkflowError,
+)
+from nipoppy.layout import DatasetLayout
 from nipoppy.logger import get_logger
 from nipoppy.tabular.processing_status import ProcessingStatusTable
+from nipoppy.utils import fileops
+from nipoppy.utils.file_index import PipelineStepIndex
+from nipoppy.utils.path_index import DirectoryIndex, PathIndex, compile_glob
+from nipoppy.utils.utils import get_pipeline_tag
+from nipoppy.workflows.base import BaseDatasetWorkflow
 from nipoppy.workflows.pipeline import BasePipelineWorkflow
+from nipoppy.workflows.services.hpc import HPCRunner
+
+# file name patterns for HPC job array tasks
+FNAME_SHARD = "shard-{}.tsv"
+FNAME_PARTIAL_STATUS = "status-{}.tsv"
+EXT_PARTIAL_FINGERPRINTS = ".fingerprints"
+FNAME_MERGE_LOCK = "merge.lock"
 
 logger = get_logger()
 
 
+class TrackerFingerprints(PipelineStepIndex):
+    """
+    SQLite table of the fingerprints of tracked participant-session outputs.
+
+    There is one fingerprint per participant, session, pipeline name, pipeline
+    version and pipeline step, from the last time its status was checked.
+    """
+
+    table_name = "fingerprints"
+    value_column = "fingerprint"
+
+
+def _get_mtime_ns(path: Path) -> str:
+    """Get the modification time of a path, or an empty string if it is missing."""
+    try:
+        return str(path.stat().st_mtime_ns)
+    except (FileNotFoundError, NotADirectoryError):
+        return ""
+
+
+def _get_path_to_fingerprint(relative_path: StrOrPathLike) -> Optional[Path]:
+    """
+    Get the path whose modification time reflects changes to a tracked path.
+
+    This is the path itself if it has no glob expressions, otherwise the deepest
+    directory containing all of its matches. Return None for the pipeline output
+    directory itself.
+    """
+    prefix, regex = compile_glob(Path(relative_path).as_posix())
+    if regex is None:
+        return Path(prefix)
+    dpath = Path(prefix.rstrip("/"))
+    return None if dpath == Path(".") else dpath
+
+
+def load_processing_status_table(fpath: Path) -> ProcessingStatusTable:
+    """Load the processing status file, or initialize an empty table."""
+    if fpath.exists():
+        try:
+            processing_status_table = ProcessingStatusTable.load(fpath)
+            logger.info(
+                f"Found existing processing status file with shape"
+                f" {processing_status_table.shape} at {fpath}"
+            )
+            return processing_status_table
+        except NipoppyError as e:
+            if "Error when validating the " in str(e):
+                logger.warning(
+                    f"Failed to load existing processing status file at {fpath}."
+                    " Generating a new processing status table."
+                    f"\nOriginal error:\n{e}"
+                )
+                return ProcessingStatusTable()
+            raise
+    logger.info("Initialized empty processing status table")
+    return ProcessingStatusTable()
+
+
+def update_processing_status_file(
+    records: list[dict], layout: DatasetLayout, dry_run: bool = False
+) -> ProcessingStatusTable:
+    """
+    Add or update records in the processing status file.
+
+    The file is reloaded while holding its lock, so that updates made by other
+    processes (e.g. concurrent HPC jobs) since it was last loaded are not lost.
+    """
+    with fileops.lock(layout.fpath_processing_status_lock, dry_run=dry_run):
+        processing_status_table = load_processing_status_table(
+            layout.fpath_processing_status
+        ).add_or_update_records(records)
+        processing_status_table.save_with_backup(
+            layout.fpath_processing_status, dry_run=dry_run
+        )
+    return processing_status_table
+
+
 class PipelineTracker(BasePipelineWorkflow):
     """Pipeline tracker."""
 
@@ -28,7 +136,13 @@ class PipelineTracker(BasePipelineWorkflow):
         pipeline_step: Optional[str] = None,
         participant_id: str = None,
         session_id: str = None,
+        use_subcohort: Optional[StrOrPathLike] = None,
+        hpc: Optional[str] = None,
+        shard_size: int = 100,
+        partial_status_file: Optional[StrOrPathLike] = None,
+        merge_only: bool = False,
         n_jobs: int = 1,
+        full: bool = False,
         fpath_layout: Optional[StrOrPathLike] = None,
         verbose: bool = False,
         dry_run: bool = False,
@@ -41,6 +155,8 @@ class PipelineTracker(BasePipelineWorkflow):
             pipeline_step=pipeline_step,
             participant_id=participant_id,
             session_id=session_id,
+            use_subcohort=use_subcohort,
+            hpc=hpc,
             n_jobs=n_jobs,
             fpath_layout=fpath_layout,
             verbose=verbose,
@@ -49,75 +165,244 @@ class PipelineTracker(BasePipelineWorkflow):
             _show_progress=True,
         )
 
+        self.shard_size = shard_size
+        self.partial_status_file = partial_status_file
+        self.merge_only = merge_only
+        self.full = full
+
+        # paths in the pipeline output directory, indexed on first use
+        self._output_index: Optional[DirectoryIndex] = None
+        self._output_index_lock = threading.Lock()
+
+        # templated tracker configs and output fingerprints
+        # of the participants/sessions to check in this run
+        self._tracker_configs: dict[tuple[str, str], TrackerConfig] = {}
+        self.fingerprints: dict[tuple[str, str], Optional[str]] = {}
+
+        # number of participants/sessions skipped because their outputs have not
+        # changed since they were last tracked
+        self.n_skipped = 0
+
+    @property
+    def output_index(self) -> DirectoryIndex:
+        """
+        Index of the paths in the pipeline output directory.
+
+        Each top-level entry of the directory is traversed only once (in parallel,
+        see ``n_jobs``) and the tracker config paths of all participants/sessions
+        are matched against the index instead of the filesystem.
+        """
+        with self._output_index_lock:
+            if self._output_index is None:
+                self._output_index = DirectoryIndex(
+                    self.dpath_pipeline_output, n_jobs=self.n_jobs
+                )
+        return self._output_index
+
     def run_setup(self):
         """Load/initialize the processing status file."""
         rv = super().run_setup()
-        if self.study.layout.fpath_processing_status.exists():
-            try:
-                self.processing_status_table = ProcessingStatusTable.load(
-                    self.study.layout.fpath_processing_status
+        self.processing_status_table = load_processing_status_table(
+            self.study.layout.fpath_processing_status
+        )
+
+        # HPC job array tasks only write partial results
+        if self.partial_status_file is None:
+            self.merge_partial_results()
+        return rv
+
+    @cached_property
+    def dpath_partial_results(self) -> Path:
+        """Directory for the shards and partial results of HPC job array tasks."""
+        return (
+            self.study.layout.dpath_work
+            / self.name
+            / get_pipeline_tag(
+                pipeline_name=self.pipeline_name,
+                pipeline_version=self.pipeline_version,
+                pipeline_step=self.pipeline_step,
+            )
+        )
+
+    def merge_partial_results(self):
+        """
+        Add the results of completed HPC job array tasks to the processing status file.
+
+        The records of all partial status files are added to the processing status
+        file in a single update, which reloads the file while holding its lock so
+        that concurrent updates (e.g. from other job array tasks) are not lost.
+        Partial results and their shards are deleted after they are merged.
+        """
+        if not self._get_fpaths_partial_status():
+            return
+        # partial results are merged (and removed) by one process at a time
+        with fileops.lock(
+            self.dpath_partial_results / FNAME_MERGE_LOCK, dry_run=self.dry_run
+        ):
+            fpaths_partial_status, records, fingerprints = self.load_partial_results()
+            if len(fpaths_partial_status) == 0:
+                return
+            self.processing_status_table = update_processing_status_file(
+                records, self.study.layout, dry_run=self.dry_run
+            )
+            if self.dry_run:
+                return
+            self._store_fingerprints(fingerprints)
+            self.remove_partial_results(fpaths_partial_status)
+
+    def _get_fpaths_partial_status(self) -> list[Path]:
+        """Get the partial status files written by completed HPC job array tasks."""
+        if not self.dpath_partial_results.exists():
+            return []
+        return sorted(
+            self.dpath_partial_results.glob(f"*/{FNAME_PARTIAL_STATUS.format('*')}")
+        )
+
+    def _get_fpaths_pending_shards(self) -> list[Path]:
+        """Get the shards of HPC job array tasks that have not written results."""
+        if not self.dpath_partial_results.exists():
+            return []
+        return [
+            fpath_shard
+            for fpath_shard in sorted(
+                self.dpath_partial_results.glob(f"*/{FNAME_SHARD.format('*')}")
+            )
+            if not fpath_shard.with_name(
+                FNAME_PARTIAL_STATUS.format(
+                    fpath_shard.name[
+                        len(FNAME_SHARD.format("")) - len(".tsv") : -len(".tsv")
+                    ]
                 )
-                logger.info(
-                    f"Found existing processing status file with shape"
-                    f" {self.processing_status_table.shape}"
-                    f" at {self.study.layout.fpath_processing_status}"
+            ).exists()
+        ]
+
+    def load_partial_results(
+        self,
+    ) -> tuple[list[Path], list[dict], dict[tuple[str, str], str]]:
+        """
+        Load the results of completed HPC job array tasks.
+
+        Return the paths of the partial status files, their processing status
+        records and the fingerprints of the participants/sessions they contain.
+        """
+        fpaths_partial_status = self._get_fpaths_partial_status()
+        if len(fpaths_partial_status) == 0:
+            return [], [], {}
+
+        records = []
+        fingerprints = {}
+        for fpath_partial_status in fpaths_partial_status:
+            records.extend(
+                ProcessingStatusTable.load(fpath_partial_status).to_dict(
+                    orient="records"
                 )
-            except NipoppyError as e:
-                if "Error when validating the " in str(e):
-                    logger.warning(
-                        "Failed to load existing processing status file at "
-                        f"{self.study.layout.fpath_processing_status}. Generating a new"
-                        f" processing status table.\nOriginal error:\n{e}"
-                    )
-                    self.processing_status_table = ProcessingStatusTable()
-        else:
-            self.processing_status_table = ProcessingStatusTable()
-            logger.info("Initialized empty processing status table")
-        return rv
+            )
+            fpath_fingerprints = Path(
+                f"{fpath_partial_status}{EXT_PARTIAL_FINGERPRINTS}"
+            )
+            if fpath_fingerprints.exists():
+                with fpath_fingerprints.open(newline="") as file:
+                    for participant_id, session_id, fingerprint in csv.reader(
+                        file, delimiter="\t"
+                    ):
+                        fingerprints[(participant_id, session_id)] = fingerprint
+        logger.info(
+            f"Merging {len(fpaths_partial_status)} partial status files from HPC jobs"
+            f" in {self.dpath_partial_results}"
+        )
+        return fpaths_partial_status, records, fingerprints
+
+    def remove_partial_results(self, fpaths_partial_status: list[Path]):
+        """Remove partial status files that have been merged, and their shards."""
+        # remove the results and shards of merged tasks
+        for fpath_partial_status in fpaths_partial_status:
+            i_shard = fpath_partial_status.name[
+                len(FNAME_PARTIAL_STATUS.format("")) - len(".tsv") : -len(".tsv")
+            ]
+            for fpath in (
+                fpath_partial_status,
+                Path(f"{fpath_partial_status}{EXT_PARTIAL_FINGERPRINTS}"),
+                fpath_partial_status.with_name(FNAME_SHARD.format(i_shard)),
+            ):
+                if fpath.exists():
+                    fileops.rm(fpath)
+        # submissions are done once all their shards have been merged
+        for dpath_shards in {fpath.parent for fpath in fpaths_partial_status}:
+            if not any(dpath_shards.glob(FNAME_SHARD.format("*"))):
+                fileops.rm(dpath_shards)
+
+    def remove_pending_shards(self):
+        """
+        Remove the shards of HPC job array tasks that did not write results.
+
+        This is for tasks that failed (e.g. because they ran out of time or memory),
+        so that their participants/sessions can be submitted again.
+        """
+        fpaths_shards = self._get_fpaths_pending_shards()
+        if len(fpaths_shards) == 0:
+            logger.info("No shards left by failed HPC jobs")
+            return
+        logger.warning(
+            f"Removing {len(fpaths_shards)} shard(s) of HPC jobs that did not write"
+            f" results in {self.dpath_partial_results}"
+        )
+        for fpath_shard in fpaths_shards:
+            fileops.rm(fpath_shard, dry_run=self.dry_run)
+        if self.dry_run:
+            return
+        for dpath_shards in {fpath.parent for fpath in fpaths_shards}:
+            if not any(dpath_shards.iterdir()):
+                fileops.rm(dpath_shards)
+
+    def _get_tarred_index(self, relative_dpath_tarred: StrOrPathLike) -> PathIndex:
+        """Index the member names of a tarball, using its member listing file."""
+        fpath_tarball = self.dpath_pipeline_output / f"{relative_dpath_tarred}{EXT_TAR}"
+        if not fpath_tarball.exists():
+            return PathIndex([])
+        # the listing file is created for tarballs that do not have one yet
+        return PathIndex(fileops.load_tar_members(fpath_tarball, dry_run=self.dry_run))
 
     def check_status(
         self,
         relative_paths: StrOrPathLike,
         relative_dpath_tarred: Optional[StrOrPathLike] = None,
+        output_index: Optional[DirectoryIndex] = None,
     ):
-        """Check the processing status based on a list of expected paths."""
-        # collect list of paths in tarball if it exists
-        paths_tarred = []
-        if relative_dpath_tarred is not None:
-            fpath_tarball = (
-                self.dpath_pipeline_output / f"{relative_dpath_tarred}{EXT_TAR}"
-            )
-            if fpath_tarball.exists():
-                with tarfile.open(fpath_tarball) as tarball:
-                    paths_tarred = tarball.getnames()
+        """
+        Check the processing status based on a list of expected paths.
+
+        Paths are matched against ``output_index`` if given (e.g. a fresh index for
+        outputs that may have changed), otherwise against the shared output index.
+        """
+        if output_index is None:
+            output_index = self.output_index
+
+        # paths in the tarball (if it exists), only loaded if needed
+        tarred_index: Optional[PathIndex] = None
 
         for relative_path in relative_paths:
             relative_path = Path(relative_path)
             logger.debug(f"Checking path {self.dpath_pipeline_output / relative_path}")
 
-            matches_glob = list(self.dpath_pipeline_output.glob(str(relative_path)))
+            matches_glob = output_index.match(relative_path.as_posix())
             logger.debug(f"Matches: {matches_glob}")
 
             # also check tarball paths if applicable/needed
+            matches_tarred = []
             if (not matches_glob) and (relative_dpath_tarred is not None):
-                # NOTE
-                # The behaviour of Path.match() is not exactly the same as glob
-                # but it should be good enough for now. What we really need is
-                # Path.full_match(), but that was only introduced in Python 3.13
-                matches_tarred = [
-                    path_tarred
-                    for path_tarred in paths_tarred
-                    if Path(path_tarred).match(
-                        str(
-                            Path(relative_path).relative_to(
-                                Path(relative_dpath_tarred).parent
-                            )
-                        ),
+                if tarred_index is None:
+                    tarred_index = self._get_tarred_index(relative_dpath_tarred)
+                try:
+                    # member names are relative to the parent of the tarred directory
+                    matches_tarred = tarred_index.match(
+                        relative_path.relative_to(
+                            Path(relative_dpath_tarred).parent
+                        ).as_posix()
                     )
-                ]
+                except ValueError:
+                    # path is not in the tarred directory
+                    pass
                 logger.debug(f"Matches in tarball: {matches_tarred}")
-            else:
-                matches_tarred = []
 
             if not (matches_glob or matches_tarred):
                 return ProcessingStatusTable.status_fail
@@ -140,20 +425,147 @@ class PipelineTracker(BasePipelineWorkflow):
         """Tracker: level is always participant-session."""
         return list(participants_sessions)
 
-    def run_single(self, participant_id: str, session_id: str):
-        """Run tracker on a single participant/session."""
-        # replace template strings in the tracker config
-        tracker_config = TrackerConfig(
-            **self.process_template_json(
-                self.tracker_config.model_dump(mode="json"),
-                participant_id=participant_id,
-                session_id=session_id,
+    def get_tracker_config(self, participant_id: str, session_id: str) -> TrackerConfig:
+        """Get the tracker config with template strings replaced."""
+        key = (participant_id, session_id)
+        if key not in self._tracker_configs:
+            self._tracker_configs[key] = TrackerConfig(
+                **self.process_template_json(
+                    self.tracker_config_template,
+                    participant_id=participant_id,
+                    session_id=session_id,
+                )
+            )
+        return self._tracker_configs[key]
+
+    def get_fingerprint(self, participant_id: str, session_id: str) -> Optional[str]:
+        """
+        Summarize the state of the outputs of a participant/session.
+
+        The fingerprint combines the tracker config with the modification times of
+        the participant-session directory, of its direct children, of its tarball
+        (if any) and of the tracked paths. For tracked paths with glob expressions,
+        the directory before the first glob expression is used instead, unless it
+        is the pipeline output directory itself (which changes whenever a
+        participant/session is added). Changes that do not affect any of these
+        modification times (e.g. below a ``**`` glob expression) are not detected:
+        use ``full`` to check all participants/sessions. Return None if the tracker
+        config does not specify a participant-session directory.
+        """
+        tracker_config = self.get_tracker_config(participant_id, session_id)
+        relative_dpath = tracker_config.PARTICIPANT_SESSION_DIR
+        if relative_dpath is None:
+            return None
+
+        dpath = self.dpath_pipeline_output / relative_dpath
+        states = [_get_mtime_ns(dpath)]
+        try:
+            with os.scandir(dpath) as entries:
+                states.extend(
+                    sorted(
+                        f"{entry.name}:{entry.stat(follow_symlinks=False).st_mtime_ns}"
+                        for entry in entries
+                    )
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        states.append(
+            _get_mtime_ns(self.dpath_pipeline_output / f"{relative_dpath}{EXT_TAR}")
+        )
+        for relative_path in sorted(
+            {
+                relative_path
+                for relative_path in map(_get_path_to_fingerprint, tracker_config.PATHS)
+                if relative_path is not None
+            }
+        ):
+            states.append(
+                f"{relative_path}:"
+                f"{_get_mtime_ns(self.dpath_pipeline_output / relative_path)}"
+            )
+
+        digest = hashlib.md5("\n".join(states).encode()).hexdigest()
+        return f"{self._tracker_config_hash}:{digest}"
+
+    @cached_property
+    def _tracker_config_hash(self) -> str:
+        """Hash of the tracker config, so that editing it invalidates fingerprints."""
+        return hashlib.md5(
+            json.dumps(
+                self.tracker_config.model_dump(mode="json"), sort_keys=True
+            ).encode()
+        ).hexdigest()
+
+    def skip_unchanged(
+        self, participants_sessions: Iterable[tuple[str, str]]
+    ) -> list[tuple[str, str]]:
+        """
+        Filter out participants/sessions whose outputs have not changed.
+
+        Participants/sessions are skipped if their output fingerprint is the same
+        as when they were last tracked and they are in the processing status table.
+        Nothing is skipped if ``full`` is True, but fingerprints are still computed.
+        """
+        fingerprints_previous = {}
+        if not self.full and self.study.layout.fpath_tracker_fingerprints.exists():
+            with TrackerFingerprints(
+                self.study.layout.fpath_tracker_fingerprints
+            ) as fingerprints_table:
+                fingerprints_previous = fingerprints_table.load(
+                    self.pipeline_name, self.pipeline_version, self.pipeline_step
+                )
+        participants_sessions_tracked = set(
+            self.processing_status_table.get_tracked_participants_sessions(
+                pipeline_name=self.pipeline_name,
+                pipeline_version=self.pipeline_version,
+                pipeline_step=self.pipeline_step,
             )
         )
 
+        participants_sessions_to_check = []
+        for participant_session in participants_sessions:
+            fingerprint = self.get_fingerprint(*participant_session)
+            if (
+                fingerprint is not None
+                and fingerprints_previous.get(participant_session) == fingerprint
+                and participant_session in participants_sessions_tracked
+            ):
+                self.n_skipped += 1
+                continue
+            self.fingerprints[participant_session] = fingerprint
+            participants_sessions_to_check.append(participant_session)
+
+        if self.n_skipped > 0:
+            logger.info(
+                f"Skipping {self.n_skipped} participants or sessions whose outputs"
+                " have not changed since they were last tracked (use --full to check"
+                " them anyway)"
+            )
+        return participants_sessions_to_check
+
+    def _handle_execution_strategy(self, participants_sessions):
+        """Only check participants/sessions whose outputs have changed."""
+        participants_sessions = self.skip_unchanged(participants_sessions)
+        if self.hpc:
+            self._submit_hpc_job(participants_sessions)
+        else:
+            super()._handle_execution_strategy(participants_sessions)
+
+    def run_single(
+        self,
+        participant_id: str,
+        session_id: str,
+        output_index: Optional[DirectoryIndex] = None,
+    ):
+        """Run tracker on a single participant/session."""
+        # replace template strings in the tracker config
+        tracker_config = self.get_tracker_config(participant_id, session_id)
+
         # check status and update processing status file
         status = self.check_status(
-            tracker_config.PATHS, tracker_config.PARTICIPANT_SESSION_DIR
+            tracker_config.PATHS,
+            tracker_config.PARTICIPANT_SESSION_DIR,
+            output_index=output_index,
         )
         logger.debug(f"Status: {status}")
         processing_status_record = {
@@ -168,19 +580,461 @@ class PipelineTracker(BasePipelineWorkflow):
 
     def _update_status_file(self):
         """Update the processing status file."""
-        self.processing_status_table = (
-            self.processing_status_table.add_or_update_records(self.run_single_results)
+        # the file is reloaded so that records written by other processes
+        # (e.g. processing runners with --track) since setup are kept
+        self.processing_status_table = update_processing_status_file(
+            list(self.run_single_results), self.study.layout, dry_run=self.dry_run
         )
         logger.info(
             "New/updated processing status table shape: "
             f"{self.processing_status_table.shape}"
         )
-        self.processing_status_table.save_with_backup(
-            self.study.layout.fpath_processing_status,
+
+    def _get_fingerprints_to_store(self) -> dict[tuple[str, str], str]:
+        """Get the fingerprints of the participants/sessions that were checked."""
+        fingerprints = {}
+        for record in self.run_single_results:
+            participant_session = (
+                record[ProcessingStatusTable.col_participant_id],
+                record[ProcessingStatusTable.col_session_id],
+            )
+            if self.fingerprints.get(participant_session) is not None:
+                fingerprints[participant_session] = self.fingerprints[
+                    participant_session
+                ]
+        return fingerprints
+
+    def _store_fingerprints(self, fingerprints: dict[tuple[str, str], str]):
+        """Add or replace fingerprints in the fingerprint database."""
+        if self.dry_run or not fingerprints:
+            return
+        with TrackerFingerprints(
+            self.study.layout.fpath_tracker_fingerprints
+        ) as fingerprints_table:
+            fingerprints_table.update(
+                fingerprints,
+                self.pipeline_name,
+                self.pipeline_version,
+                self.pipeline_step,
+            )
+
+    def _write_partial_results(self):
+        """Write the results of an HPC job array task to a partial status file."""
+        fpath_partial_status = Path(self.partial_status_file)
+        partial_status_table = ProcessingStatusTable().add_or_update_records(
+            self.run_single_results
+        )
+        logger.info(f"Writing partial status file {fpath_partial_status}")
+        if self.dry_run:
+            return
+
+        # fingerprints first, since the status file marks the task as completed
+        with Path(f"{fpath_partial_status}{EXT_PARTIAL_FINGERPRINTS}").open(
+            "w", newline=""
+        ) as file:
+            csv.writer(file, delimiter="\t").writerows(
+                (participant_id, session_id, fingerprint)
+                for (
+                    participant_id,
+                    session_id,
+                ), fingerprint in self._get_fingerprints_to_store().items()
+            )
+        # write to a temporary file first so that partial files are never merged
+        fpath_partial_status.parent.mkdir(parents=True, exist_ok=True)
+        fpath_tmp = fpath_partial_status.with_name(f".{fpath_partial_status.name}")
+        partial_status_table.to_csv(
+            fpath_tmp, sep=partial_status_table.sep, index=False
+        )
+        fpath_tmp.replace(fpath_partial_status)
+
+    @cached_property
+    def hpc_runner(self) -> HPCRunner:
+        """Get the HPC runner service."""
+        return HPCRunner(
+            hpc_cluster=self.hpc,
+            hpc_config=self.hpc_config,
+            subcommand="track-processing",
+            dpath_root=self.dpath_root,
+            dpath_hpc=self.study.layout.dpath_hpc,
+            pipeline_name=self.pipeline_name,
+            pipeline_version=self.pipeline_version,
+            pipeline_step=self.pipeline_step,
+            preamble=self.study.config.HPC_PREAMBLE,
+            queue_limit=self.study.config.HPC_QUEUE_LIMIT,
+            fpath_layout=self.fpath_layout,
+            verbose=self.verbose,
+        )
+
+    def _submit_hpc_job(self, participants_sessions: list[tuple[str, str]]):
+        """
+        Submit a job array to track participants/sessions on an HPC cluster.
+
+        Participants/sessions are split into shards of ``shard_size`` pairs, each
+        tracked by a job array task that writes a partial status file and merges
+        it into the processing status file when it finishes. Participants/sessions
+        in the shards of tasks from previous submissions that have not finished (or
+        failed) are not submitted again.
+        """
+        participants_sessions = list(participants_sessions)
+        fpaths_pending_shards = self._get_fpaths_pending_shards()
+        if len(fpaths_pending_shards) > 0:
+            pending = set()
+            for fpath_shard in fpaths_pending_shards:
+                pending.update(
+                    map(
+                        tuple,
+                        pd.read_csv(
+                            fpath_shard, header=None, sep="\t", dtype=str
+                        ).values.tolist(),
+                    )
+                )
+            n_before = len(participants_sessions)
+            participants_sessions = [
+                participant_session
+                for participant_session in participants_sessions
+                if tuple(participant_session) not in pending
+            ]
+            logger.warning(
+                f"Skipping {n_before - len(participants_sessions)} participant(s)/"
+                "session(s) already submitted in HPC jobs that have not written"
+                " results yet. If these jobs failed, rerun with --merge-only to"
+                " discard their shards"
+            )
+            if len(participants_sessions) == 0:
+                return
+
+        dpath_shards = self.dpath_partial_results / datetime.datetime.now().strftime(
+            "%Y%m%d_%H%M%S_%f"
+        )
+        fileops.mkdir(dpath_shards, dry_run=self.dry_run)
+
+        job_array_commands = []
+        for i_start in range(0, len(participants_sessions), self.shard_size):
+            i_shard = f"{i_start // self.shard_size + 1:04d}"
+            fpath_shard = dpath_shards / FNAME_SHARD.format(i_shard)
+            if not self.dry_run:
+                pd.DataFrame(
+                    participants_sessions[i_start : i_start + self.shard_size]
+                ).to_csv(fpath_shard, header=False, index=False, sep="\t")
+            extra_options = {
+                "--use-subcohort": fpath_shard,
+                "--partial-status-file": dpath_shards
+                / FNAME_PARTIAL_STATUS.format(i_shard),
+            }
+            if self.n_jobs != 1:
+                extra_options["--n-jobs"] = self.n_jobs
+            command = self.hpc_runner.generate_cli_command(
+                participant_id=self.participant_id,
+                session_id=self.session_id,
+                extra_flags=["--full"] if self.full else None,
+                extra_options=extra_options,
+            )
+            job_array_commands.append(shlex.join(command))
+
+        n_submitted_jobs = self.hpc_runner.submit(
+            job_name=f"{self.name}-"
+            + get_pipeline_tag(
+                pipeline_name=self.pipeline_name,
+                pipeline_version=self.pipeline_version,
+                pipeline_step=self.pipeline_step,
+            ),
+            job_array_commands=job_array_commands,
+            # tasks are not for a single participant/session
+            participant_ids=[""] * len(job_array_commands),
+            session_ids=[""] * len(job_array_commands),
+            dpath_work=dpath_shards,
+            dpath_hpc_logs=self.study.layout.dpath_logs / self.dname_hpc_logs,
+            fname_hpc_error=self.fname_hpc_error,
+            fname_job_script=self.fname_job_script,
+            pipeline_name=self.pipeline_name,
+            pipeline_version=self.pipeline_version,
+            pipeline_step=self.pipeline_step,
             dry_run=self.dry_run,
         )
 
+        # shards that were not submitted (e.g. because of the queue limit)
+        # are tracked again in the next submission
+        for i_shard in range(n_submitted_jobs or 0, len(job_array_commands)):
+            fileops.rm(
+                dpath_shards / FNAME_SHARD.format(f"{i_shard + 1:04d}"),
+                dry_run=self.dry_run,
+            )
+        if not self.dry_run and not any(dpath_shards.glob(FNAME_SHARD.format("*"))):
+            fileops.rm(dpath_shards)
+
+        # for logging
+        self.n_success += n_submitted_jobs
+        self.n_total += len(job_array_commands)
+
+    def _log_summary_message(self):
+        """Log a summary message."""
+        if self.merge_only:
+            logger.success("Merged the results of completed HPC jobs")
+        elif self.n_total == 0 and self.n_skipped > 0:
+            logger.success(
+                "No participants or sessions to check: outputs have not changed since"
+                " they were last tracked"
+            )
+        else:
+            super()._log_summary_message()
+
     def run_main(self):
         """Run the tracker workflow."""
+        if self.merge_only:
+            # completed results are merged in run_setup
+            self.remove_pending_shards()
+            self._log_summary_message()
+            return
         super().run_main()
+        if self.hpc:
+            # results are written by the HPC jobs
+            return
+        if self.partial_status_file is not None:
+            self._write_partial_results()
+            # so that results do not wait for the next run of the tracker
+            self.merge_partial_results()
+            return
         self._update_status_file()
+        # only after the processing status file has been saved
+        self._store_fingerprints(self._get_fingerprints_to_store())
+
+
+class MultiPipelineTracker(BaseDatasetWorkflow):
+    """
+    Tracker for multiple pipelines at once.
+
+    The dataset files and the processing status file are loaded once and shared by
+    the trackers of all the pipelines, and the processing status file is saved
+    once at the end. Participants/sessions of all pipelines are checked in a
+    single pool of ``n_jobs`` workers.
+    """
+
+    progress_bar_description = PipelineTracker.progress_bar_description
+
+    def __init__(
+        self,
+        dpath_root: StrOrPathLike,
+        pipeline_names: Optional[list[str]] = None,
+        all_installed: bool = False,
+        participant_id: str = None,
+        session_id: str = None,
+        use_subcohort: Optional[StrOrPathLike] = None,
+        n_jobs: int = 1,
+        full: bool = False,
+        fpath_layout: Optional[StrOrPathLike] = None,
+        verbose: bool = False,
+        dry_run: bool = False,
+    ):
+        super().__init__(
+            dpath_root=dpath_root,
+            name="track_processing",
+            fpath_layout=fpath_layout,
+            verbose=verbose,
+            dry_run=dry_run,
+            _skip_logfile=True,
+        )
+        if not all_installed and not pipeline_names:
+            raise WorkflowError(
+                "Pipeline names must be specified if not tracking all installed"
+                " pipelines"
+            )
+        self.pipeline_names = pipeline_names
+        self.all_installed = all_installed
+        self.participant_id = participant_id
+        self.session_id = session_id
+        self.use_subcohort = use_subcohort
+        self.n_jobs = n_jobs
+        self.full = full
+
+        self.trackers: list[PipelineTracker] = []
+
+    def _create_tracker(
+        self,
+        pipeline_name: str,
+        pipeline_version: Optional[str] = None,
+        pipeline_step: Optional[str] = None,
+    ) -> PipelineTracker:
+        """Create a tracker for a pipeline step that shares this workflow's study."""
+        tracker = PipelineTracker(
+            dpath_root=self.dpath_root,
+            pipeline_name=pipeline_name,
+            pipeline_version=pipeline_version,
+            pipeline_step=pipeline_step,
+            participant_id=self.participant_id,
+            session_id=self.session_id,
+            use_subcohort=self.use_subcohort,
+            n_jobs=self.n_jobs,
+            full=self.full,
+            fpath_layout=self.fpath_layout,
+            verbose=self.verbose,
+            dry_run=self.dry_run,
+        )
+        tracker.study = self.study
+        return tracker
+
+    def get_trackers(self) -> list[PipelineTracker]:
+        """
+        Get a tracker for each pipeline step to track.
+
+        All installed versions of processing pipelines are tracked if
+        ``all_installed`` is True, otherwise the latest version of each pipeline in
+        ``pipeline_names``. Steps without a tracker config file are skipped.
+        """
+        if self.all_installed:
+            installed_pipelines = self.study.get_installed_pipelines()[
+                PipelineTypeEnum.PROCESSING.value
+            ]
+            pipelines = [
+                (pipeline_name, pipeline_version)
+                for pipeline_name, pipeline_versions in installed_pipelines.items()
+                for pipeline_version in pipeline_versions
+            ]
+        else:
+            pipelines = [(pipeline_name, None) for pipeline_name in self.pipeline_names]
+
+        trackers = []
+        for pipeline_name, pipeline_version in pipelines:
+            tracker = self._create_tracker(pipeline_name, pipeline_version)
+            tracker.check_pipeline_version()
+            for step_config in tracker.pipeline_config.STEPS:
+                if step_config.TRACKER_CONFIG_FILE is None:
+                    logger.debug(
+                        f"No tracker config file for pipeline {pipeline_name}"
+                        f" {tracker.pipeline_version}, step {step_config.NAME}"
+                    )
+                    continue
+                trackers.append(
+                    self._create_tracker(
+                        pipeline_name, tracker.pipeline_version, step_config.NAME
+                    )
+                )
+        return trackers
+
+    def run_setup(self):
+        """Load the processing status file and set up the tracker of each pipeline."""
+        rv = super().run_setup()
+        self.processing_status_table = load_processing_status_table(
+            self.study.layout.fpath_processing_status
+        )
+
+        self.trackers = self.get_trackers()
+        if len(self.trackers) == 0:
+            raise WorkflowError(
+                "No pipeline steps with a tracker config file found in"
+                f" {self.study.layout.dpath_pipelines}"
+            )
+        logger.info(
+            f"Tracking {len(self.trackers)} pipeline steps: "
+            + ", ".join(self._get_tag(tracker) for tracker in self.trackers)
+        )
+        for tracker in self.trackers:
+            tracker._check_pipeline_variables()
+            tracker.curation_status_table = self.curation_status_table
+        return rv
+
+    @staticmethod
+    def _get_tag(tracker: PipelineTracker) -> str:
+        return get_pipeline_tag(
+            pipeline_name=tracker.pipeline_name,
+            pipeline_version=tracker.pipeline_version,
+            pipeline_step=tracker.pipeline_step,
+        )
+
+    def _get_results_generator(self, tasks: list[tuple[PipelineTracker, str, str]]):
+        """Check participants/sessions of all pipelines in a single worker pool."""
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            results_generator = executor.map(
+                lambda task: task[0]._run_single_wrapper(task[1], task[2]), tasks
+            )
+            if len(tasks) != 0:
+                results_generator = rich.progress.track(
+                    results_generator,
+                    description=f"{' ' * _INDENT}{self.progress_bar_description}",
+                    total=len(tasks),
+                    console=CONSOLE_STDOUT,
+                )
+            yield from results_generator
+
+    def run_main(self):
+        """Track all pipelines and update the processing status file once."""
+        # partial results of HPC job array tasks
+        partial_results = {}
+        for tracker in self.trackers:
+            partial_results[tracker] = tracker.load_partial_results()
+            self.processing_status_table = (
+                self.processing_status_table.add_or_update_records(
+                    partial_results[tracker][1]
+                )
+            )
+
+        tasks = []
+        for tracker in self.trackers:
+            participants_sessions = tracker.get_participants_sessions_to_run(
+                tracker.participant_id, tracker.session_id
+            )
+            if tracker.use_subcohort is not None:
+                participants_sessions = tracker._filter_by_subcohort(
+                    participants_sessions
+                )
+            tracker.processing_status_table = self.processing_status_table
+            tasks.extend(
+                (tracker, participant_id, session_id)
+                for participant_id, session_id in tracker.skip_unchanged(
+                    participants_sessions
+                )
+            )
+            tracker.run_single_results = []
+
+        for (tracker, _, _), (success, result) in zip(
+            tasks, self._get_results_generator(tasks)
+        ):
+            tracker.n_total += 1
+            if success:
+                tracker.n_success += 1
+                tracker.run_single_results.append(result)
+
+        records = []
+        for tracker in self.trackers:
+            records.extend(partial_results[tracker][1])
+            records.extend(tracker.run_single_results)
+            logger.info(
+                f"{self._get_tag(tracker)}: checked {tracker.n_success} out of"
+                f" {tracker.n_total} participants or sessions"
+                f" ({tracker.n_skipped} unchanged)"
+            )
+            if tracker.n_success != tracker.n_total:
+                self.return_code = ReturnCode.PARTIAL_SUCCESS
+
+        # the file is reloaded so that records written by other processes
+        # (e.g. processing runners with --track) since setup are kept
+        self.processing_status_table = update_processing_status_file(
+            records, self.study.layout, dry_run=self.dry_run
+        )
+        logger.info(
+            "New/updated processing status table shape: "
+            f"{self.processing_status_table.shape}"
+        )
+        if self.dry_run:
+            return
+
+        # only after the processing status file has been saved
+        with TrackerFingerprints(
+            self.study.layout.fpath_tracker_fingerprints
+        ) as fingerprints_table:
+            for tracker in self.trackers:
+                _, _, fingerprints = partial_results[tracker]
+                fingerprints.update(tracker._get_fingerprints_to_store())
+                fingerprints_table.update(
+                    fingerprints,
+                    tracker.pipeline_name,
+                    tracker.pipeline_version,
+                    tracker.pipeline_step,
+                )
+        for tracker in self.trackers:
+            tracker.remove_partial_results(partial_results[tracker][0])
+
+        logger.success(
+            f"Tracked {len(self.trackers)} pipeline steps"
+            f" ({sum(tracker.n_total for tracker in self.trackers)} participants or"
+            " sessions checked)"
+        )
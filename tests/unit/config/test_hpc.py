@@ -3,7 +3,8 @@
 import pytest
 from pydantic import ValidationError
 
-from nipoppy.config.hpc import HpcConfig
+from nipoppy.config.hpc import HpcConfig, parse_memory
+from nipoppy.exceptions import ConfigError
 
 
 @pytest.mark.parametrize(
@@ -38,3 +39,43 @@ def test_none_value():
 def test_reserved_keywords_error(data):
     with pytest.raises(ValidationError, match="Reserved key .* found"):
         HpcConfig(**data)
+
+
+@pytest.mark.parametrize(
+    "memory,expected",
+    [
+        ("16G", 16 * 1024**3),
+        ("16gb", 16 * 1024**3),
+        ("500M", 500 * 1024**2),
+        ("500", 500 * 1024**2),
+        ("1.5T", int(1.5 * 1024**4)),
+        ("2048K", 2 * 1024**2),
+    ],
+)
+def test_parse_memory(memory, expected):
+    assert parse_memory(memory) == expected
+
+
+@pytest.mark.parametrize("memory", ["", "G", "16X", "-1G", "16 GiB"])
+def test_parse_memory_invalid(memory):
+    with pytest.raises(ConfigError, match="Invalid memory amount"):
+        parse_memory(memory)
+
+
+@pytest.mark.parametrize(
+    "data,expected_cores,expected_memory",
+    [
+        ({"CORES": 4, "MEMORY": "16G"}, 4, 16 * 1024**3),
+        ({"CORES": "", "MEMORY": ""}, None, None),
+        ({}, None, None),
+    ],
+)
+def test_get_cores_memory(data, expected_cores, expected_memory):
+    config = HpcConfig(**data)
+    assert config.get_cores() == expected_cores
+    assert config.get_memory() == expected_memory
+
+
+def test_get_cores_invalid():
+    with pytest.raises(ConfigError, match="Invalid number of cores"):
+        HpcConfig(CORES="many").get_cores()
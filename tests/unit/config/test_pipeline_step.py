@@ -12,6 +12,7 @@ from nipoppy.config.pipeline_step import (
     BidsPipelineStepConfig,
     ExtractionPipelineStepConfig,
     ProcPipelineStepConfig,
+    RetryConfig,
 )
 
 FIELDS_STEP_BASE = [
@@ -21,6 +22,8 @@ FIELDS_STEP_BASE = [
     "HPC_CONFIG_FILE",
     "CONTAINER_CONFIG",
     "ANALYSIS_LEVEL",
+    "TIMEOUT",
+    "RETRY",
 ]
 
 FIELDS_STEP_PROC = FIELDS_STEP_BASE + [
@@ -213,3 +216,53 @@ def test_update_status_analysis_level(update_status, analysis_level, expect_erro
             UPDATE_STATUS=update_status,
             ANALYSIS_LEVEL=analysis_level,
         )
+
+
+@pytest.mark.parametrize(
+    "timeout,expect_error", [(None, False), (3600, False), (0, True), (-1, True)]
+)
+def test_timeout(timeout, expect_error):
+    with pytest.raises(ValueError) if expect_error else nullcontext():
+        assert ProcPipelineStepConfig(TIMEOUT=timeout).TIMEOUT == timeout
+
+
+def test_retry_default():
+    assert ProcPipelineStepConfig().RETRY.MAX_ATTEMPTS == 1
+
+
+@pytest.mark.parametrize(
+    "data",
+    [{"MAX_ATTEMPTS": 0}, {"BACKOFF_SECONDS": -1}, {"BACKOFF_FACTOR": 0.5}],
+)
+def test_retry_invalid(data):
+    with pytest.raises(ValueError):
+        RetryConfig(**data)
+
+
+def test_retry_invalid_pattern():
+    with pytest.raises(ValueError, match="Invalid regular expression"):
+        RetryConfig(STDERR_PATTERNS=["("])
+
+
+@pytest.mark.parametrize("n_failed_attempts,expected", [(1, 10), (2, 30), (3, 90)])
+def test_retry_get_delay(n_failed_attempts, expected):
+    retry_config = RetryConfig(BACKOFF_SECONDS=10, BACKOFF_FACTOR=3)
+    assert retry_config.get_delay(n_failed_attempts) == expected
+
+
+@pytest.mark.parametrize(
+    "exit_codes,stderr_patterns,returncode,stderr,expected",
+    [
+        ([], [], 1, None, True),
+        ([137], [], 137, None, True),
+        ([137], [], 1, "No space left on device", False),
+        ([], ["No space left"], 1, "error\nNo space left on device", True),
+        ([], ["^Stale file handle"], 1, "error\nStale file handle", True),
+        ([], ["No space left"], 1, None, False),
+        ([137], ["No space left"], 1, "No space left on device", True),
+        ([137], ["No space left"], 2, "Segmentation fault", False),
+    ],
+)
+def test_retry_matches(exit_codes, stderr_patterns, returncode, stderr, expected):
+    retry_config = RetryConfig(EXIT_CODES=exit_codes, STDERR_PATTERNS=stderr_patterns)
+    assert retry_config.matches(returncode, stderr) == expected
@@ -318,6 +318,36 @@ def test_generate_missing_paths(tmp_path: Path):
     assert table[CurationStatusTable.col_in_bids].all()
 
 
+@pytest.mark.parametrize(
+    "fname,expected_status",
+    [
+        ("01_BL.zip", True),
+        ("01_BL.tar.gz", True),
+        ("01_BL.TGZ", True),
+        ("01_BL.txt", False),
+        ("01_BL", False),
+    ],
+)
+def test_generate_archive(tmp_path: Path, fname: str, expected_status: bool):
+    manifest = prepare_dataset(participants_and_sessions_manifest={"01": ["BL"]})
+    dicom_dir_map = DicomDirMap(
+        data={
+            DicomDirMap.col_participant_id: ["01"],
+            DicomDirMap.col_session_id: ["BL"],
+            DicomDirMap.col_participant_dicom_dir: [fname],
+        }
+    )
+    (tmp_path / fname).touch()
+
+    table = generate_curation_status_table(
+        manifest=manifest,
+        dicom_dir_map=dicom_dir_map,
+        dpath_downloaded=tmp_path,
+    )
+
+    assert table[CurationStatusTable.col_in_pre_reorg].all() == expected_status
+
+
 def test_curation_status_table_generation_no_session(
     tmp_path: Path,
 ):
@@ -421,6 +421,60 @@ def test_get_completed_participants_sessions(
     ] == expected
 
 
+def test_get_tracked_participants_sessions():
+    processing_status_table = ProcessingStatusTable(
+        [
+            [
+                "S01",
+                "BL",
+                "pipeline1",
+                "1.0",
+                "step1",
+                ProcessingStatusTable.status_fail,
+            ],
+            [
+                "S01",
+                "M12",
+                "pipeline1",
+                "1.0",
+                "step1",
+                ProcessingStatusTable.status_success,
+            ],
+            [
+                "S02",
+                "BL",
+                "pipeline1",
+                "1.0",
+                "step2",
+                ProcessingStatusTable.status_fail,
+            ],
+            [
+                "S02",
+                "BL",
+                "pipeline2",
+                "1.0",
+                "step1",
+                ProcessingStatusTable.status_fail,
+            ],
+        ],
+        columns=[
+            ProcessingStatusTable.col_participant_id,
+            ProcessingStatusTable.col_session_id,
+            ProcessingStatusTable.col_pipeline_name,
+            ProcessingStatusTable.col_pipeline_version,
+            ProcessingStatusTable.col_pipeline_step,
+            ProcessingStatusTable.col_status,
+        ],
+    ).validate()
+
+    assert [
+        tuple(x)
+        for x in processing_status_table.get_tracked_participants_sessions(
+            pipeline_name="pipeline1", pipeline_version="1.0", pipeline_step="step1"
+        )
+    ] == [("S01", "BL"), ("S01", "M12")]
+
+
 @pytest.mark.parametrize(
     "fpath",
     [
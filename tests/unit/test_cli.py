@@ -32,6 +32,7 @@ COMMAND_WORKFLOW_MAP = {
     "init": ("nipoppy.workflows.dataset_init", "InitWorkflow"),
     "track-curation": ("nipoppy.workflows.track_curation", "TrackCurationWorkflow"),
     "reorg": ("nipoppy.workflows.dicom_reorg", "DicomReorgWorkflow"),
+    "index-dicoms": ("nipoppy.workflows.dicom_index", "DicomIndexWorkflow"),
     "bidsify": ("nipoppy.workflows.bids_conversion", "BIDSificationRunner"),
     "process": ("nipoppy.workflows.processing_runner", "ProcessingRunner"),
     "track-processing": ("nipoppy.workflows.tracker", "PipelineTracker"),
@@ -94,7 +95,15 @@ def _assert_command_success(args):
     ), f"Command failed: {args}\n{result.output}"
 
 
-@pytest.mark.parametrize("args", [["--invalid-arg"], ["invalid_command"]])
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--invalid-arg"],
+        ["invalid_command"],
+        ["reorg", "--dataset", ".", "--n-jobs", "0"],
+        ["index-dicoms", "--dataset", ".", "--n-jobs", "0"],
+    ],
+)
 def test_cli_invalid(args):
     """Test that a fake command does not exist."""
     result = runner.invoke(cli, args, catch_exceptions=False)
@@ -210,6 +219,16 @@ def test_cli_gui_visibility(monkeypatch, trogon_installed):
             ],
             "nipoppy.workflows.dicom_reorg.DicomReorgWorkflow",
         ),
+        (
+            [
+                "index-dicoms",
+                "--dataset",
+                "[mocked_dir]",
+                "--n-jobs",
+                "2",
+            ],
+            "nipoppy.workflows.dicom_index.DicomIndexWorkflow",
+        ),
         (
             [
                 "bidsify",
@@ -236,6 +255,90 @@ def test_cli_gui_visibility(monkeypatch, trogon_installed):
             ],
             "nipoppy.workflows.processing_runner.ProcessingRunner",
         ),
+        (
+            [
+                "process",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--track",
+            ],
+            "nipoppy.workflows.processing_runner.ProcessingRunner",
+        ),
+        (
+            [
+                "process",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--simulate-output",
+                "commands.txt",
+            ],
+            "nipoppy.workflows.processing_runner.ProcessingRunner",
+        ),
+        (
+            [
+                "process",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--n-jobs",
+                "4",
+            ],
+            "nipoppy.workflows.processing_runner.ProcessingRunner",
+        ),
+        (
+            [
+                "extract",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--max-cores",
+                "16",
+                "--max-mem",
+                "64G",
+            ],
+            "nipoppy.workflows.extractor.ExtractionRunner",
+        ),
+        (
+            [
+                "bidsify",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--timeout",
+                "3600",
+            ],
+            "nipoppy.workflows.bids_conversion.BIDSificationRunner",
+        ),
+        (
+            [
+                "process",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--max-attempts",
+                "3",
+            ],
+            "nipoppy.workflows.processing_runner.ProcessingRunner",
+        ),
+        (
+            [
+                "bidsify",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--report-retryable",
+            ],
+            "nipoppy.workflows.bids_conversion.BIDSificationRunner",
+        ),
         (
             [
                 "track-processing",
@@ -245,9 +348,56 @@ def test_cli_gui_visibility(monkeypatch, trogon_installed):
                 "my_pipeline",
                 "--pipeline-version",
                 "1.0",
+                "--full",
             ],
             "nipoppy.workflows.tracker.PipelineTracker",
         ),
+        (
+            [
+                "track-processing",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--hpc",
+                "slurm",
+                "--shard-size",
+                "50",
+            ],
+            "nipoppy.workflows.tracker.PipelineTracker",
+        ),
+        (
+            [
+                "track-processing",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--merge-only",
+            ],
+            "nipoppy.workflows.tracker.PipelineTracker",
+        ),
+        (
+            [
+                "track-processing",
+                "--dataset",
+                "[mocked_dir]",
+                "--pipeline",
+                "my_pipeline",
+                "--pipeline",
+                "my_other_pipeline",
+            ],
+            "nipoppy.workflows.tracker.MultiPipelineTracker",
+        ),
+        (
+            [
+                "track-processing",
+                "--dataset",
+                "[mocked_dir]",
+                "--all-installed",
+            ],
+            "nipoppy.workflows.tracker.MultiPipelineTracker",
+        ),
         (
             [
                 "extract",
@@ -363,6 +513,20 @@ def test_cli_command(
     _assert_command_success(command)
 
 
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["--pipeline", "a", "--pipeline", "b", "--pipeline-version", "1.0"],
+        ["--all-installed", "--hpc", "slurm"],
+        ["--all-installed", "--merge-only"],
+    ],
+)
+def test_cli_track_processing_invalid(args: list[str], tmp_path: Path):
+    result = runner.invoke(cli, ["track-processing", "--dataset", str(tmp_path), *args])
+    assert result.exit_code != ReturnCode.SUCCESS
+
+
 def test_context_manager_no_exception(mocker):
     """Test that the context manager exits with SUCCESS when no exception occurs."""
     workflow = mocker.Mock()
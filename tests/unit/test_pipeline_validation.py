@@ -27,6 +27,8 @@ from nipoppy.pipeline_validation import (
     _check_tracker_config_file,
     _load_pipeline_config_file,
     check_pipeline_bundle,
+    check_pipeline_bundle_cached,
+    get_bundle_digest,
 )
 from tests.conftest import DPATH_TEST_DATA
 
@@ -433,3 +435,78 @@ def test_check_pipeline_bundle(
     )
     mocked_check_self_contained.assert_called_once_with(dpath_bundle, fpaths)
     mocked_check_no_subdirectories.assert_called_once_with(dpath_bundle)
+
+
+@pytest.fixture()
+def dpath_bundle(tmp_path: Path) -> Path:
+    dpath_bundle = tmp_path / "bundle_dir"
+    dpath_bundle.mkdir()
+    (dpath_bundle / "config.json").write_text("{}")
+    (dpath_bundle / "descriptor.json").write_text("{}")
+    return dpath_bundle
+
+
+def test_get_bundle_digest(dpath_bundle: Path):
+    digest = get_bundle_digest(dpath_bundle)
+    assert get_bundle_digest(dpath_bundle) == digest
+    assert get_bundle_digest(dpath_bundle, strict=True) != digest
+
+    (dpath_bundle / "descriptor.json").write_text('{"modified": true}')
+    assert get_bundle_digest(dpath_bundle) != digest
+
+
+def test_get_bundle_digest_versions(
+    dpath_bundle: Path, mocker: pytest_mock.MockFixture
+):
+    digest = get_bundle_digest(dpath_bundle)
+    mocker.patch("nipoppy.pipeline_validation.__version__", "other")
+    assert get_bundle_digest(dpath_bundle) != digest
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_check_pipeline_bundle_cached(
+    dpath_bundle: Path,
+    tmp_path: Path,
+    valid_config_data,
+    mocker: pytest_mock.MockFixture,
+    dry_run: bool,
+):
+    config = BasePipelineConfig(**valid_config_data)
+    mocked_check_pipeline_bundle = mocker.patch(
+        "nipoppy.pipeline_validation.check_pipeline_bundle", return_value=config
+    )
+    dpath_cache = tmp_path / "cache"
+
+    assert (
+        check_pipeline_bundle_cached(dpath_bundle, dpath_cache, dry_run=dry_run)
+        == config
+    )
+    mocked_check_pipeline_bundle.assert_called_once_with(dpath_bundle, strict=False)
+
+    # validation is skipped for an unchanged bundle (unless nothing was recorded)
+    check_pipeline_bundle_cached(dpath_bundle, dpath_cache, dry_run=dry_run)
+    assert mocked_check_pipeline_bundle.call_count == (2 if dry_run else 1)
+
+    # but not after a file is modified
+    (dpath_bundle / "config.json").write_text('{"modified": true}')
+    check_pipeline_bundle_cached(dpath_bundle, dpath_cache, dry_run=dry_run)
+    assert mocked_check_pipeline_bundle.call_count == (3 if dry_run else 2)
+
+
+def test_check_pipeline_bundle_cached_error(
+    dpath_bundle: Path, tmp_path: Path, mocker: pytest_mock.MockFixture
+):
+    mocker.patch(
+        "nipoppy.pipeline_validation.check_pipeline_bundle",
+        side_effect=ConfigError("Invalid bundle"),
+    )
+    dpath_cache = tmp_path / "cache"
+    for _ in range(2):
+        with pytest.raises(ConfigError, match="Invalid bundle"):
+            check_pipeline_bundle_cached(dpath_bundle, dpath_cache)
+    assert not dpath_cache.exists()
+
+
+def test_check_pipeline_bundle_cached_missing_bundle(tmp_path: Path):
+    with pytest.raises(FileOperationError, match="not found"):
+        check_pipeline_bundle_cached(tmp_path / "missing", tmp_path / "cache")
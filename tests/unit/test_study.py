@@ -1,6 +1,7 @@
 """Tests for the Study class."""
 
 from enum import Enum
+from pathlib import Path
 
 import pytest
 import pytest_mock
@@ -161,3 +162,77 @@ def test_get_installed_pipelines(
     assert all(
         not isinstance(pipeline_type, Enum) for pipeline_type in installed_pipelines
     )
+
+
+def _write_pipeline_config(study: Study, name: str, version: str) -> Path:
+    pipeline_config = BasePipelineConfig(
+        NAME=name,
+        VERSION=version,
+        PIPELINE_TYPE=PipelineTypeEnum.PROCESSING,
+        SCHEMA_VERSION=get_current_schema_version(ConfigType.PIPELINE),
+    )
+    fpath_config = (
+        study.layout.get_dpath_pipeline_bundle(
+            PipelineTypeEnum.PROCESSING, name, version
+        )
+        / study.layout.fname_pipeline_config
+    )
+    fpath_config.parent.mkdir(parents=True, exist_ok=True)
+    fpath_config.write_text(pipeline_config.model_dump_json())
+    return fpath_config
+
+
+def test_get_pipeline_bundles_index(study: Study, mocker: pytest_mock.MockFixture):
+    study.layout.dpath_nipoppy.mkdir(parents=True)
+    fpath_config1 = _write_pipeline_config(study, "pipeline1", "0.1.0")
+    fpath_config2 = _write_pipeline_config(study, "pipeline2", "0.2.0")
+    spy = mocker.spy(study, "_load_pipeline_name_and_version")
+
+    expected = [
+        (PipelineTypeEnum.PROCESSING, "pipeline1", "0.1.0", fpath_config1),
+        (PipelineTypeEnum.PROCESSING, "pipeline2", "0.2.0", fpath_config2),
+    ]
+    assert study.get_pipeline_bundles() == expected
+    assert study.layout.fpath_pipeline_index.exists()
+    assert spy.call_count == 2
+
+    # later calls do not access the index
+    mocked_index = mocker.patch("nipoppy.study.PipelineConfigIndex")
+    assert study.get_pipeline_bundles() == expected
+    mocked_index.assert_not_called()
+    mocker.stopall()
+    spy = mocker.spy(study, "_load_pipeline_name_and_version")
+
+    # configs are not loaded again if they have not changed
+    assert study.get_pipeline_bundles(refresh=True) == expected
+    spy.assert_not_called()
+
+    # modified and deleted configs
+    fpath_config2.write_text(fpath_config2.read_text().replace("0.2.0", "0.2.10"))
+    fpath_config1.unlink()
+    assert study.get_pipeline_bundles(refresh=True) == [
+        (PipelineTypeEnum.PROCESSING, "pipeline2", "0.2.10", fpath_config2)
+    ]
+    assert spy.call_count == 1
+
+
+def test_get_pipeline_bundles_no_index(study: Study):
+    fpath_config = _write_pipeline_config(study, "pipeline1", "0.1.0")
+    assert study.get_pipeline_bundles() == [
+        (PipelineTypeEnum.PROCESSING, "pipeline1", "0.1.0", fpath_config)
+    ]
+    # the index should not be created outside of a dataset
+    assert not study.layout.fpath_pipeline_index.exists()
+
+
+def test_add_to_pipeline_index(study: Study, mocker: pytest_mock.MockFixture):
+    study.layout.dpath_nipoppy.mkdir(parents=True)
+    assert study.get_pipeline_bundles() == []
+    fpath_config = _write_pipeline_config(study, "pipeline1", "0.1.0")
+    study.add_to_pipeline_index(fpath_config, "pipeline1", "0.1.0")
+    spy = mocker.spy(study, "_load_pipeline_name_and_version")
+
+    assert study.get_pipeline_bundles() == [
+        (PipelineTypeEnum.PROCESSING, "pipeline1", "0.1.0", fpath_config)
+    ]
+    spy.assert_not_called()
@@ -0,0 +1,144 @@
+"""Tests for the DICOM utilities."""
+
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from nipoppy.exceptions import FileOperationError
+from nipoppy.utils.dicom import DicomHeaderIndex, read_dicom_header
+from tests.conftest import DPATH_TEST_DATA
+
+
+@pytest.mark.parametrize(
+    "fpath,series_description",
+    [
+        (DPATH_TEST_DATA / "dicom-not_derived.dcm", "localizer"),
+        (DPATH_TEST_DATA / "dicom-derived.dcm", "Postprocessing"),
+    ],
+)
+def test_read_dicom_header(fpath, series_description):
+    dcm_info = read_dicom_header(fpath)
+    assert dcm_info.SeriesDescription == series_description
+    assert "ImageType" in dcm_info
+    assert "PixelData" not in dcm_info
+
+
+def test_read_dicom_header_specific_tags():
+    dcm_info = read_dicom_header(
+        DPATH_TEST_DATA / "dicom-derived.dcm", tags=["ImageType"]
+    )
+    assert "ImageType" in dcm_info
+    assert "SeriesDescription" not in dcm_info
+
+
+def test_read_dicom_header_fileobj():
+    with (DPATH_TEST_DATA / "dicom-derived.dcm").open("rb") as file:
+        dcm_info = read_dicom_header(file)
+    assert "DERIVED" in dcm_info.ImageType
+
+
+@pytest.fixture()
+def dpath_dicoms(tmp_path: Path) -> Path:
+    dpath_dicoms = tmp_path / "pre_reorg"
+    (dpath_dicoms / "01").mkdir(parents=True)
+    shutil.copyfile(
+        DPATH_TEST_DATA / "dicom-derived.dcm", dpath_dicoms / "01" / "derived.dcm"
+    )
+    shutil.copyfile(
+        DPATH_TEST_DATA / "dicom-not_derived.dcm",
+        dpath_dicoms / "01" / "not_derived.dcm",
+    )
+    return dpath_dicoms
+
+
+def _update_index(index: DicomHeaderIndex, fpaths: list[Path]):
+    stale, _ = index.get_stale(fpaths)
+    for fpath, mtime_ns, size in stale:
+        index.update(fpath, mtime_ns, size, dcm_info=read_dicom_header(fpath))
+    index.commit()
+
+
+def test_index_not_open(tmp_path: Path):
+    index = DicomHeaderIndex(tmp_path / "index.sqlite", tmp_path)
+    with pytest.raises(FileOperationError, match="Index is not open"):
+        index.commit()
+
+
+def test_index_get_stale(tmp_path: Path, dpath_dicoms: Path):
+    fpaths = sorted(dpath_dicoms.rglob("*.dcm"))
+    with DicomHeaderIndex(tmp_path / "index.sqlite", dpath_dicoms) as index:
+        stale, n_up_to_date = index.get_stale(fpaths)
+        assert [fpath for fpath, _, _ in stale] == fpaths
+        assert n_up_to_date == 0
+
+        _update_index(index, fpaths)
+        assert index.get_stale(fpaths) == ([], 2)
+
+        # modified file
+        with fpaths[0].open("ab") as file:
+            file.write(b"\0")
+        stale, n_up_to_date = index.get_stale(fpaths)
+        assert [fpath for fpath, _, _ in stale] == [fpaths[0]]
+        assert n_up_to_date == 1
+
+
+def test_index_paths_relative(tmp_path: Path, dpath_dicoms: Path):
+    fpath_index = tmp_path / "index.sqlite"
+    with DicomHeaderIndex(fpath_index, dpath_dicoms) as index:
+        _update_index(index, sorted(dpath_dicoms.rglob("*.dcm")))
+
+    with sqlite3.connect(fpath_index) as connection:
+        paths = connection.execute(
+            f"SELECT path FROM {DicomHeaderIndex.table_name} ORDER BY path"
+        ).fetchall()
+    assert paths == [("01/derived.dcm",), ("01/not_derived.dcm",)]
+
+
+def test_index_get_headers(tmp_path: Path, dpath_dicoms: Path):
+    fpath_derived = dpath_dicoms / "01" / "derived.dcm"
+    fpath_not_derived = dpath_dicoms / "01" / "not_derived.dcm"
+    fpath_not_indexed = dpath_dicoms / "01" / "not_indexed.dcm"
+    shutil.copyfile(fpath_derived, fpath_not_indexed)
+    with DicomHeaderIndex(tmp_path / "index.sqlite", dpath_dicoms) as index:
+        _update_index(index, [fpath_derived, fpath_not_derived])
+
+        headers = index.get_headers(
+            [fpath_derived, fpath_not_derived, fpath_not_indexed]
+        )
+
+    assert set(headers) == {fpath_derived, fpath_not_derived}
+    dcm_info = headers[fpath_derived]
+    assert "DERIVED" in dcm_info.ImageType
+    assert (
+        dcm_info.SeriesDescription == read_dicom_header(fpath_derived).SeriesDescription
+    )
+    assert "DERIVED" not in headers[fpath_not_derived].ImageType
+
+
+def test_index_get_headers_skips_modified_and_errors(
+    tmp_path: Path, dpath_dicoms: Path
+):
+    fpath_derived = dpath_dicoms / "01" / "derived.dcm"
+    fpath_not_derived = dpath_dicoms / "01" / "not_derived.dcm"
+    with DicomHeaderIndex(tmp_path / "index.sqlite", dpath_dicoms) as index:
+        _update_index(index, [fpath_derived])
+        stat = fpath_not_derived.stat()
+        index.update(
+            fpath_not_derived, stat.st_mtime_ns, stat.st_size, error="Cannot read"
+        )
+        index.commit()
+
+        with fpath_derived.open("ab") as file:
+            file.write(b"\0")
+
+        assert index.get_headers([fpath_derived, fpath_not_derived]) == {}
+
+
+def test_index_remove_missing(tmp_path: Path, dpath_dicoms: Path):
+    fpaths = sorted(dpath_dicoms.rglob("*.dcm"))
+    with DicomHeaderIndex(tmp_path / "index.sqlite", dpath_dicoms) as index:
+        _update_index(index, fpaths)
+        assert index.remove_missing(fpaths[:1]) == 1
+        assert index.get_stale(fpaths)[1] == 1
@@ -0,0 +1,101 @@
+"""Tests for the file indexes."""
+
+from pathlib import Path
+
+import pytest
+import pytest_mock
+
+from nipoppy.utils import fileops
+from nipoppy.utils.file_index import (
+    FileHashIndex,
+    PipelineConfigIndex,
+    PipelineStepIndex,
+)
+
+
+@pytest.fixture()
+def fpaths(tmp_path: Path) -> list[Path]:
+    fpaths = [tmp_path / "data" / "a.txt", tmp_path / "data" / "b.txt"]
+    for fpath in fpaths:
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        fpath.write_text(fpath.name)
+    return fpaths
+
+
+def _update_index(index: FileHashIndex, fpaths: list[Path]):
+    stale, _ = index.get_stale(fpaths)
+    for fpath, mtime_ns, size in stale:
+        index.update(fpath, mtime_ns, size, fileops.hash_file(fpath))
+    index.commit()
+
+
+def test_hash_index_get_hashes(tmp_path: Path, fpaths: list[Path]):
+    with FileHashIndex(tmp_path / "index.sqlite", tmp_path / "data") as index:
+        assert index.get_hashes(fpaths) == {}
+        _update_index(index, fpaths)
+        assert index.get_hashes(fpaths) == {
+            fpath: fileops.hash_file(fpath) for fpath in fpaths
+        }
+
+
+def test_hash_index_persistent(tmp_path: Path, fpaths: list[Path]):
+    fpath_index = tmp_path / "index.sqlite"
+    with FileHashIndex(fpath_index, tmp_path / "data") as index:
+        _update_index(index, fpaths)
+
+    with FileHashIndex(fpath_index, tmp_path / "data") as index:
+        assert set(index.get_hashes(fpaths)) == set(fpaths)
+
+
+def test_hash_index_modified_file(tmp_path: Path, fpaths: list[Path]):
+    with FileHashIndex(tmp_path / "index.sqlite", tmp_path / "data") as index:
+        _update_index(index, fpaths)
+        fpaths[0].write_text("modified content")
+        assert set(index.get_hashes(fpaths)) == {fpaths[1]}
+
+
+def test_hash_index_other_algorithm(
+    tmp_path: Path, fpaths: list[Path], mocker: pytest_mock.MockerFixture
+):
+    with FileHashIndex(tmp_path / "index.sqlite", tmp_path / "data") as index:
+        _update_index(index, fpaths)
+        mocker.patch("nipoppy.utils.fileops.HASH_ALGORITHM", "other")
+        assert index.get_hashes(fpaths) == {}
+
+
+def test_pipeline_config_index_get_pipelines(tmp_path: Path, fpaths: list[Path]):
+    with PipelineConfigIndex(tmp_path / "index.sqlite", tmp_path / "data") as index:
+        for fpath in fpaths:
+            stat = fpath.stat()
+            index.update(fpath, stat.st_mtime_ns, stat.st_size, fpath.stem, "1.0")
+        index.commit()
+
+        # digests are stored with the hash algorithm
+        (digest,) = index.connection.execute(
+            f"SELECT digest FROM {index.table_name}"
+        ).fetchone()
+        assert digest.startswith(f"{fileops.HASH_ALGORITHM}:")
+
+        # modified files are still returned
+        fpaths[0].write_text("modified content")
+        assert index.get_pipelines(fpaths) == {
+            fpaths[0]: ("a", "1.0"),
+            fpaths[1]: ("b", "1.0"),
+        }
+
+
+def test_pipeline_step_index_missing_ids(tmp_path: Path):
+    class _Index(PipelineStepIndex):
+        table_name = "step_values"
+        value_column = "value"
+        value_type = "REAL"
+
+    fpath = tmp_path / "values.sqlite"
+    with _Index(fpath) as index:
+        index.update({(None, None): 1.5, ("01", None): 2.0}, "pipeline", "1.0", "step")
+
+    with _Index(fpath) as index:
+        assert index.load("pipeline", "1.0", "step") == {
+            (None, None): 1.5,
+            ("01", None): 2.0,
+        }
@@ -1,4 +1,9 @@
 import errno
+import io
+import os
+import tarfile
+import threading
+import time
 from contextlib import nullcontext
 from pathlib import Path
 
@@ -156,6 +161,72 @@ class TestMakeDir:
             fileops.mkdir(existing_file)
 
 
+class TestListFiles:
+    @pytest.mark.parametrize("n_jobs", [1, 4])
+    def test_list_files(self, tmp_path: Path, n_jobs: int):
+        """Test list_files lists files in nested subdirectories of each directory."""
+        create_dummy_directory_structure(tmp_path / "dir1")
+        (tmp_path / "dir2" / "a" / "b").mkdir(parents=True)
+        (tmp_path / "dir2" / "a" / "b" / "file.txt").touch()
+
+        fpaths_by_dpath = fileops.list_files(
+            [tmp_path / "dir1", tmp_path / "dir2"], n_jobs=n_jobs
+        )
+        assert fpaths_by_dpath == {
+            tmp_path
+            / "dir1": [
+                tmp_path / "dir1" / "subdir1" / "file1.txt",
+                tmp_path / "dir1" / "subdir1" / "file2.txt",
+                tmp_path / "dir1" / "subdir2" / "file3.txt",
+            ],
+            tmp_path / "dir2": [tmp_path / "dir2" / "a" / "b" / "file.txt"],
+        }
+
+    def test_list_files_symlinked_dir_not_followed(self, tmp_path: Path):
+        """Test list_files does not list files under symlinked directories."""
+        create_dummy_directory_structure(tmp_path / "dir")
+        (tmp_path / "dir" / "link").symlink_to(tmp_path / "dir" / "subdir1")
+        assert len(fileops.list_files([tmp_path / "dir"])[tmp_path / "dir"]) == 3
+
+    def test_list_files_include_dirs(self, tmp_path: Path):
+        """Test list_files can also list (possibly symlinked) subdirectories."""
+        create_dummy_directory_structure(tmp_path / "dir")
+        (tmp_path / "dir" / "link").symlink_to(tmp_path / "dir" / "subdir1")
+        assert fileops.list_files([tmp_path / "dir"], include_dirs=True)[
+            tmp_path / "dir"
+        ] == [
+            tmp_path / "dir" / "link",
+            tmp_path / "dir" / "subdir1",
+            tmp_path / "dir" / "subdir1" / "file1.txt",
+            tmp_path / "dir" / "subdir1" / "file2.txt",
+            tmp_path / "dir" / "subdir2",
+            tmp_path / "dir" / "subdir2" / "file3.txt",
+        ]
+
+    def test_list_files_follow_symlinks(self, tmp_path: Path):
+        """Test list_files can traverse symlinked directories, without looping."""
+        create_dummy_directory_structure(tmp_path / "real")
+        (tmp_path / "dir").mkdir()
+        (tmp_path / "dir" / "link").symlink_to(tmp_path / "real")
+        (tmp_path / "real" / "subdir1" / "loop").symlink_to(tmp_path / "real")
+        assert fileops.list_files(
+            [tmp_path / "dir"], include_dirs=True, follow_symlinks=True
+        )[tmp_path / "dir"] == [
+            tmp_path / "dir" / "link",
+            tmp_path / "dir" / "link" / "subdir1",
+            tmp_path / "dir" / "link" / "subdir1" / "file1.txt",
+            tmp_path / "dir" / "link" / "subdir1" / "file2.txt",
+            tmp_path / "dir" / "link" / "subdir1" / "loop",
+            tmp_path / "dir" / "link" / "subdir2",
+            tmp_path / "dir" / "link" / "subdir2" / "file3.txt",
+        ]
+
+    def test_list_files_not_dir(self, tmp_path: Path):
+        """Test list_files ignores paths that are not directories."""
+        (tmp_path / "file.txt").touch()
+        assert fileops.list_files([tmp_path / "file.txt", tmp_path / "missing"]) == {}
+
+
 class TestCopy:
     @pytest.mark.parametrize(
         "exist_ok, raises_error, final_content",
@@ -275,3 +346,261 @@ class TestSymlink:
 
         assert symlink.is_symlink()
         assert symlink.read_text() == "content"
+
+    def test_symlink_no_check_target(
+        self, tmp_path: Path, mocker: pytest_mock.MockerFixture
+    ):
+        """Test symlink skips the target directory check if requested."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        mocked_mkdir = mocker.patch("nipoppy.utils.fileops.mkdir")
+
+        symlink = tmp_path / "symlink_to_source"
+        fileops.symlink(source=source_file, target=symlink, check_target=False)
+
+        assert symlink.is_symlink()
+        mocked_mkdir.assert_not_called()
+
+
+class TestHardlink:
+    def test_hardlink_file(self, tmp_path: Path):
+        """Test hardlink creates a hard link to a file."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        target_file = tmp_path / "target.txt"
+
+        fileops.hardlink(source=source_file, target=target_file)
+
+        assert not target_file.is_symlink()
+        assert target_file.read_text() == "content"
+        assert target_file.stat().st_ino == source_file.stat().st_ino
+
+    def test_hardlink_target_exists(self, tmp_path: Path):
+        """Test hardlink raises an error if the target already exists."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        target_file = tmp_path / "target.txt"
+        target_file.touch()
+
+        with pytest.raises(FileOperationError, match="Target already exists"):
+            fileops.hardlink(source=source_file, target=target_file)
+
+    def test_hardlink_cross_device(
+        self, tmp_path: Path, mocker: pytest_mock.MockerFixture
+    ):
+        """Test hardlink raises an error across filesystems."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        mocker.patch("os.link", side_effect=OSError(errno.EXDEV, "Cross-device"))
+
+        with pytest.raises(FileOperationError, match="different filesystems"):
+            fileops.hardlink(source=source_file, target=tmp_path / "target.txt")
+
+    def test_hardlink_no_check_target(self, tmp_path: Path):
+        """Test hardlink skips the existing target check if requested."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        target_file = tmp_path / "target.txt"
+        target_file.touch()
+
+        # the error comes from os.link instead
+        with pytest.raises(FileExistsError):
+            fileops.hardlink(source=source_file, target=target_file, check_target=False)
+
+    def test_hardlink_dry_run(self, tmp_path: Path):
+        """Test hardlink does not create a link in dry-run mode."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        target_file = tmp_path / "target.txt"
+
+        fileops.hardlink(source=source_file, target=target_file, dry_run=True)
+
+        assert not target_file.exists()
+
+
+class TestHashFile:
+    def test_hash_file(self, tmp_path: Path):
+        """Test hash_file gives the same digest for identical contents."""
+        for fname, content in [("a", "content"), ("b", "content"), ("c", "other")]:
+            (tmp_path / fname).write_text(content)
+
+        assert fileops.hash_file(tmp_path / "a") == fileops.hash_file(tmp_path / "b")
+        assert fileops.hash_file(tmp_path / "a") != fileops.hash_file(tmp_path / "c")
+
+    def test_hash_file_chunks(self, tmp_path: Path, mocker: pytest_mock.MockerFixture):
+        """Test hash_file gives the same digest for any chunk size."""
+        mocker.patch("nipoppy.utils.fileops.HASH_CHUNK_SIZE", 4)
+        fpath = tmp_path / "file"
+        fpath.write_bytes(b"0123456789")
+        file_hash = fileops.hash_file(fpath)
+
+        mocker.patch("nipoppy.utils.fileops.HASH_CHUNK_SIZE", 1024)
+        assert fileops.hash_file(fpath) == file_hash
+
+
+class TestWriteFileobj:
+    def test_write_fileobj(self, tmp_path: Path):
+        """Test write_fileobj writes the content of a file object."""
+        target_file = tmp_path / "target.txt"
+
+        fileops.write_fileobj(io.BytesIO(b"content"), target_file)
+
+        assert target_file.read_bytes() == b"content"
+
+    def test_write_fileobj_target_exists(self, tmp_path: Path):
+        """Test write_fileobj raises an error if the target exists."""
+        target_file = tmp_path / "target.txt"
+        target_file.touch()
+
+        with pytest.raises(FileOperationError, match="Target already exists"):
+            fileops.write_fileobj(io.BytesIO(b"content"), target_file)
+
+    def test_write_fileobj_dry_run(self, tmp_path: Path):
+        """Test write_fileobj does not write in dry-run mode."""
+        target_file = tmp_path / "target.txt"
+
+        fileops.write_fileobj(io.BytesIO(b"content"), target_file, dry_run=True)
+
+        assert not target_file.exists()
+
+
+class TestReflink:
+    @pytest.mark.parametrize("ficlone_supported", [True, False])
+    @pytest.mark.parametrize("copy_file_range_supported", [True, False])
+    def test_reflink_file(
+        self,
+        tmp_path: Path,
+        mocker: pytest_mock.MockerFixture,
+        ficlone_supported: bool,
+        copy_file_range_supported: bool,
+    ):
+        """Test reflink clones or copies a file."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content" * 1000)
+        target_file = tmp_path / "target.txt"
+
+        if not ficlone_supported:
+            mocker.patch(
+                "nipoppy.utils.fileops.fcntl.ioctl",
+                side_effect=OSError(errno.EOPNOTSUPP, "Not supported"),
+            )
+        if not copy_file_range_supported:
+            mocker.patch(
+                "nipoppy.utils.fileops.os.copy_file_range",
+                side_effect=OSError(errno.EXDEV, "Cross-device"),
+                create=True,
+            )
+
+        fileops.reflink(source=source_file, target=target_file)
+
+        assert not target_file.is_symlink()
+        assert target_file.read_text() == "content" * 1000
+        assert target_file.stat().st_ino != source_file.stat().st_ino
+        assert target_file.stat().st_mtime == source_file.stat().st_mtime
+
+    def test_reflink_target_exists(self, tmp_path: Path):
+        """Test reflink raises an error if the target already exists."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        target_file = tmp_path / "target.txt"
+        target_file.touch()
+
+        with pytest.raises(FileOperationError, match="Target already exists"):
+            fileops.reflink(source=source_file, target=target_file)
+
+    def test_reflink_dry_run(self, tmp_path: Path):
+        """Test reflink does not create a file in dry-run mode."""
+        source_file = tmp_path / "source.txt"
+        source_file.write_text("content")
+        target_file = tmp_path / "target.txt"
+
+        fileops.reflink(source=source_file, target=target_file, dry_run=True)
+
+        assert not target_file.exists()
+
+
+class TestLock:
+    def test_lock(self, tmp_path: Path):
+        """Test that the lock file is created."""
+        fpath_lock = tmp_path / "subdir" / "file.lock"
+        with fileops.lock(fpath_lock):
+            assert fpath_lock.exists()
+
+    def test_lock_dry_run(self, tmp_path: Path):
+        """Test that nothing is created in dry-run mode."""
+        fpath_lock = tmp_path / "file.lock"
+        with fileops.lock(fpath_lock, dry_run=True):
+            pass
+        assert not fpath_lock.exists()
+
+    def test_lock_exclusive(self, tmp_path: Path):
+        """Test that the lock is only held by one user at a time."""
+        fpath_lock = tmp_path / "file.lock"
+        events = []
+        acquired = threading.Event()
+
+        def hold_lock():
+            with fileops.lock(fpath_lock):
+                acquired.set()
+                time.sleep(0.2)
+                events.append("released")
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        acquired.wait()
+        with fileops.lock(fpath_lock):
+            events.append("acquired")
+        thread.join()
+        assert events == ["released", "acquired"]
+
+
+class TestTarMembers:
+    @pytest.fixture
+    def fpath_tar(self, tmp_path: Path) -> Path:
+        """Create a tarball of a dummy directory structure."""
+        create_dummy_directory_structure(tmp_path / "data")
+        fpath_tar = tmp_path / "data.tar"
+        with tarfile.open(fpath_tar, "w") as tarball:
+            tarball.add(tmp_path / "data" / "subdir1", arcname="subdir1")
+        return fpath_tar
+
+    def test_get_fpath_tar_members(self):
+        """Test the member listing file is next to the tarball."""
+        assert fileops.get_fpath_tar_members(Path("dir/ses-1.tar")) == Path(
+            "dir/ses-1.tar.members.txt"
+        )
+
+    @pytest.mark.parametrize("dry_run", [False, True])
+    def test_write_tar_members(self, fpath_tar: Path, dry_run: bool):
+        """Test write_tar_members writes the member names, one per line."""
+        expected = ["subdir1", "subdir1/file1.txt", "subdir1/file2.txt"]
+        assert sorted(fileops.write_tar_members(fpath_tar, dry_run=dry_run)) == (
+            expected
+        )
+        fpath_members = fileops.get_fpath_tar_members(fpath_tar)
+        if dry_run:
+            assert not fpath_members.exists()
+        else:
+            assert sorted(fpath_members.read_text().splitlines()) == expected
+
+    def test_load_tar_members_backfill(self, fpath_tar: Path):
+        """Test load_tar_members creates the listing file if needed."""
+        assert len(fileops.load_tar_members(fpath_tar)) == 3
+        assert fileops.get_fpath_tar_members(fpath_tar).exists()
+
+    def test_load_tar_members_existing(
+        self, fpath_tar: Path, mocker: pytest_mock.MockerFixture
+    ):
+        """Test load_tar_members does not open the tarball if the listing exists."""
+        fileops.get_fpath_tar_members(fpath_tar).write_text("a\nb\n")
+        mocked_open = mocker.patch("tarfile.open")
+        assert fileops.load_tar_members(fpath_tar) == ["a", "b"]
+        mocked_open.assert_not_called()
+
+    def test_load_tar_members_outdated(self, fpath_tar: Path):
+        """Test load_tar_members regenerates a listing older than the tarball."""
+        fpath_members = fileops.get_fpath_tar_members(fpath_tar)
+        fpath_members.write_text("a\nb\n")
+        mtime_ns = fpath_tar.stat().st_mtime_ns
+        os.utime(fpath_members, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+        assert len(fileops.load_tar_members(fpath_tar)) == 3
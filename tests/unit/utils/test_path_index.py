@@ -0,0 +1,173 @@
+"""Tests for the path index."""
+
+from pathlib import Path
+
+import pytest
+import pytest_mock
+
+from nipoppy.utils import fileops
+from nipoppy.utils.path_index import DirectoryIndex, PathIndex, compile_glob
+
+PATHS = [
+    "dirA",
+    "dirA/01_ses-1.txt",
+    "dirA/dirB",
+    "dirA/dirB/file.txt",
+    "dirAB",
+    "dirAB/other.txt",
+    "file.txt",
+]
+
+
+@pytest.mark.parametrize(
+    "pattern,expected_prefix,has_wildcards",
+    [
+        ("dirA/dirB/file.txt", "dirA/dirB/file.txt", False),
+        ("./dirA/", "dirA", False),
+        ("dirA/*.txt", "dirA/", True),
+        ("**/*.txt", "", True),
+        ("dirA/**", "dirA", True),
+    ],
+)
+def test_compile_glob(pattern, expected_prefix, has_wildcards):
+    prefix, regex = compile_glob(pattern)
+    assert prefix == expected_prefix
+    assert (regex is not None) == has_wildcards
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        ("dirA/dirB/file.txt", ["dirA/dirB/file.txt"]),
+        ("dirA", ["dirA"]),
+        ("missing.txt", []),
+        ("*.txt", ["file.txt"]),
+        ("*file.txt", ["file.txt"]),
+        ("dirA/*.txt", ["dirA/01_ses-1.txt"]),
+        ("dirA/0?_ses-[12].txt", ["dirA/01_ses-1.txt"]),
+        ("dirA/[!0]*", ["dirA/dirB"]),
+        ("dir*/*.txt", ["dirA/01_ses-1.txt", "dirAB/other.txt"]),
+        (
+            "**/*.txt",
+            [
+                "dirA/01_ses-1.txt",
+                "dirA/dirB/file.txt",
+                "dirAB/other.txt",
+                "file.txt",
+            ],
+        ),
+        ("dirA/**/file.txt", ["dirA/dirB/file.txt"]),
+        (
+            "dirA/**",
+            ["dirA", "dirA/01_ses-1.txt", "dirA/dirB", "dirA/dirB/file.txt"],
+        ),
+    ],
+)
+def test_match(pattern, expected):
+    assert PathIndex(PATHS).match(pattern) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["dirA/dirB/file.txt", "*.txt", "dirA/*.txt", "**/*.txt", "dirA/**/file.txt"],
+)
+def test_match_same_as_glob(tmp_path: Path, pattern):
+    for path in PATHS:
+        if path.endswith(".txt"):
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).touch()
+
+    assert PathIndex.from_directory(tmp_path).match(pattern) == sorted(
+        path.relative_to(tmp_path).as_posix() for path in tmp_path.glob(pattern)
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_from_directory(tmp_path: Path, n_jobs):
+    for path in PATHS:
+        if path.endswith(".txt"):
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).touch()
+    (tmp_path / "empty_dir").mkdir()
+
+    path_index = PathIndex.from_directory(tmp_path, n_jobs=n_jobs)
+    assert path_index.paths == sorted(PATHS + ["empty_dir"])
+    assert len(path_index) == len(PATHS) + 1
+
+
+def test_from_directory_missing(tmp_path: Path):
+    assert len(PathIndex.from_directory(tmp_path / "missing")) == 0
+
+
+def _create_paths(dpath: Path):
+    for path in PATHS:
+        if path.endswith(".txt"):
+            (dpath / path).parent.mkdir(parents=True, exist_ok=True)
+            (dpath / path).touch()
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "dirA/dirB/file.txt",
+        "dirA",
+        "missing/file.txt",
+        "*.txt",
+        "dirA/*.txt",
+        "**/*.txt",
+        "dirA/**",
+    ],
+)
+def test_directory_index_match(tmp_path: Path, pattern):
+    _create_paths(tmp_path)
+    assert DirectoryIndex(tmp_path).match(pattern) == PathIndex(PATHS).match(pattern)
+
+
+def test_directory_index_lazy(tmp_path: Path, mocker: pytest_mock.MockerFixture):
+    _create_paths(tmp_path)
+    mocked_list_files = mocker.spy(fileops, "list_files")
+    directory_index = DirectoryIndex(tmp_path, n_jobs=2)
+
+    directory_index.match("dirA/*.txt")
+    directory_index.match("dirA/dirB/*.txt")
+    directory_index.match("file.txt")
+    mocked_list_files.assert_called_once_with(
+        [tmp_path / "dirA"], n_jobs=2, include_dirs=True, follow_symlinks=True
+    )
+    assert len(directory_index) == 5
+
+    # all remaining top-level directories are listed at once
+    directory_index.match("**/*.txt")
+    mocked_list_files.assert_called_with(
+        [tmp_path / "dirAB"], n_jobs=2, include_dirs=True, follow_symlinks=True
+    )
+    assert len(directory_index) == len(PATHS)
+
+
+@pytest.mark.parametrize("pattern", ["sub-01/anat/*.nii", "*/anat/*.nii"])
+def test_directory_index_symlinked_dir(tmp_path: Path, pattern):
+    # e.g. output directory with symlinked participant directories
+    (tmp_path / "real" / "sub-01" / "anat").mkdir(parents=True)
+    (tmp_path / "real" / "sub-01" / "anat" / "T1w.nii").touch()
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "sub-01").symlink_to(Path("..", "real", "sub-01"))
+
+    expected = ["sub-01/anat/T1w.nii"]
+    assert [
+        str(path.relative_to(tmp_path / "out"))
+        for path in (tmp_path / "out").glob(pattern)
+    ] == expected
+    assert DirectoryIndex(tmp_path / "out").match(pattern) == expected
+
+
+def test_directory_index_symlink_loop(tmp_path: Path):
+    (tmp_path / "sub-01" / "anat").mkdir(parents=True)
+    (tmp_path / "sub-01" / "anat" / "T1w.nii").touch()
+    (tmp_path / "sub-01" / "anat" / "loop").symlink_to(tmp_path / "sub-01")
+    assert DirectoryIndex(tmp_path).match("**/*.nii") == ["sub-01/anat/T1w.nii"]
+
+
+def test_directory_index_missing(tmp_path: Path):
+    directory_index = DirectoryIndex(tmp_path / "missing")
+    assert directory_index.match("**/*.txt") == []
+    assert directory_index.match("dirA/file.txt") == []
@@ -0,0 +1,123 @@
+"""Tests for the template module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from nipoppy.exceptions import NipoppyError
+from nipoppy.utils.template import (
+    JsonTemplate,
+    StrTemplate,
+    TemplateValues,
+    compile_str_template,
+)
+
+
+class _Obj:
+    attr1 = "obj_value1"
+    attr2 = Path("relative/path")
+
+
+@pytest.mark.parametrize(
+    "template_str,expected_parts",
+    [
+        ("[[NIPOPPY_ATTR1]]", [("[[NIPOPPY_ATTR1]]", "attr1")]),
+        (
+            "a/[[NIPOPPY_ATTR1]]/b[[NIPOPPY_Attr2]]",
+            [
+                "a/",
+                ("[[NIPOPPY_ATTR1]]", "attr1"),
+                "/b",
+                ("[[NIPOPPY_Attr2]]", "attr2"),
+            ],
+        ),
+    ],
+)
+def test_str_template_parts(template_str, expected_parts):
+    assert StrTemplate(template_str).parts == expected_parts
+
+
+@pytest.mark.parametrize("template_str", ["[[NIPOPPY_123]]", "[[NIPOPPY_-]]"])
+def test_str_template_error_identifier(template_str):
+    with pytest.raises(NipoppyError, match="Invalid identifier name"):
+        StrTemplate(template_str)
+
+
+@pytest.mark.parametrize(
+    "resolve_paths,kwargs,expected",
+    [
+        (True, {}, f"obj_value1 {Path('relative/path').resolve()}"),
+        (False, {}, "obj_value1 relative/path"),
+        (False, {"attr1": "kwarg_value1"}, "kwarg_value1 relative/path"),
+    ],
+)
+def test_str_template_render(resolve_paths, kwargs, expected):
+    template = StrTemplate("[[NIPOPPY_ATTR1]] [[NIPOPPY_ATTR2]]")
+    values = TemplateValues(resolve_paths=resolve_paths, objs=[_Obj()], **kwargs)
+    assert template.render(values) == expected
+
+
+def test_str_template_render_none_warning():
+    with pytest.warns(UserWarning, match="Replacing .* with None"):
+        assert StrTemplate("[[NIPOPPY_KWARG1]]").render(
+            TemplateValues(kwarg1=None)
+        ) == ("None")
+
+
+def test_str_template_render_unresolved_warning():
+    with pytest.warns(UserWarning, match="Unable to replace"):
+        assert (
+            StrTemplate("a[[NIPOPPY_INVALID]]").render(TemplateValues())
+            == "a[[NIPOPPY_INVALID]]"
+        )
+
+
+@pytest.mark.parametrize("template_str", ["no placeholders", "[[NOT_NIPOPPY]]"])
+def test_compile_str_template_no_placeholders(template_str):
+    assert compile_str_template(template_str) == template_str
+
+
+def test_compile_str_template_cached():
+    template = compile_str_template("[[NIPOPPY_ATTR1]]")
+    assert isinstance(template, StrTemplate)
+    assert compile_str_template("[[NIPOPPY_ATTR1]]") is template
+
+
+def test_template_values_lookup_once():
+    class _CountingObj:
+        n_calls = 0
+
+        @property
+        def attr1(self):
+            self.n_calls += 1
+            return "value"
+
+    obj = _CountingObj()
+    values = TemplateValues(objs=[obj])
+    template = StrTemplate("[[NIPOPPY_ATTR1]]/[[NIPOPPY_ATTR1]]")
+    assert template.render(values) == "value/value"
+    assert template.render(values) == "value/value"
+    assert obj.n_calls == 1
+
+
+def test_json_template_render():
+    template_json = {
+        "[[NIPOPPY_ATTR1]]": ["[[NIPOPPY_PARTICIPANT_ID]]", 1, None, True],
+        "nested": {"key": "sub-[[NIPOPPY_PARTICIPANT_ID]]", "unchanged": "a"},
+    }
+    template = JsonTemplate(template_json)
+    for participant_id in ("01", "02"):
+        assert template.render(objs=[_Obj()], participant_id=participant_id) == {
+            "obj_value1": [participant_id, 1, None, True],
+            "nested": {"key": f"sub-{participant_id}", "unchanged": "a"},
+        }
+    # the original object should not be modified
+    assert template_json["nested"]["key"] == "sub-[[NIPOPPY_PARTICIPANT_ID]]"
+
+
+@pytest.mark.parametrize("value", ['with "quotes"', "with \\backslash", "[1, 2]"])
+def test_json_template_render_literal_values(value):
+    template = JsonTemplate({"key": "[[NIPOPPY_VALUE]]"})
+    assert template.render(value=value) == {"key": value}
+    assert json.loads(template.render(value=value, return_str=True)) == {"key": value}
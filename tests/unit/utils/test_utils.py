@@ -204,6 +204,32 @@ def test_apply_substitutions_to_json(json_obj, substitutions, expected_output):
     assert apply_substitutions_to_json(json_obj, substitutions) == expected_output
 
 
+@pytest.mark.parametrize(
+    "substitutions,expected_output",
+    [
+        # longest key wins, regardless of order
+        ({"KEY": "short", "KEY_LONG": "long"}, {"key1": "long/short"}),
+        ({"KEY_LONG": "long", "KEY": "short"}, {"key1": "long/short"}),
+        # replaced text is not substituted again
+        ({"KEY_LONG": "KEY", "KEY": "short"}, {"key1": "KEY/short"}),
+    ],
+)
+def test_apply_substitutions_to_json_single_pass(substitutions, expected_output):
+    assert (
+        apply_substitutions_to_json({"key1": "KEY_LONG/KEY"}, substitutions)
+        == expected_output
+    )
+
+
+def test_apply_substitutions_to_json_new_object():
+    json_obj = {"key1": ["TO_REPLACE"]}
+    output1 = apply_substitutions_to_json(json_obj, {"TO_REPLACE": "value1"})
+    output1["key1"].append("modified")
+    output2 = apply_substitutions_to_json(json_obj, {"TO_REPLACE": "value1"})
+    assert output2 == {"key1": ["value1"]}
+    assert json_obj == {"key1": ["TO_REPLACE"]}
+
+
 def test_apply_substitutions_to_json_invalid_value():
     with pytest.raises(ConfigError, match="Substitution value must be a string"):
         apply_substitutions_to_json({"key1": "TO_REPLACE"}, {"TO_REPLACE": None})
@@ -21,6 +21,7 @@ from nipoppy.env import (
 )
 from nipoppy.exceptions import ConfigError, FileOperationError, WorkflowError
 from nipoppy.layout import DatasetLayout
+from nipoppy.utils.file_index import PipelineConfigIndex
 from nipoppy.workflows.pipeline_store.install import PipelineInstallWorkflow
 from nipoppy.zenodo_api import ZenodoAPI
 from tests.conftest import TEST_PIPELINE, create_pipeline_config_files, get_config
@@ -438,6 +439,14 @@ def test_run_main(
     mocked_download_container.assert_called_once_with(pipeline_config)
     assert "Successfully installed pipeline" in caplog.text
 
+    # pipeline index should be up-to-date
+    with PipelineConfigIndex(
+        workflow.study.layout.fpath_pipeline_index,
+        workflow.study.layout.dpath_pipelines,
+    ) as index:
+        fpath_config = dpath_installed / workflow.study.layout.fname_pipeline_config
+        assert index.get_stale([fpath_config]) == ([], 1)
+
 
 @pytest.mark.parametrize("force", [False, True])
 def test_run_main_force(
@@ -2,12 +2,18 @@
 
 import json
 import subprocess
+from pathlib import Path
 
 import pytest
 import pytest_mock
+from boutiques.localExec import LocalExecutor
 
-from nipoppy.exceptions import ExecutionError
-from nipoppy.workflows.services.boutiques import run_bosh_launch, run_bosh_simulate
+from nipoppy.exceptions import ExecutionError, PipelineTimeoutError
+from nipoppy.workflows.services.boutiques import (
+    CommandLineSimulator,
+    run_bosh_launch,
+    run_bosh_simulate,
+)
 
 
 @pytest.fixture
@@ -87,7 +93,7 @@ def test_run_bosh_func_capture_error(
         ),
     )
 
-    with pytest.raises(ExecutionError, match=error_msg):
+    with pytest.raises(ExecutionError, match=error_msg) as exception_info:
         bosh_func(
             invocation_str=json.dumps(invocation),
             descriptor_str=json.dumps(bosh_descriptor),
@@ -95,6 +101,27 @@ def test_run_bosh_func_capture_error(
         )
 
     mocked_run_command.assert_called_once()
+    # the original error is kept (e.g. to decide whether to retry)
+    assert isinstance(exception_info.value.__cause__, subprocess.CalledProcessError)
+
+
+def test_run_bosh_launch_timeout(
+    bosh_descriptor, invocation, mocker: pytest_mock.MockerFixture
+):
+    mocked_run_command = mocker.patch(
+        "nipoppy.workflows.base._run_command",
+        side_effect=subprocess.TimeoutExpired(cmd=["bosh"], timeout=60),
+    )
+
+    with pytest.raises(
+        PipelineTimeoutError, match="timed out after 60 seconds"
+    ) as exc_info:
+        run_bosh_launch(
+            invocation_str=json.dumps(invocation),
+            descriptor_str=json.dumps(bosh_descriptor),
+            run_command=mocked_run_command,
+        )
+    assert isinstance(exc_info.value.__cause__, subprocess.TimeoutExpired)
 
 
 def test_bosh_simulate_log(
@@ -111,3 +138,80 @@ def test_bosh_simulate_log(
         run_command=mocked_run_command,
     )
     assert "Additional launch options:" in caplog.text
+
+
+def test_command_line_simulator():
+    """Test that output file names are generated for each invocation."""
+    descriptor = {
+        "name": "tool",
+        "tool-version": "1.0",
+        "schema-version": "0.5",
+        "description": "tool",
+        "command-line": "tool [PARTICIPANT] [OUTPUT]",
+        "inputs": [
+            {
+                "id": "participant",
+                "name": "Participant",
+                "type": "String",
+                "value-key": "[PARTICIPANT]",
+            }
+        ],
+        "output-files": [
+            {
+                "id": "output",
+                "name": "Output",
+                "path-template": "out_[PARTICIPANT].txt",
+                "value-key": "[OUTPUT]",
+            }
+        ],
+    }
+    simulator = CommandLineSimulator(json.dumps(descriptor))
+    for participant_id in ["01", "02"]:
+        assert simulator.get_command_line(
+            json.dumps({"participant": participant_id})
+        ) == (f"tool {participant_id} out_{participant_id}.txt")
+
+
+def test_command_line_simulator_no_configuration_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that configuration files are not written when simulating.
+
+    This also checks that the Boutiques internals used by CommandLineSimulator
+    have not changed.
+    """
+    descriptor = {
+        "name": "tool",
+        "tool-version": "1.0",
+        "schema-version": "0.5",
+        "description": "tool",
+        "command-line": "tool [CONFIG]",
+        "inputs": [
+            {
+                "id": "participant",
+                "name": "Participant",
+                "type": "String",
+                "value-key": "[PARTICIPANT]",
+            }
+        ],
+        "output-files": [
+            {
+                "id": "config",
+                "name": "Config",
+                "path-template": "config_[PARTICIPANT].txt",
+                "file-template": ["participant=[PARTICIPANT]"],
+                "value-key": "[CONFIG]",
+            }
+        ],
+    }
+    for method in ("_generateCmdLineFromInDict", "_writeConfigurationFiles"):
+        assert callable(getattr(LocalExecutor, method, None))
+    monkeypatch.chdir(tmp_path)
+
+    simulator = CommandLineSimulator(json.dumps(descriptor))
+
+    assert (
+        simulator.get_command_line(json.dumps({"participant": "01"}))
+        == "tool config_01.txt"
+    )
+    assert list(tmp_path.iterdir()) == []
@@ -2,9 +2,11 @@
 
 import logging
 import subprocess
+import time
 from pathlib import Path
 
 import pytest
+import pytest_mock
 
 from nipoppy.workflows.base import BaseWorkflow, LogPrefix, _log_command, _run_command
 
@@ -84,6 +86,43 @@ def test_run_command_check():
         _run_command(["which", "probably_fake_command"], check=True)
 
 
+def test_run_command_check_stderr():
+    with pytest.raises(subprocess.CalledProcessError) as exception_info:
+        _run_command("echo out; echo err1 >&2; echo err2 >&2; exit 3", shell=True)
+    assert exception_info.value.returncode == 3
+    assert exception_info.value.stderr == "err1\nerr2"
+
+
+def test_run_command_timeout(tmp_path: Path):
+    fpath = tmp_path / "test.txt"
+    time_start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        # the background child process should also be terminated
+        _run_command(
+            f"(sleep 3 && touch {fpath}) & sleep 60",
+            shell=True,
+            timeout=0.5,
+        )
+    assert time.monotonic() - time_start < 30
+    time.sleep(3.5)
+    assert not fpath.exists()
+
+
+def test_run_command_timeout_not_reached():
+    process = _run_command(["echo", "hello"], timeout=30)
+    assert process.returncode == 0
+
+
+def test_run_command_timeout_kill(mocker: pytest_mock.MockFixture):
+    # SIGKILL if the process ignores SIGTERM
+    mocker.patch("nipoppy.workflows.base.TERMINATION_GRACE_PERIOD", 0.5)
+    with pytest.raises(subprocess.TimeoutExpired):
+        _run_command(
+            ["bash", "-c", "trap '' TERM; sleep 60"],
+            timeout=0.5,
+        )
+
+
 @pytest.mark.no_xdist
 def test_run_command_no_markup(caplog: pytest.LogCaptureFixture, tmp_path: Path):
     # text with closing tag
@@ -156,6 +156,53 @@ def test_write_status_file(table: CurationStatusTable, workflow: BIDSificationRu
     )
 
 
+def _make_curation_status_table(in_bids: list[bool]) -> CurationStatusTable:
+    participant_ids = [f"0{i + 1}" for i in range(len(in_bids))]
+    return CurationStatusTable(
+        data={
+            CurationStatusTable.col_participant_id: participant_ids,
+            CurationStatusTable.col_visit_id: "1",
+            CurationStatusTable.col_session_id: "1",
+            CurationStatusTable.col_datatype: "['anat']",
+            CurationStatusTable.col_participant_dicom_dir: participant_ids,
+            CurationStatusTable.col_in_pre_reorg: True,
+            CurationStatusTable.col_in_post_reorg: True,
+            CurationStatusTable.col_in_bids: in_bids,
+        }
+    ).validate()
+
+
+def test_write_status_file_merge(workflow: BIDSificationRunner):
+    workflow.pipeline_step = "convert"
+    fpath_table = workflow.study.layout.fpath_curation_status
+    # loaded before the run
+    workflow.curation_status_table = _make_curation_status_table([False, False])
+    workflow._bidsified_participants_sessions = [("01", "1")]
+    # updated by another process (e.g. a parallel run) in the meantime
+    _make_curation_status_table([False, True]).save_with_backup(fpath_table)
+
+    workflow._write_status_file()
+
+    assert CurationStatusTable.load(fpath_table).equals(
+        _make_curation_status_table([True, True])
+    )
+    assert workflow.study.layout.fpath_curation_status_lock.exists()
+
+
+def test_write_status_file_nothing_bidsified(workflow: BIDSificationRunner):
+    workflow.pipeline_step = "convert"
+    fpath_table = workflow.study.layout.fpath_curation_status
+    # e.g. runs were done in child processes that updated the file themselves
+    workflow.curation_status_table = _make_curation_status_table([False, False])
+    _make_curation_status_table([True, True]).save_with_backup(fpath_table)
+
+    workflow._write_status_file()
+
+    assert CurationStatusTable.load(fpath_table).equals(
+        _make_curation_status_table([True, True])
+    )
+
+
 def test_write_status_file_simulate(workflow: BIDSificationRunner):
     workflow.pipeline_step = "convert"
     workflow.simulate = True
@@ -248,3 +295,10 @@ def test_generate_cli_command_for_hpc(
         participant_id="p01",
         session_id="s01",
     )
+
+
+def test_get_dpath_inputs(workflow: BIDSificationRunner):
+    assert (
+        workflow.get_dpath_inputs("01", "1")
+        == workflow.study.layout.dpath_post_reorg / "sub-01" / "ses-1"
+    )
@@ -0,0 +1,105 @@
+"""Tests for DicomIndexWorkflow."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+import pytest_mock
+
+from nipoppy.utils.dicom import DicomHeaderIndex
+from nipoppy.workflows.dicom_index import DicomIndexWorkflow
+from tests.conftest import DPATH_TEST_DATA, create_empty_dataset
+
+
+@pytest.fixture()
+def workflow(tmp_path: Path):
+    dpath_root = tmp_path / "my_dataset"
+    create_empty_dataset(dpath_root)
+    workflow = DicomIndexWorkflow(dpath_root=dpath_root)
+
+    dpath_dicoms = workflow.study.layout.dpath_pre_reorg / "01" / "1"
+    dpath_dicoms.mkdir(parents=True)
+    shutil.copyfile(DPATH_TEST_DATA / "dicom-derived.dcm", dpath_dicoms / "1.dcm")
+    shutil.copyfile(DPATH_TEST_DATA / "dicom-not_derived.dcm", dpath_dicoms / "2.dcm")
+    return workflow
+
+
+def _get_fpaths_indexed(workflow: DicomIndexWorkflow) -> set[Path]:
+    fpaths = workflow.get_fpaths_to_index()
+    with DicomHeaderIndex(
+        workflow.study.layout.fpath_dicom_index, workflow.study.layout.dpath_pre_reorg
+    ) as index:
+        return set(index.get_headers(fpaths))
+
+
+def test_init(workflow: DicomIndexWorkflow):
+    assert workflow.name == "index_dicoms"
+    assert workflow.n_jobs == 1
+    assert workflow.force is False
+
+
+def test_get_fpaths_to_index(workflow: DicomIndexWorkflow):
+    fpaths = workflow.get_fpaths_to_index()
+    dpath_dicoms = workflow.study.layout.dpath_pre_reorg / "01" / "1"
+    assert dpath_dicoms / "1.dcm" in fpaths
+    assert dpath_dicoms / "2.dcm" in fpaths
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_run_main(workflow: DicomIndexWorkflow, n_jobs: int):
+    workflow.n_jobs = n_jobs
+    workflow.run_main()
+
+    dpath_dicoms = workflow.study.layout.dpath_pre_reorg / "01" / "1"
+    assert workflow.study.layout.fpath_dicom_index.exists()
+    assert _get_fpaths_indexed(workflow) == {
+        dpath_dicoms / "1.dcm",
+        dpath_dicoms / "2.dcm",
+    }
+
+
+def test_run_main_incremental(
+    workflow: DicomIndexWorkflow, mocker: pytest_mock.MockerFixture
+):
+    workflow.run_main()
+
+    # only the new file should be read
+    dpath_dicoms = workflow.study.layout.dpath_pre_reorg / "01" / "1"
+    shutil.copyfile(DPATH_TEST_DATA / "dicom-derived.dcm", dpath_dicoms / "3.dcm")
+    (dpath_dicoms / "2.dcm").unlink()
+    spy = mocker.spy(workflow, "_read_header")
+
+    workflow.run_main()
+
+    spy.assert_called_once_with(dpath_dicoms / "3.dcm")
+    assert _get_fpaths_indexed(workflow) == {
+        dpath_dicoms / "1.dcm",
+        dpath_dicoms / "3.dcm",
+    }
+
+
+def test_run_main_force(
+    workflow: DicomIndexWorkflow, mocker: pytest_mock.MockerFixture
+):
+    workflow.run_main()
+
+    workflow.force = True
+    spy = mocker.spy(workflow, "_read_header")
+    workflow.run_main()
+
+    assert spy.call_count == 2
+
+
+def test_run_main_unreadable(workflow: DicomIndexWorkflow):
+    fpath_invalid = workflow.study.layout.dpath_pre_reorg / "01" / "1" / "invalid"
+    fpath_invalid.write_text("not a DICOM file")
+
+    workflow.run_main()
+
+    assert fpath_invalid not in _get_fpaths_indexed(workflow)
+
+
+def test_run_main_dry_run(workflow: DicomIndexWorkflow):
+    workflow.dry_run = True
+    workflow.run_main()
+    assert not workflow.study.layout.fpath_dicom_index.exists()
@@ -2,20 +2,34 @@
 
 import logging
 import shutil
+import tarfile
+import zipfile
 from pathlib import Path
 
 import pytest
 import pytest_mock
 
-from nipoppy.exceptions import FileOperationError, ReturnCode
+from nipoppy.env import LinkModeEnum
+from nipoppy.exceptions import FileOperationError, ReturnCode, WorkflowError
 from nipoppy.tabular.curation_status import CurationStatusTable
 from nipoppy.tabular.dicom_dir_map import DicomDirMap
 from nipoppy.tabular.manifest import Manifest
+from nipoppy.utils import fileops
 from nipoppy.utils.bids import (
     participant_id_to_bids_participant_id,
     session_id_to_bids_session_id,
 )
-from nipoppy.workflows.dicom_reorg import DicomReorgWorkflow, is_derived_dicom
+from nipoppy.utils.dicom import DicomHeaderIndex, read_dicom_header
+from nipoppy.workflows import dicom_reorg
+from nipoppy.workflows.dicom_reorg import (
+    DicomReorgWorkflow,
+    ReorgJournal,
+    _resolve_dpath,
+    hash_dpath,
+    is_archive,
+    is_derived_dicom,
+    iter_archive_members,
+)
 from tests.conftest import (
     DPATH_TEST_DATA,
     create_empty_dataset,
@@ -35,11 +49,39 @@ def workflow(tmp_path: Path):
 
 def test_init_attributes(workflow: DicomReorgWorkflow):
     assert workflow.copy_files is False
+    assert workflow.link_mode == LinkModeEnum.SYMLINK
     assert workflow.check_dicoms is False
+    assert workflow.prescan is False
+    assert workflow.n_jobs == 1
+    assert workflow.fpaths_by_dicom_dir == {}
+    assert workflow.derived_dicom_counts == {}
     assert workflow.n_success == 0
     assert workflow.n_total == 0
 
 
+@pytest.mark.parametrize(
+    "copy_files,link_mode,expected",
+    [
+        (True, None, LinkModeEnum.COPY),
+        (True, "copy", LinkModeEnum.COPY),
+        (False, None, LinkModeEnum.SYMLINK),
+        (False, "hardlink", LinkModeEnum.HARDLINK),
+        (False, LinkModeEnum.REFLINK, LinkModeEnum.REFLINK),
+    ],
+)
+def test_init_link_mode(tmp_path: Path, copy_files, link_mode, expected):
+    workflow = DicomReorgWorkflow(
+        dpath_root=tmp_path, copy_files=copy_files, link_mode=link_mode
+    )
+    assert workflow.link_mode == expected
+    assert workflow.copy_files == (expected == LinkModeEnum.COPY)
+
+
+def test_init_link_mode_error(tmp_path: Path):
+    with pytest.raises(WorkflowError, match="Cannot use link mode hardlink"):
+        DicomReorgWorkflow(dpath_root=tmp_path, copy_files=True, link_mode="hardlink")
+
+
 @pytest.mark.parametrize(
     "fpath,expected_result",
     [
@@ -51,6 +93,48 @@ def test_is_derived_dicom(fpath, expected_result):
     assert is_derived_dicom(fpath) == expected_result
 
 
+def _make_archive(fpath_archive: Path, members: dict[str, bytes]) -> Path:
+    """Create a zip or tar archive with the given members."""
+    dpath_tmp = fpath_archive.parent / f"{fpath_archive.name}_content"
+    for member_name, content in members.items():
+        (dpath_tmp / member_name).parent.mkdir(parents=True, exist_ok=True)
+        (dpath_tmp / member_name).write_bytes(content)
+
+    fpath_archive.parent.mkdir(parents=True, exist_ok=True)
+    if fpath_archive.suffix == ".zip":
+        with zipfile.ZipFile(fpath_archive, "w") as archive:
+            for member_name in members:
+                archive.write(dpath_tmp / member_name, arcname=member_name)
+    else:
+        mode = "w:gz" if fpath_archive.suffix == ".gz" else "w"
+        with tarfile.open(fpath_archive, mode) as archive:
+            for member_name in members:
+                archive.add(dpath_tmp / member_name, arcname=member_name)
+    shutil.rmtree(dpath_tmp)
+    return fpath_archive
+
+
+@pytest.mark.parametrize("fname", ["archive.zip", "archive.tar", "archive.tar.gz"])
+def test_is_archive_and_iter_members(tmp_path: Path, fname: str):
+    members = {"series1/1.dcm": b"first", "series2/2.dcm": b"second file"}
+    fpath_archive = _make_archive(tmp_path / fname, members)
+
+    assert is_archive(fpath_archive)
+    assert {
+        member_name: (size, file.read())
+        for member_name, size, file in iter_archive_members(fpath_archive)
+    } == {
+        member_name: (len(content), content) for member_name, content in members.items()
+    }
+
+
+def test_is_archive_false(tmp_path: Path):
+    fpath = tmp_path / "file.dcm"
+    fpath.write_text("not an archive")
+    assert not is_archive(fpath)
+    assert not is_archive(tmp_path)
+
+
 @pytest.mark.parametrize(
     "participant_id,session_id,fpaths,participant_first",
     [
@@ -86,6 +170,50 @@ def test_get_fpaths_to_reorg(
     ) == len(fpaths)
 
 
+def test_get_fpaths_to_reorg_prescanned(workflow: DicomReorgWorkflow):
+    manifest = prepare_dataset(participants_and_sessions_manifest={"01": ["1"]})
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+    dpath_downloaded = workflow.study.layout.dpath_pre_reorg / "01" / "1"
+    fpaths = [dpath_downloaded / "file1.dcm"]
+    workflow.fpaths_by_dicom_dir = {dpath_downloaded: fpaths}
+
+    # directory does not need to exist
+    assert workflow.get_fpaths_to_reorg(participant_id="01", session_id="1") == fpaths
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_scan_dicom_dirs(
+    workflow: DicomReorgWorkflow, n_jobs: int, caplog: pytest.LogCaptureFixture
+):
+    workflow.n_jobs = n_jobs
+    participants_and_sessions = {"01": ["1", "2"], "02": ["1"]}
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest=participants_and_sessions,
+        participants_and_sessions_downloaded=participants_and_sessions,
+        dpath_downloaded=workflow.study.layout.dpath_pre_reorg,
+    )
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+    participants_sessions = [("01", "1"), ("02", "1")]
+
+    workflow.scan_dicom_dirs(participants_sessions)
+
+    assert set(workflow.fpaths_by_dicom_dir) == {
+        workflow.study.layout.dpath_pre_reorg / "01" / "1",
+        workflow.study.layout.dpath_pre_reorg / "02" / "1",
+    }
+    n_files = 0
+    for participant_id, session_id in participants_sessions:
+        dpath = workflow.get_path_downloaded(participant_id, session_id)
+        fpaths = sorted(fpath for fpath in dpath.rglob("*") if not fpath.is_dir())
+        assert workflow.fpaths_by_dicom_dir[dpath] == fpaths
+        n_files += len(fpaths)
+    assert f"Found {n_files} files to reorganize in 2 DICOM directories" in caplog.text
+
+
 def test_get_fpaths_to_reorg_error_not_found(workflow: DicomReorgWorkflow):
     participant_id = "XXX"
     session_id = "X"
@@ -143,6 +271,111 @@ def test_apply_fname_mapping_default(
     )
 
 
+def test_apply_fname_mapping_hash_cached(workflow: DicomReorgWorkflow):
+    hash_dpath.cache_clear()
+    for fname in ["1.dcm", "2.dcm", "3.dcm"]:
+        workflow.apply_fname_mapping(Path("/data", "01", "1", fname), "01", "1")
+    assert hash_dpath.cache_info().misses == 1
+    assert hash_dpath.cache_info().hits == 2
+
+
+@pytest.mark.parametrize("link_mode", [LinkModeEnum.HARDLINK, LinkModeEnum.REFLINK])
+@pytest.mark.parametrize("symlinked_dir", [False, True])
+def test_reorganize_file_symlinked_source(
+    workflow: DicomReorgWorkflow,
+    link_mode: LinkModeEnum,
+    symlinked_dir: bool,
+    tmp_path: Path,
+):
+    workflow.link_mode = link_mode
+    fpath_real = tmp_path / "real" / "1.dcm"
+    fpath_real.parent.mkdir()
+    fpath_real.write_text("content")
+    if symlinked_dir:
+        # e.g. a pre-reorg directory that is a symlink to another directory
+        (tmp_path / "linked").symlink_to(fpath_real.parent)
+        fpath_source = tmp_path / "linked" / "1.dcm"
+    else:
+        fpath_source = tmp_path / "1.dcm"
+        fpath_source.symlink_to(fpath_real)
+    fpath_dest = tmp_path / "dest.dcm"
+    journal = ReorgJournal(tmp_path / "journal.tsv")
+
+    journal.open()
+    try:
+        workflow._reorganize_and_record(fpath_source, fpath_dest, journal)
+    finally:
+        journal.close()
+
+    assert not fpath_dest.is_symlink()
+    assert fpath_dest.read_text() == "content"
+    if link_mode == LinkModeEnum.HARDLINK:
+        assert fpath_dest.stat().st_ino == fpath_real.stat().st_ino
+    # the journal has the unresolved source path and the stat of the real file
+    assert journal.load()[fpath_dest] == (
+        fpath_source,
+        fpath_real.stat().st_size,
+        fpath_real.stat().st_ino,
+    )
+
+
+def test_reorganize_file_source_dir_resolved_once(
+    workflow: DicomReorgWorkflow, tmp_path: Path
+):
+    workflow.link_mode = LinkModeEnum.HARDLINK
+    dpath_real = tmp_path / "real"
+    dpath_real.mkdir()
+    (tmp_path / "linked").symlink_to(dpath_real)
+    _resolve_dpath.cache_clear()
+
+    for fname in ("1.dcm", "2.dcm"):
+        (dpath_real / fname).write_text(fname)
+        workflow.reorganize_file(tmp_path / "linked" / fname, tmp_path / fname)
+        assert (tmp_path / fname).stat().st_ino == (dpath_real / fname).stat().st_ino
+
+    assert _resolve_dpath.cache_info().misses == 1
+    assert _resolve_dpath.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("link_mode", [LinkModeEnum.SYMLINK, LinkModeEnum.HARDLINK])
+def test_run_single_batched_checks(
+    workflow: DicomReorgWorkflow,
+    link_mode: LinkModeEnum,
+    mocker: pytest_mock.MockerFixture,
+):
+    participant_id = "01"
+    session_id = "1"
+    workflow.link_mode = link_mode
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    manifest.save_with_backup(workflow.study.layout.fpath_manifest)
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+    dpath_source = workflow.study.layout.dpath_pre_reorg / participant_id / session_id
+    for dname in ["series1", "series2"]:
+        (dpath_source / dname).mkdir(parents=True)
+        for i in range(5):
+            (dpath_source / dname / f"{i}.dcm").touch()
+
+    spy_mkdir = mocker.spy(fileops, "mkdir")
+    workflow.run_single(participant_id, session_id)
+
+    dpath_reorganized = (
+        workflow.study.layout.dpath_post_reorg
+        / participant_id_to_bids_participant_id(participant_id)
+        / session_id_to_bids_session_id(session_id)
+    )
+    fpaths_dest = list(dpath_reorganized.iterdir())
+    assert len(fpaths_dest) == 10
+    for fpath_dest in fpaths_dest:
+        assert fpath_dest.is_symlink() == (link_mode == LinkModeEnum.SYMLINK)
+        assert fpath_dest.exists()
+    # output directory and journal directory only, not once per file
+    assert spy_mkdir.call_count == 2
+
+
 def test_run_single_error_file_exists(workflow: DicomReorgWorkflow):
     participant_id = "01"
     session_id = "1"
@@ -171,6 +404,272 @@ def test_run_single_error_file_exists(workflow: DicomReorgWorkflow):
         workflow.run_single(participant_id, session_id)
 
 
+def test_reorg_journal(tmp_path: Path):
+    journal = ReorgJournal(tmp_path / "journal" / "sub-01_ses-1.tsv")
+    assert journal.load() == {}
+
+    journal.open()
+    journal.record(Path("/src/a.dcm"), Path("/dest/a.dcm"), 10, 123)
+    journal.close()
+    # simulate a partially written line
+    with journal.fpath.open("a") as file:
+        file.write("/src/b.dcm\t/dest")
+
+    assert journal.load() == {Path("/dest/a.dcm"): (Path("/src/a.dcm"), 10, 123)}
+
+
+def test_reorg_journal_dry_run(tmp_path: Path):
+    journal = ReorgJournal(tmp_path / "sub-01_ses-1.tsv", dry_run=True)
+    journal.open()
+    journal.record(Path("/src/a.dcm"), Path("/dest/a.dcm"), 10, 123)
+    journal.close()
+    assert not journal.fpath.exists()
+
+
+def test_get_fpath_journal(workflow: DicomReorgWorkflow):
+    assert workflow.get_fpath_journal("01", "1") == (
+        workflow.study.layout.dpath_work / "reorg" / "sub-01_ses-1.tsv"
+    )
+
+
+@pytest.mark.parametrize("link_mode", list(LinkModeEnum))
+def test_run_single_resume(workflow: DicomReorgWorkflow, link_mode: LinkModeEnum):
+    participant_id = "01"
+    session_id = "1"
+    workflow.link_mode = link_mode
+
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    manifest.save_with_backup(workflow.study.layout.fpath_manifest)
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+
+    dpath_source = workflow.study.layout.dpath_pre_reorg / participant_id / session_id
+    dpath_source.mkdir(parents=True)
+    fpaths_source = [dpath_source / f"{i}.dcm" for i in range(3)]
+    for fpath_source in fpaths_source:
+        fpath_source.write_text(f"content of {fpath_source.name}")
+
+    workflow.run_single(participant_id, session_id)
+    fpath_journal = workflow.get_fpath_journal(participant_id, session_id)
+    assert len(fpath_journal.read_text().splitlines()) == len(fpaths_source)
+
+    # simulate an interrupted run: the last file was not recorded in the journal
+    # and its destination is incomplete
+    lines = fpath_journal.read_text().splitlines()
+    fpath_journal.write_text("\n".join(lines[:-1]) + "\n")
+    fpath_dest_incomplete = Path(lines[-1].split("\t")[1])
+    fpath_dest_incomplete.unlink()
+    fpath_dest_incomplete.write_text("")
+
+    workflow.run_single(participant_id, session_id)
+
+    assert len(fpath_journal.read_text().splitlines()) == len(fpaths_source)
+    fpath_source = Path(lines[-1].split("\t")[0])
+    assert fpath_dest_incomplete.read_text() == fpath_source.read_text()
+
+
+def test_run_single_resume_skips_recorded(
+    workflow: DicomReorgWorkflow, mocker: pytest_mock.MockerFixture
+):
+    participant_id = "01"
+    session_id = "1"
+
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    manifest.save_with_backup(workflow.study.layout.fpath_manifest)
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+
+    fpath_source = (
+        workflow.study.layout.dpath_pre_reorg / participant_id / session_id / "test.dcm"
+    )
+    fpath_source.parent.mkdir(parents=True)
+    fpath_source.touch()
+
+    workflow.run_single(participant_id, session_id)
+
+    mocked_reorganize_file = mocker.patch.object(workflow, "reorganize_file")
+    workflow.run_single(participant_id, session_id)
+    mocked_reorganize_file.assert_not_called()
+
+
+def _prepare_archive_session(
+    workflow: DicomReorgWorkflow,
+    participant_id: str,
+    session_id: str,
+    fname_archive: str,
+    members: dict[str, bytes],
+) -> Path:
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    manifest.save_with_backup(workflow.study.layout.fpath_manifest)
+    workflow.dicom_dir_map = DicomDirMap(
+        data={
+            DicomDirMap.col_participant_id: [participant_id],
+            DicomDirMap.col_session_id: [session_id],
+            DicomDirMap.col_participant_dicom_dir: [fname_archive],
+        }
+    )
+    return _make_archive(workflow.study.layout.dpath_pre_reorg / fname_archive, members)
+
+
+@pytest.mark.parametrize("fname_archive", ["01_1.zip", "01_1.tar.gz"])
+def test_run_single_archive(workflow: DicomReorgWorkflow, fname_archive: str):
+    participant_id = "01"
+    session_id = "1"
+    workflow.check_dicoms = True
+    members = {
+        "series/derived.dcm": (DPATH_TEST_DATA / "dicom-derived.dcm").read_bytes(),
+        "series/not_derived.dcm": (
+            DPATH_TEST_DATA / "dicom-not_derived.dcm"
+        ).read_bytes(),
+    }
+    fpath_archive = _prepare_archive_session(
+        workflow, participant_id, session_id, fname_archive, members
+    )
+
+    workflow.run_single(participant_id, session_id)
+
+    dpath_reorganized = (
+        workflow.study.layout.dpath_post_reorg
+        / participant_id_to_bids_participant_id(participant_id)
+        / session_id_to_bids_session_id(session_id)
+    )
+    for member_name, content in members.items():
+        fpath_dest = dpath_reorganized / workflow.apply_fname_mapping(
+            fpath_archive / member_name, participant_id, session_id
+        )
+        assert not fpath_dest.is_symlink()
+        assert fpath_dest.read_bytes() == content
+    assert (
+        sum(n_derived for n_derived, _ in workflow.derived_dicom_counts.values()) == 1
+    )
+    assert workflow.curation_status_table.get_status(
+        participant_id=participant_id,
+        session_id=session_id,
+        col=workflow.curation_status_table.col_in_post_reorg,
+    )
+
+
+def test_run_single_archive_resume(
+    workflow: DicomReorgWorkflow, mocker: pytest_mock.MockerFixture
+):
+    participant_id = "01"
+    session_id = "1"
+    _prepare_archive_session(
+        workflow, participant_id, session_id, "01_1.zip", {"1.dcm": b"1", "2.dcm": b"2"}
+    )
+
+    workflow.run_single(participant_id, session_id)
+    fpath_journal = workflow.get_fpath_journal(participant_id, session_id)
+
+    # simulate an interruption after the first member
+    lines = fpath_journal.read_text().splitlines()
+    fpath_journal.write_text(lines[0] + "\n")
+    fpath_dest_incomplete = Path(lines[1].split("\t")[1])
+    fpath_dest_incomplete.write_bytes(b"")
+
+    spy = mocker.spy(fileops, "write_fileobj")
+    workflow.run_single(participant_id, session_id)
+
+    assert spy.call_count == 1
+    assert fpath_dest_incomplete.read_bytes() == b"2"
+
+
+def test_run_single_archive_file_exists(workflow: DicomReorgWorkflow):
+    participant_id = "01"
+    session_id = "1"
+    fpath_archive = _prepare_archive_session(
+        workflow, participant_id, session_id, "01_1.tar", {"1.dcm": b"1"}
+    )
+    fpath_dest = (
+        workflow.study.layout.dpath_post_reorg
+        / participant_id_to_bids_participant_id(participant_id)
+        / session_id_to_bids_session_id(session_id)
+        / workflow.apply_fname_mapping(
+            fpath_archive / "1.dcm", participant_id, session_id
+        )
+    )
+    fpath_dest.parent.mkdir(parents=True)
+    fpath_dest.touch()
+
+    with pytest.raises(FileOperationError, match="Cannot move file"):
+        workflow.run_single(participant_id, session_id)
+
+
+def test_run_single_archive_unreadable_dicom_no_partial_reorg(
+    workflow: DicomReorgWorkflow,
+):
+    participant_id = "01"
+    session_id = "1"
+    workflow.check_dicoms = True
+    _prepare_archive_session(
+        workflow,
+        participant_id,
+        session_id,
+        "01_1.tar.gz",
+        {
+            "1.dcm": (DPATH_TEST_DATA / "dicom-not_derived.dcm").read_bytes(),
+            "2.dcm": b"not a DICOM file",
+        },
+    )
+
+    with pytest.raises(WorkflowError, match="Error checking DICOM file"):
+        workflow.run_single(participant_id, session_id)
+
+    # headers are checked before any member is extracted
+    assert not any(
+        path.is_file() for path in workflow.study.layout.dpath_post_reorg.rglob("*")
+    )
+
+
+def test_run_single_archive_dedup(workflow: DicomReorgWorkflow):
+    participant_id = "01"
+    session_id = "1"
+    workflow.dedup = True
+    fpath_archive = _prepare_archive_session(
+        workflow,
+        participant_id,
+        session_id,
+        "01_1.zip",
+        {"b/1.dcm": b"same", "a/1.dcm": b"same", "c/1.dcm": b"other"},
+    )
+
+    workflow.run_single(participant_id, session_id)
+
+    dpath_reorganized = (
+        workflow.study.layout.dpath_post_reorg
+        / participant_id_to_bids_participant_id(participant_id)
+        / session_id_to_bids_session_id(session_id)
+    )
+    assert sorted(path.name for path in dpath_reorganized.iterdir()) == sorted(
+        workflow.apply_fname_mapping(
+            fpath_archive / member_name, participant_id, session_id
+        )
+        for member_name in ("a/1.dcm", "c/1.dcm")
+    )
+    assert workflow.n_duplicates == 1
+
+
+def test_run_main_prescan_archive(
+    workflow: DicomReorgWorkflow, mocker: pytest_mock.MockerFixture
+):
+    workflow.prescan = True
+    _prepare_archive_session(workflow, "01", "1", "01_1.zip", {"1.dcm": b"1"})
+    mocker.patch.object(
+        workflow, "get_participants_sessions_to_run", return_value=[("01", "1")]
+    )
+
+    with pytest.raises(WorkflowError, match="--prescan cannot be used with archives"):
+        workflow.run_main()
+
+
 @pytest.mark.no_xdist
 def test_run_single_invalid_dicom(
     workflow: DicomReorgWorkflow, caplog: pytest.LogCaptureFixture
@@ -207,6 +706,202 @@ def test_run_single_invalid_dicom(
     )
 
 
+def test_run_single_unreadable_dicom_no_partial_reorg(workflow: DicomReorgWorkflow):
+    participant_id = "01"
+    session_id = "1"
+    workflow.check_dicoms = True
+    workflow.link_mode = LinkModeEnum.COPY
+
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+    dpath_dicoms = workflow.study.layout.dpath_pre_reorg / participant_id / session_id
+    dpath_dicoms.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(DPATH_TEST_DATA / "dicom-not_derived.dcm", dpath_dicoms / "a.dcm")
+    (dpath_dicoms / "b.dcm").write_text("not a DICOM file")
+
+    with pytest.raises(WorkflowError, match="Error checking DICOM file"):
+        workflow.run_single(participant_id, session_id)
+
+    # no file was reorganized
+    dpath_reorganized = (
+        workflow.study.layout.dpath_post_reorg
+        / participant_id_to_bids_participant_id(participant_id)
+        / session_id_to_bids_session_id(session_id)
+    )
+    assert not dpath_reorganized.exists() or not any(
+        fpath.is_file() for fpath in dpath_reorganized.iterdir()
+    )
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_run_single_derived_dicom_counts(workflow: DicomReorgWorkflow, n_jobs):
+    participant_id = "01"
+    session_id = "1"
+    workflow.check_dicoms = True
+    workflow.n_jobs = n_jobs
+
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    manifest.save_with_backup(workflow.study.layout.fpath_manifest)
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+
+    dpath_dicoms = workflow.study.layout.dpath_pre_reorg / participant_id / session_id
+    dpath_dicoms.mkdir(parents=True, exist_ok=True)
+    for i in range(3):
+        shutil.copyfile(
+            DPATH_TEST_DATA / "dicom-derived.dcm", dpath_dicoms / f"derived{i}.dcm"
+        )
+    shutil.copyfile(
+        DPATH_TEST_DATA / "dicom-not_derived.dcm", dpath_dicoms / "not_derived.dcm"
+    )
+
+    workflow.run_single(participant_id, session_id)
+
+    assert len(workflow.derived_dicom_counts) == 1
+    ((key, counts),) = workflow.derived_dicom_counts.items()
+    assert key[:2] == (participant_id, session_id)
+    assert "Postprocessing" in key[2]
+    assert counts == [3, 3]
+
+
+def test_run_single_check_dicoms_uses_index(
+    workflow: DicomReorgWorkflow, mocker: pytest_mock.MockerFixture
+):
+    participant_id = "01"
+    session_id = "1"
+    workflow.check_dicoms = True
+
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    manifest.save_with_backup(workflow.study.layout.fpath_manifest)
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+
+    dpath_dicoms = workflow.study.layout.dpath_pre_reorg / participant_id / session_id
+    dpath_dicoms.mkdir(parents=True, exist_ok=True)
+    fpath_indexed = dpath_dicoms / "derived.dcm"
+    fpath_not_indexed = dpath_dicoms / "not_derived.dcm"
+    shutil.copyfile(DPATH_TEST_DATA / "dicom-derived.dcm", fpath_indexed)
+    with DicomHeaderIndex(
+        workflow.study.layout.fpath_dicom_index, workflow.study.layout.dpath_pre_reorg
+    ) as index:
+        stat = fpath_indexed.stat()
+        index.update(
+            fpath_indexed,
+            stat.st_mtime_ns,
+            stat.st_size,
+            dcm_info=read_dicom_header(fpath_indexed),
+        )
+        index.commit()
+    shutil.copyfile(DPATH_TEST_DATA / "dicom-not_derived.dcm", fpath_not_indexed)
+
+    spy = mocker.spy(dicom_reorg, "read_dicom_header")
+    workflow.run_single(participant_id, session_id)
+
+    spy.assert_called_once_with(fpath_not_indexed)
+    assert [counts for counts in workflow.derived_dicom_counts.values()] == [[1, 1]]
+
+
+@pytest.fixture()
+def fpaths_with_duplicates(workflow: DicomReorgWorkflow) -> list[Path]:
+    dpath_source = workflow.study.layout.dpath_pre_reorg / "01" / "1"
+    fpaths = []
+    for dname, fname, content in [
+        ("delivery1", "1.dcm", "A"),
+        ("delivery1", "2.dcm", "B"),
+        ("delivery2", "1.dcm", "A"),  # duplicate
+        ("delivery2", "2.dcm", "C"),  # same size as other files but not a duplicate
+        ("delivery2", "3.dcm", "DD"),
+    ]:
+        fpath = dpath_source / dname / fname
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        fpath.write_text(content)
+        fpaths.append(fpath)
+    return fpaths
+
+
+def test_deduplicate_fpaths(
+    workflow: DicomReorgWorkflow,
+    fpaths_with_duplicates: list[Path],
+    mocker: pytest_mock.MockerFixture,
+):
+    spy = mocker.spy(fileops, "hash_file")
+
+    fpaths = workflow.deduplicate_fpaths(fpaths_with_duplicates[::-1])
+
+    assert fpaths == [
+        fpath
+        for fpath in fpaths_with_duplicates[::-1]
+        if "delivery2/1.dcm" not in str(fpath)
+    ]
+    assert workflow.n_duplicates == 1
+    # file with a unique size does not need to be hashed
+    assert spy.call_count == 4
+
+
+def test_deduplicate_fpaths_hash_index(
+    workflow: DicomReorgWorkflow,
+    fpaths_with_duplicates: list[Path],
+    mocker: pytest_mock.MockerFixture,
+):
+    workflow.deduplicate_fpaths(fpaths_with_duplicates)
+    assert workflow.study.layout.fpath_hash_index.exists()
+
+    # hashes of unchanged files are not recomputed
+    fpaths_with_duplicates[1].write_text("A")
+    spy = mocker.spy(fileops, "hash_file")
+    fpaths = workflow.deduplicate_fpaths(fpaths_with_duplicates)
+
+    spy.assert_called_once_with(fpaths_with_duplicates[1])
+    assert len(fpaths) == 3
+
+
+def test_deduplicate_fpaths_dry_run(
+    workflow: DicomReorgWorkflow, fpaths_with_duplicates: list[Path]
+):
+    workflow.dry_run = True
+    assert len(workflow.deduplicate_fpaths(fpaths_with_duplicates)) == 4
+    assert not workflow.study.layout.fpath_hash_index.exists()
+
+
+def test_run_single_dedup(
+    workflow: DicomReorgWorkflow, fpaths_with_duplicates: list[Path]
+):
+    participant_id = "01"
+    session_id = "1"
+    workflow.dedup = True
+    manifest = prepare_dataset(
+        participants_and_sessions_manifest={participant_id: [session_id]}
+    )
+    manifest.save_with_backup(workflow.study.layout.fpath_manifest)
+    workflow.dicom_dir_map = DicomDirMap.load_or_generate(
+        manifest=manifest, fpath_dicom_dir_map=None, participant_first=True
+    )
+
+    workflow.run_single(participant_id, session_id)
+
+    dpath_reorganized = (
+        workflow.study.layout.dpath_post_reorg
+        / participant_id_to_bids_participant_id(participant_id)
+        / session_id_to_bids_session_id(session_id)
+    )
+    assert sorted(fpath.read_text() for fpath in dpath_reorganized.iterdir()) == [
+        "A",
+        "B",
+        "C",
+        "DD",
+    ]
+
+
 def test_run_single_error_dicom_read(workflow: DicomReorgWorkflow):
     participant_id = "01"
     session_id = "1"
@@ -358,15 +1053,18 @@ def test_run_setup(workflow: DicomReorgWorkflow):
         ),
     ],
 )
-@pytest.mark.parametrize("copy_files", [True, False])
+@pytest.mark.parametrize("link_mode", list(LinkModeEnum))
+@pytest.mark.parametrize("prescan", [False, True])
 def test_run_main(
     workflow: DicomReorgWorkflow,
     participants_and_sessions_manifest: dict,
     participants_and_sessions_downloaded: dict,
-    copy_files: bool,
+    link_mode: LinkModeEnum,
+    prescan: bool,
     mocker: pytest_mock.MockerFixture,
 ):
-    workflow.copy_files = copy_files
+    workflow.link_mode = link_mode
+    workflow.prescan = prescan
 
     manifest: Manifest = prepare_dataset(
         participants_and_sessions_manifest=participants_and_sessions_manifest,
@@ -402,10 +1100,12 @@ def test_run_main(
                 # and that symlinks are created if requested
                 count = 0
                 for fpath in dpath_to_check.iterdir():
-                    if copy_files:
-                        assert not fpath.is_symlink()
-                    else:
+                    if link_mode == LinkModeEnum.SYMLINK:
                         assert fpath.is_symlink()
+                    else:
+                        assert not fpath.is_symlink()
+                    if link_mode == LinkModeEnum.HARDLINK:
+                        assert fpath.stat().st_nlink == 2
                     count += 1
                 assert count > 0
 
@@ -421,6 +1121,8 @@ def test_run_main(
 
     assert workflow.n_total != 0
     assert workflow.n_success == workflow.n_total
+    # journals are deleted after the curation status table is saved
+    assert not any((workflow.study.layout.dpath_work / workflow.name).iterdir())
     mocked_save_with_backup.assert_called_once_with(
         workflow.study.layout.fpath_curation_status,
         dry_run=workflow.dry_run,
@@ -488,3 +1190,15 @@ def test_log_summary_message(
     workflow._log_summary_message()
 
     assert expected_message.format(n_success, n_total) in caplog.text
+
+
+@pytest.mark.no_xdist
+def test_log_summary_message_derived_dicoms(
+    workflow: DicomReorgWorkflow, caplog: pytest.LogCaptureFixture
+):
+    workflow.curation_status_table = CurationStatusTable()  # empty table to avoid error
+    workflow.derived_dicom_counts = {("01", "1", "2 Postprocessing (1.2.3)"): [3, 5]}
+    workflow._log_summary_message()
+
+    assert "Found derived DICOM files in 1 series" in caplog.text
+    assert "3/5 derived files" in caplog.text
@@ -29,6 +29,7 @@ from nipoppy.env import (
     FAKE_SESSION_ID,
     ConfigType,
     ContainerCommandEnum,
+    PipelineTypeEnum,
 )
 from nipoppy.exceptions import (
     ConfigError,
@@ -37,10 +38,7 @@ from nipoppy.exceptions import (
     WorkflowError,
 )
 from nipoppy.logger import get_logger
-from nipoppy.workflows.pipeline import (
-    BasePipelineWorkflow,
-    get_pipeline_version,
-)
+from nipoppy.workflows.pipeline import BasePipelineWorkflow
 from tests.conftest import datetime_fixture  # noqa F401
 from tests.conftest import (
     _set_up_substitution_testing,
@@ -200,31 +198,32 @@ def test_apply_analysis_level(analysis_level, expected):
 
 
 @pytest.mark.parametrize(
-    "dname_pipelines,pipeline_name,expected_version",
+    "pipeline_type,pipeline_name,expected_version",
     [
-        ("processing", "fmriprep", "23.1.3"),
-        ("processing", "my_pipeline", "2.0"),
-        ("bidsification", "bids_converter", "1.0"),
-        ("extraction", "extractor1", "0.1.0"),
+        (PipelineTypeEnum.PROCESSING, "fmriprep", "23.1.3"),
+        (PipelineTypeEnum.PROCESSING, "my_pipeline", "2.0"),
+        (PipelineTypeEnum.BIDSIFICATION, "bids_converter", "1.0"),
+        (PipelineTypeEnum.EXTRACTION, "extractor1", "0.1.0"),
     ],
 )
-def test_get_pipeline_version(
-    dname_pipelines: str,
+def test_check_pipeline_version_pipeline_type(
+    pipeline_type: PipelineTypeEnum,
     pipeline_name: str,
     expected_version: str,
     workflow: BasePipelineWorkflow,
 ):
-    assert (
-        get_pipeline_version(
-            pipeline_name, workflow.study.layout.dpath_pipelines / dname_pipelines
-        )
-        == expected_version
-    )
+    workflow._pipeline_type = pipeline_type
+    workflow.pipeline_name = pipeline_name
+    workflow.pipeline_version = None
+    workflow.check_pipeline_version()
+    assert workflow.pipeline_version == expected_version
 
 
-def test_get_pipeline_version_invalid_name(tmp_path: Path):
+def test_check_pipeline_version_invalid_name(workflow: BasePipelineWorkflow):
+    workflow.pipeline_name = "pipeline1"
+    workflow.pipeline_version = None
     with pytest.raises(WorkflowError, match="No config found for pipeline"):
-        get_pipeline_version("pipeline1", tmp_path)
+        workflow.check_pipeline_version()
 
 
 @pytest.mark.parametrize(
@@ -636,7 +635,8 @@ def test_get_pipeline_config(
 
 
 def test_get_pipeline_config_json5(workflow: PipelineWorkflow, tmp_path: Path):
-    (tmp_path / "config.json").write_text(f"""
+    (tmp_path / "config.json").write_text(
+        f"""
 {{
   // Comments and trailing commas should be supported
   "NAME": "{workflow.pipeline_name}",
@@ -647,7 +647,8 @@ def test_get_pipeline_config_json5(workflow: PipelineWorkflow, tmp_path: Path):
     {{}},
   ],
 }}
-""".strip())
+""".strip()
+    )
 
     config = workflow._get_pipeline_config(
         tmp_path,
@@ -767,6 +768,20 @@ def test_process_template_json(workflow: PipelineWorkflow, return_str):
         assert pattern not in processed
 
 
+def test_process_template_json_compiled(workflow: PipelineWorkflow):
+    workflow.study.config.SUBSTITUTIONS = {"USER_SUBSTITUTION": "val1"}
+    template = workflow.compile_template_json(
+        {"USER_SUBSTITUTION": ["sub-[[NIPOPPY_PARTICIPANT_ID]]"]}
+    )
+    objs = []
+    for participant_id in ("01", "02"):
+        assert workflow.process_template_json(
+            template, participant_id=participant_id, objs=objs
+        ) == {"val1": [f"sub-{participant_id}"]}
+    # caller's list should not be modified
+    assert objs == []
+
+
 def test_boutiques_config(tmp_path: Path):
     workflow = PipelineWorkflow(
         dpath_root=tmp_path / "my_dataset",
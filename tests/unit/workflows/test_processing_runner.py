@@ -18,10 +18,12 @@ from nipoppy.exceptions import (
 from nipoppy.tabular.curation_status import CurationStatusTable
 from nipoppy.tabular.manifest import Manifest
 from nipoppy.tabular.processing_status import ProcessingStatusTable
+from nipoppy.utils import fileops
 from nipoppy.workflows.processing_runner import (
     ProcessingRunner,
     _get_bids_paths_to_inject,
 )
+from nipoppy.workflows.tracker import TrackerFingerprints
 from tests.conftest import (
     create_empty_dataset,
     create_pipeline_config_files,
@@ -248,6 +250,16 @@ def test_check_tar_conditions_no_tar(runner: ProcessingRunner):
     runner._check_tar_conditions()
 
 
+def test_check_track_conditions_no_tracker_config(runner: ProcessingRunner):
+    runner.track = True
+    runner.pipeline_step_config.TRACKER_CONFIG_FILE = None
+    with pytest.raises(
+        ConfigError,
+        match="Tracking requested but there is no tracker config file",
+    ):
+        runner._check_track_conditions()
+
+
 @pytest.mark.parametrize("dpath_type", [Path, str])
 def test_tar_directory(tmp_path: Path, dpath_type):
     # create dummy files to tar
@@ -277,6 +289,16 @@ def test_tar_directory(tmp_path: Path, dpath_type):
         }
     assert tarred_files == set(fpaths_to_tar)
 
+    # member listing file
+    assert sorted(
+        fileops.get_fpath_tar_members(fpath_tarred).read_text().splitlines()
+    ) == [
+        "my_data",
+        "my_data/dir1",
+        "my_data/dir1/file1.txt",
+        "my_data/file2.txt",
+    ]
+
     assert not dpath_to_tar.exists()
 
 
@@ -706,3 +728,92 @@ def test_run_main_write_subcohort(
     runner.run_main()
 
     mocked_write_subcohort_to_file.assert_called_once()
+
+
+@pytest.mark.parametrize("simulate", [False, True])
+def test_run_track(
+    runner: ProcessingRunner, simulate: bool, mocker: pytest_mock.MockFixture
+):
+    runner.track = True
+    runner.simulate = simulate
+    runner.pipeline_step_config.TRACKER_CONFIG_FILE = "tracker_config.json"
+    (runner.dpath_pipeline_bundle / "tracker_config.json").write_text(
+        json.dumps(
+            {
+                "PATHS": ["[[NIPOPPY_PARTICIPANT_ID]]/[[NIPOPPY_BIDS_SESSION_ID]]"],
+                "PARTICIPANT_SESSION_DIR": (
+                    "[[NIPOPPY_PARTICIPANT_ID]]/[[NIPOPPY_BIDS_SESSION_ID]]"
+                ),
+            }
+        )
+    )
+
+    def run_single(participant_id, session_id):
+        if session_id == "3":
+            raise RuntimeError("Pipeline failed")
+        if participant_id == "01":
+            (runner.dpath_pipeline_output / participant_id / f"ses-{session_id}").mkdir(
+                parents=True
+            )
+
+    mocker.patch.object(runner, "run_single", side_effect=run_single)
+
+    runner.run_setup()
+    runner.run_main()
+
+    fpath_processing_status = runner.study.layout.fpath_processing_status
+    if simulate:
+        assert not fpath_processing_status.exists()
+        return
+
+    processing_status_table = ProcessingStatusTable.load(fpath_processing_status)
+    assert {
+        (participant_id, session_id): status
+        for participant_id, session_id, status in processing_status_table[
+            [
+                ProcessingStatusTable.col_participant_id,
+                ProcessingStatusTable.col_session_id,
+                ProcessingStatusTable.col_status,
+            ]
+        ].itertuples(index=False)
+    } == {
+        ("01", "1"): ProcessingStatusTable.status_success,
+        ("01", "2"): ProcessingStatusTable.status_success,
+        ("01", "3"): ProcessingStatusTable.status_fail,
+        ("02", "1"): ProcessingStatusTable.status_fail,
+    }
+
+    # outputs of successful runs do not need to be checked again by the tracker
+    with TrackerFingerprints(
+        runner.study.layout.fpath_tracker_fingerprints
+    ) as fingerprints_table:
+        assert (
+            len(
+                fingerprints_table.load(
+                    runner.pipeline_name, runner.pipeline_version, runner.pipeline_step
+                )
+            )
+            == 3
+        )
+
+
+def test_generate_cli_command_for_hpc_track(
+    runner: ProcessingRunner, mocker: pytest_mock.MockFixture
+):
+    mocked_generate_cli_command = mocker.patch.object(
+        runner.hpc_runner, "generate_cli_command"
+    )
+    runner.tar = True
+    runner.track = True
+    runner._generate_cli_command_for_hpc("01", "1")
+    assert mocked_generate_cli_command.call_args.kwargs["extra_flags"] == [
+        "--tar",
+        "--track",
+    ]
+
+
+def test_get_dpath_inputs(runner: ProcessingRunner):
+    assert (
+        runner.get_dpath_inputs("01", "1")
+        == runner.study.layout.dpath_bids / "sub-01" / "ses-1"
+    )
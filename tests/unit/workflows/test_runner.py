@@ -2,12 +2,19 @@
 
 import copy
 import json
+import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
 import pytest_mock
+from boutiques import bosh
+from boutiques.invocationSchemaHandler import InvocationValidationError
 
-from nipoppy.config.hpc import HpcConfig
+from nipoppy.config.hpc import HpcConfig, parse_memory
+from nipoppy.config.pipeline_step import RetryConfig
 from nipoppy.container import (
     ApptainerHandler,
     ContainerHandler,
@@ -15,11 +22,17 @@ from nipoppy.container import (
     SingularityHandler,
 )
 from nipoppy.env import ContainerCommandEnum
-from nipoppy.exceptions import ConfigError
+from nipoppy.exceptions import (
+    ConfigError,
+    ExecutionError,
+    FileOperationError,
+    ReturnCode,
+    WorkflowError,
+)
 from nipoppy.pipeline_validation import check_pipeline_bundle
 from nipoppy.utils.utils import get_pipeline_tag
 from nipoppy.workflows.processing_runner import ProcessingRunner
-from nipoppy.workflows.runner import Runner
+from nipoppy.workflows.runner import Runner, RunTimes
 from tests.conftest import (
     _set_up_substitution_testing,
     create_empty_dataset,
@@ -131,7 +144,7 @@ def test_run_setup_validates_pipeline_bundle(
 ):
     runner.pipeline_version = None
     mocked_check_pipeline_bundle = mocker.patch(
-        "nipoppy.workflows.runner.check_pipeline_bundle",
+        "nipoppy.pipeline_validation.check_pipeline_bundle",
         wraps=check_pipeline_bundle,
     )
 
@@ -142,13 +155,17 @@ def test_run_setup_validates_pipeline_bundle(
         runner.dpath_pipeline_bundle, strict=False
     )
 
+    # unchanged bundle is not validated again
+    runner.run_setup()
+    mocked_check_pipeline_bundle.assert_called_once()
+
 
 def test_run_validation_error_prevents_execution(
     runner: Runner, mocker: pytest_mock.MockFixture
 ):
     error = ConfigError("Invalid pipeline bundle")
     mocker.patch(
-        "nipoppy.workflows.runner.check_pipeline_bundle",
+        "nipoppy.workflows.runner.check_pipeline_bundle_cached",
         side_effect=error,
     )
     mocked_run_main = mocker.patch.object(runner, "run_main")
@@ -282,6 +299,587 @@ def test_generate_cli_command_for_hpc(
     )
 
 
+def test_init_n_jobs(tmp_path: Path):
+    # n_jobs does not require _skip_logfile for runners
+    runner = ProcessingRunner(
+        dpath_root=tmp_path, pipeline_name="dummy_pipeline", n_jobs=4
+    )
+    assert runner.n_jobs == 4
+
+
+def test_init_n_jobs_simulate_output(tmp_path: Path):
+    with pytest.raises(WorkflowError, match="mutually exclusive"):
+        ProcessingRunner(
+            dpath_root=tmp_path,
+            pipeline_name="dummy_pipeline",
+            simulate_output=tmp_path / "commands.txt",
+            n_jobs=2,
+        )
+
+
+@pytest.mark.parametrize("simulate", [True, False])
+def test_generate_cli_command_for_subprocess(runner: Runner, simulate: bool):
+    runner.simulate = simulate
+    runner.track = True
+    command = runner._generate_cli_command_for_subprocess("01", "BL")
+    assert command[:4] == [sys.executable, "-m", "nipoppy", "process"]
+    assert command[command.index("--participant-id") + 1] == "01"
+    assert command[command.index("--session-id") + 1] == "BL"
+    assert "--track" in command
+    assert ("--simulate" in command) == simulate
+    assert "--n-jobs" not in command
+
+
+def test_run_locally_n_jobs(
+    runner: Runner, mocker: pytest_mock.MockFixture, caplog: pytest.LogCaptureFixture
+):
+    def run(command, **kwargs):
+        participant_id = command[command.index("--participant-id") + 1]
+        return mocker.Mock(returncode=0 if participant_id == "01" else 1)
+
+    runner.n_jobs = 2
+    mocked_run = mocker.patch(
+        "nipoppy.workflows.runner.subprocess.run", side_effect=run
+    )
+    mocked_run_single = mocker.patch.object(runner, "run_single")
+
+    runner._run_locally([("01", "1"), ("01", "2"), ("02", "1")])
+
+    mocked_run_single.assert_not_called()
+    assert mocked_run.call_count == 3
+    assert runner.n_success == 2
+    assert runner.n_total == 3
+    assert runner.return_code == ReturnCode.PARTIAL_SUCCESS
+    assert "participant 02, session 1: process exited with return code 1" in (
+        caplog.text
+    )
+
+
+def test_run_locally_n_jobs_launch_error(
+    runner: Runner, mocker: pytest_mock.MockFixture, caplog: pytest.LogCaptureFixture
+):
+    def run(command, **kwargs):
+        participant_id = command[command.index("--participant-id") + 1]
+        if participant_id == "02":
+            raise FileNotFoundError("No such file or directory")
+        return mocker.Mock(returncode=0)
+
+    runner.n_jobs = 2
+    mocker.patch("nipoppy.workflows.runner.subprocess.run", side_effect=run)
+
+    runner._run_locally([("01", "1"), ("02", "1"), ("03", "1")])
+
+    assert runner.n_success == 2
+    assert runner.n_total == 3
+    assert runner.return_code == ReturnCode.PARTIAL_SUCCESS
+    assert "participant 02, session 1: could not start process" in caplog.text
+
+
+def test_run_locally_n_jobs_dry_run(runner: Runner, mocker: pytest_mock.MockFixture):
+    runner.n_jobs = 2
+    runner.dry_run = True
+    mocked_run = mocker.patch("nipoppy.workflows.runner.subprocess.run")
+
+    runner._run_locally([("01", "1"), ("02", "1")])
+
+    mocked_run.assert_not_called()
+    assert runner.n_success == runner.n_total == 2
+
+
+@pytest.mark.parametrize(
+    "max_cores,max_mem,n_jobs,expected",
+    [
+        (None, None, 1, 1),
+        (None, None, 3, 3),
+        (16, None, 1, 4),
+        (18, None, 1, 4),
+        (None, "64G", 1, 4),
+        (None, "100G", 1, 6),
+        (16, "32G", 1, 2),
+        (16, "64G", 3, 3),
+    ],
+)
+def test_get_n_parallel_jobs(
+    runner: Runner,
+    max_cores,
+    max_mem,
+    n_jobs,
+    expected,
+    mocker: pytest_mock.MockFixture,
+):
+    mocker.patch.object(
+        Runner,
+        "hpc_config",
+        new_callable=mocker.PropertyMock,
+        return_value=HpcConfig(CORES=4, MEMORY="16G"),
+    )
+    runner.max_cores = max_cores
+    runner._max_mem_bytes = None if max_mem is None else parse_memory(max_mem)
+    runner.n_jobs = n_jobs
+    assert runner._get_n_parallel_jobs() == expected
+
+
+@pytest.mark.parametrize(
+    "hpc_config,max_cores,max_mem,error_message",
+    [
+        (HpcConfig(CORES=8), 4, None, "exceeds the maximum number of cores"),
+        (HpcConfig(MEMORY="16G"), None, "8G", "exceeds the maximum amount of memory"),
+        (HpcConfig(CORES=8), None, "8G", "MEMORY must be set"),
+    ],
+)
+def test_get_n_parallel_jobs_error(
+    runner: Runner,
+    hpc_config,
+    max_cores,
+    max_mem,
+    error_message,
+    mocker: pytest_mock.MockFixture,
+):
+    mocker.patch.object(
+        Runner,
+        "hpc_config",
+        new_callable=mocker.PropertyMock,
+        return_value=hpc_config,
+    )
+    runner.max_cores = max_cores
+    runner.max_mem = max_mem
+    runner._max_mem_bytes = None if max_mem is None else parse_memory(max_mem)
+    with pytest.raises(WorkflowError, match=error_message):
+        runner._get_n_parallel_jobs()
+
+
+def test_get_n_parallel_jobs_default_cores(
+    runner: Runner, mocker: pytest_mock.MockFixture
+):
+    # one core per run if CORES is not set
+    mocker.patch.object(
+        Runner, "hpc_config", new_callable=mocker.PropertyMock, return_value=HpcConfig()
+    )
+    runner.max_cores = 6
+    assert runner._get_n_parallel_jobs() == 6
+
+
+def test_init_max_mem_invalid(tmp_path: Path):
+    with pytest.raises(ConfigError, match="Invalid memory amount"):
+        ProcessingRunner(
+            dpath_root=tmp_path, pipeline_name="dummy_pipeline", max_mem="a lot"
+        )
+
+
+def test_run_locally_max_cores(runner: Runner, mocker: pytest_mock.MockFixture):
+    mocker.patch.object(
+        Runner,
+        "hpc_config",
+        new_callable=mocker.PropertyMock,
+        return_value=HpcConfig(CORES=2),
+    )
+    runner.max_cores = 4
+    mocked_run_in_subprocesses = mocker.patch.object(
+        runner, "_run_in_subprocesses", return_value=[]
+    )
+
+    runner._run_locally([("01", "1"), ("02", "1"), ("03", "1")])
+
+    mocked_run_in_subprocesses.assert_called_once_with(
+        [("01", "1"), ("02", "1"), ("03", "1")], 2
+    )
+
+
+def test_run_locally_budget_fits_one_job(
+    runner: Runner, mocker: pytest_mock.MockFixture
+):
+    mocker.patch.object(
+        Runner,
+        "hpc_config",
+        new_callable=mocker.PropertyMock,
+        return_value=HpcConfig(CORES=3),
+    )
+    runner.max_cores = 4
+    runner.n_jobs = 4
+    mocked_run_in_subprocesses = mocker.patch.object(runner, "_run_in_subprocesses")
+    n_running = 0
+    n_running_max = 0
+    lock = threading.Lock()
+
+    def _run_single(participant_id, session_id):
+        nonlocal n_running, n_running_max
+        with lock:
+            n_running += 1
+            n_running_max = max(n_running_max, n_running)
+        time.sleep(0.05)
+        with lock:
+            n_running -= 1
+
+    mocker.patch.object(runner, "run_single", side_effect=_run_single)
+
+    runner._run_locally([("01", "1"), ("02", "1"), ("03", "1"), ("04", "1")])
+
+    mocked_run_in_subprocesses.assert_not_called()
+    assert n_running_max == 1
+
+
+@pytest.mark.parametrize(
+    "n_jobs,participants_sessions",
+    [(1, [("01", "1"), ("02", "1")]), (2, [("01", "1")])],
+)
+def test_run_locally_n_jobs_in_process(
+    runner: Runner,
+    n_jobs: int,
+    participants_sessions: list,
+    mocker: pytest_mock.MockFixture,
+):
+    runner.n_jobs = n_jobs
+    mocked_run = mocker.patch("nipoppy.workflows.runner.subprocess.run")
+    mocked_run_single = mocker.patch.object(runner, "run_single")
+
+    runner._run_locally(participants_sessions)
+
+    mocked_run.assert_not_called()
+    assert mocked_run_single.call_count == len(participants_sessions)
+
+
+def test_run_times(tmp_path: Path):
+    fpath = tmp_path / "run_times.sqlite"
+    with RunTimes(fpath) as run_times_table:
+        run_times_table.update({("01", "1"): 10.0, ("02", None): 20.0}, "p", "1", "s")
+        run_times_table.update({("01", "1"): 30.0}, "p", "1", "s")
+        run_times_table.update({("01", "1"): 40.0}, "p", "2", "s")
+    with RunTimes(fpath) as run_times_table:
+        assert run_times_table.load("p", "1", "s") == {
+            ("01", "1"): 30.0,
+            ("02", None): 20.0,
+        }
+
+
+def test_run_times_not_open(tmp_path: Path):
+    with pytest.raises(FileOperationError, match="Index is not open"):
+        RunTimes(tmp_path / "run_times.sqlite").connection
+
+
+@pytest.mark.parametrize(
+    "success,simulate,expected_recorded",
+    [(True, False, True), (False, False, False), (True, True, False)],
+)
+def test_run_single_wrapper_run_time(
+    runner: Runner,
+    success: bool,
+    simulate: bool,
+    expected_recorded: bool,
+    mocker: pytest_mock.MockFixture,
+):
+    runner.simulate = simulate
+    mocker.patch.object(
+        runner,
+        "run_single",
+        side_effect=None if success else RuntimeError("failed"),
+    )
+    runner._run_single_wrapper("01", "1")
+    assert (("01", "1") in runner._run_times) == expected_recorded
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_save_run_times(runner: Runner, dry_run: bool):
+    runner.dry_run = dry_run
+    runner.pipeline_step = "default"
+    runner._run_times = {("01", "1"): 12.5}
+    runner._save_run_times()
+
+    fpath_run_times = runner.study.layout.fpath_run_times
+    if dry_run:
+        assert not fpath_run_times.exists()
+    else:
+        with RunTimes(fpath_run_times) as run_times_table:
+            assert run_times_table.load("dummy_pipeline", "1.0.0", "default") == {
+                ("01", "1"): 12.5
+            }
+
+
+def test_order_longest_first(
+    runner: Runner, tmp_path: Path, mocker: pytest_mock.MockFixture
+):
+    runner.pipeline_step = "default"
+    with RunTimes(runner.study.layout.fpath_run_times) as run_times_table:
+        run_times_table.update(
+            {("01", "1"): 10.0, ("02", "1"): 30.0}, "dummy_pipeline", "1.0.0", "default"
+        )
+
+    # participants 03 and 04 have no recorded run time
+    for participant_id, size in [("03", 1), ("04", 100)]:
+        dpath = tmp_path / "inputs" / f"sub-{participant_id}" / "ses-1"
+        dpath.mkdir(parents=True)
+        (dpath / "file.nii.gz").write_bytes(b"0" * size)
+    mocker.patch.object(
+        runner,
+        "get_dpath_inputs",
+        side_effect=lambda participant_id, session_id: (
+            runner._get_dpath_participant_session(
+                tmp_path / "inputs", participant_id, session_id
+            )
+        ),
+    )
+
+    assert runner._order_longest_first(
+        [("01", "1"), ("02", "1"), ("03", "1"), ("04", "1"), ("05", "1")]
+    ) == [("04", "1"), ("03", "1"), ("05", "1"), ("02", "1"), ("01", "1")]
+
+
+@pytest.mark.parametrize(
+    "participant_id,session_id,expected",
+    [
+        ("01", "1", "sub-01/ses-1"),
+        ("01", None, "sub-01"),
+        (None, "1", None),
+    ],
+)
+def test_get_dpath_participant_session(participant_id, session_id, expected):
+    dpath = Runner._get_dpath_participant_session(
+        Path("parent"), participant_id, session_id
+    )
+    if expected is None:
+        assert dpath is None
+    else:
+        assert dpath == Path("parent") / expected
+
+
+def test_run_locally_n_jobs_longest_first(
+    runner: Runner, mocker: pytest_mock.MockFixture
+):
+    runner.n_jobs = 2
+    mocker.patch.object(
+        runner, "_order_longest_first", side_effect=lambda pairs: pairs[::-1]
+    )
+    mocked_run_in_subprocesses = mocker.patch.object(
+        runner, "_run_in_subprocesses", return_value=[]
+    )
+
+    runner._run_locally([("01", "1"), ("02", "1")])
+
+    mocked_run_in_subprocesses.assert_called_once_with([("02", "1"), ("01", "1")], 2)
+
+
+@pytest.mark.parametrize(
+    "timeout,config_timeout,expected",
+    [(None, None, None), (None, 3600, 3600), (60, 3600, 60), (60, None, 60)],
+)
+def test_run_timeout(runner: Runner, timeout, config_timeout, expected):
+    runner.timeout = timeout
+    runner.pipeline_step_config.TIMEOUT = config_timeout
+    assert runner.run_timeout == expected
+
+
+@pytest.mark.parametrize("timeout", [None, 60])
+def test_launch_boutiques_run_timeout(
+    runner: Runner, timeout, mocker: pytest_mock.MockFixture
+):
+    runner.timeout = timeout
+    mocked_run_command = mocker.patch("nipoppy.workflows.runner._run_command")
+
+    runner.launch_boutiques_run("01", "1")
+
+    assert mocked_run_command.call_args[1].get("timeout") == timeout
+
+
+def test_run_locally_timeout(runner: Runner, mocker: pytest_mock.MockFixture):
+    runner.timeout = 60
+    mocker.patch(
+        "nipoppy.workflows.runner._run_command",
+        side_effect=[
+            subprocess.TimeoutExpired(cmd=["bosh"], timeout=60),
+            mocker.MagicMock(),
+        ],
+    )
+
+    runner._run_locally([("01", "1"), ("02", "1")])
+
+    assert runner._timed_out == {("01", "1")}
+    assert runner.n_success == 1
+    assert runner.return_code == ReturnCode.PIPELINE_TIMEOUT
+
+
+def test_run_locally_n_jobs_timeout(
+    runner: Runner, mocker: pytest_mock.MockFixture, caplog: pytest.LogCaptureFixture
+):
+    runner.n_jobs = 2
+    runner.timeout = 60
+    mocked_run = mocker.patch(
+        "nipoppy.workflows.runner.subprocess.run",
+        return_value=mocker.Mock(returncode=ReturnCode.PIPELINE_TIMEOUT),
+    )
+
+    runner._run_locally([("01", "1"), ("02", "1")])
+
+    command = mocked_run.call_args[0][0]
+    assert command[command.index("--timeout") + 1] == "60"
+    assert runner._timed_out == {("01", "1"), ("02", "1")}
+    assert runner.n_success == 0
+    assert runner.return_code == ReturnCode.PIPELINE_TIMEOUT
+    assert "2 participants or sessions exceeded the time limit" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "max_attempts,config_max_attempts,expected",
+    [(None, 1, 1), (None, 3, 3), (2, 3, 2)],
+)
+def test_run_retry_config(runner: Runner, max_attempts, config_max_attempts, expected):
+    runner.max_attempts = max_attempts
+    runner.pipeline_step_config.RETRY.MAX_ATTEMPTS = config_max_attempts
+    assert runner.run_retry_config.MAX_ATTEMPTS == expected
+
+
+@pytest.mark.parametrize(
+    "exit_codes,stderr_patterns,n_runs,expected_success",
+    [
+        ([], [], 3, True),
+        ([137], [], 3, True),
+        ([], ["No space left"], 3, True),
+        ([1], [], 1, False),
+        ([], ["Segmentation fault"], 1, False),
+    ],
+)
+def test_run_single_wrapper_retry(
+    runner: Runner,
+    exit_codes,
+    stderr_patterns,
+    n_runs,
+    expected_success,
+    mocker: pytest_mock.MockFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    runner.pipeline_step_config.RETRY = RetryConfig(
+        MAX_ATTEMPTS=3,
+        BACKOFF_SECONDS=10,
+        EXIT_CODES=exit_codes,
+        STDERR_PATTERNS=stderr_patterns,
+    )
+    error = subprocess.CalledProcessError(
+        137, ["bosh"], stderr="error\nNo space left on device"
+    )
+    mocked_run_command = mocker.patch(
+        "nipoppy.workflows.runner._run_command",
+        side_effect=[error, error, mocker.MagicMock()],
+    )
+    mocked_sleep = mocker.patch("nipoppy.workflows.runner.time.sleep")
+
+    success, _ = runner._run_single_wrapper("01", "1")
+
+    assert success == expected_success
+    assert mocked_run_command.call_count == n_runs
+    assert [call.args[0] for call in mocked_sleep.call_args_list] == pytest.approx(
+        [10, 20][: n_runs - 1], abs=1
+    )
+    assert (("01", "1") in runner._run_times) == expected_success
+    if n_runs > 1:
+        assert "(attempt 1/3)" in caplog.text
+
+
+def test_run_single_wrapper_retry_max_attempts(
+    runner: Runner, mocker: pytest_mock.MockFixture
+):
+    runner.max_attempts = 2
+    mocked_run_command = mocker.patch(
+        "nipoppy.workflows.runner._run_command",
+        side_effect=subprocess.CalledProcessError(1, ["bosh"]),
+    )
+    mocker.patch("nipoppy.workflows.runner.time.sleep")
+
+    assert runner._run_single_wrapper("01", "1") == (False, None)
+    assert mocked_run_command.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "side_effect",
+    [
+        subprocess.TimeoutExpired(cmd=["bosh"], timeout=60),
+        RuntimeError("not a pipeline command failure"),
+    ],
+)
+def test_run_single_wrapper_no_retry(
+    runner: Runner, side_effect, mocker: pytest_mock.MockFixture
+):
+    runner.max_attempts = 3
+    mocked_run_command = mocker.patch(
+        "nipoppy.workflows.runner._run_command", side_effect=side_effect
+    )
+    mocked_sleep = mocker.patch("nipoppy.workflows.runner.time.sleep")
+
+    assert runner._run_single_wrapper("01", "1") == (False, None)
+    assert mocked_run_command.call_count == 1
+    mocked_sleep.assert_not_called()
+
+
+def test_run_locally_retry_backoff_runs_other_items(
+    runner: Runner, mocker: pytest_mock.MockFixture
+):
+    runner.pipeline_step_config.RETRY = RetryConfig(MAX_ATTEMPTS=2, BACKOFF_SECONDS=0.5)
+    mocker.patch.object(runner, "_get_n_parallel_jobs", return_value=1)
+    started = []
+
+    def _run_single(participant_id, session_id):
+        started.append(participant_id)
+        if started.count(participant_id) == 1 and participant_id == "01":
+            raise ExecutionError("failed") from subprocess.CalledProcessError(
+                1, ["bosh"]
+            )
+
+    mocker.patch.object(runner, "run_single", side_effect=_run_single)
+
+    runner._run_locally([("01", "1"), ("02", "1"), ("03", "1")])
+
+    # the single worker runs the other participants during the backoff
+    assert started == ["01", "02", "03", "01"]
+    assert runner.n_success == 3
+
+
+def test_run_locally_n_jobs_retry(runner: Runner, mocker: pytest_mock.MockFixture):
+    runner.n_jobs = 2
+    runner.max_attempts = 2
+    mocker.patch.object(runner.run_retry_config, "BACKOFF_SECONDS", 0)
+    mocked_run = mocker.patch(
+        "nipoppy.workflows.runner.subprocess.run",
+        side_effect=[
+            mocker.Mock(returncode=ReturnCode.PIPELINE_RETRYABLE_ERROR),
+            mocker.Mock(returncode=ReturnCode.SUCCESS),
+            mocker.Mock(returncode=ReturnCode.SUCCESS),
+        ],
+    )
+
+    runner._run_locally([("01", "1"), ("02", "1")])
+
+    assert mocked_run.call_count == 3
+    assert all("--report-retryable" in call.args[0] for call in mocked_run.mock_calls)
+    assert runner.n_success == 2
+    assert runner.return_code == ReturnCode.SUCCESS
+
+
+def test_run_locally_report_retryable(runner: Runner, mocker: pytest_mock.MockFixture):
+    runner.report_retryable = True
+    runner.max_attempts = 3
+    mocked_run_command = mocker.patch(
+        "nipoppy.workflows.runner._run_command",
+        side_effect=subprocess.CalledProcessError(1, ["bosh"]),
+    )
+
+    runner._run_locally([("01", "1")])
+
+    # the parent process retries the run
+    assert mocked_run_command.call_count == 1
+    assert runner._retryable == {("01", "1")}
+    assert runner.return_code == ReturnCode.PIPELINE_RETRYABLE_ERROR
+
+
+@pytest.mark.parametrize(
+    "max_attempts,expected_option",
+    [(None, None), (1, "--max-attempts"), (3, "--report-retryable")],
+)
+def test_generate_cli_command_for_subprocess_max_attempts(
+    runner: Runner, max_attempts, expected_option
+):
+    runner.max_attempts = max_attempts
+    command = runner._generate_cli_command_for_subprocess("01", "1")
+    for option in ("--max-attempts", "--report-retryable"):
+        assert (option in command) == (option == expected_option)
+
+
 @pytest.mark.parametrize(
     "uri,expected_image,expected_type",
     [
@@ -338,6 +936,120 @@ def test_launch_boutiques_run(
     assert mocked_run_command.call_args[1].get("quiet") is True
 
 
+def test_launch_boutiques_run_validates_descriptor_once(
+    runner: Runner, mocker: pytest_mock.MockFixture
+):
+    # descriptor without Nipoppy placeholders
+    runner.descriptor["command-line"] = "echo [ARG1] [ARG2]"
+    mocker.patch("nipoppy.workflows.runner._run_command")
+    mocked_bosh = mocker.patch("nipoppy.workflows.runner.bosh", wraps=bosh)
+
+    runner.launch_boutiques_run("01", "BL")
+    runner.launch_boutiques_run("02", "BL")
+
+    mocked_bosh.assert_called_once()
+    assert mocked_bosh.call_args[0][0][0] == "validate"
+
+
+def test_init_simulate_output(tmp_path: Path):
+    runner = ProcessingRunner(
+        dpath_root=tmp_path,
+        pipeline_name="dummy_pipeline",
+        simulate_output=tmp_path / "commands.txt",
+    )
+    assert runner.simulate
+
+
+def test_init_simulate_output_hpc(tmp_path: Path):
+    with pytest.raises(WorkflowError, match="mutually exclusive"):
+        ProcessingRunner(
+            dpath_root=tmp_path,
+            pipeline_name="dummy_pipeline",
+            simulate_output=tmp_path / "commands.txt",
+            hpc="slurm",
+        )
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_launch_boutiques_run_simulate_output(
+    runner: Runner, tmp_path: Path, mocker: pytest_mock.MockFixture, dry_run: bool
+):
+    fpath_output = tmp_path / "output" / "commands.txt"
+    runner.simulate = True
+    runner.simulate_output = fpath_output
+    runner.dry_run = dry_run
+    mocked_run_command = mocker.patch("nipoppy.workflows.runner._run_command")
+
+    for participant_id in ("02", "01"):
+        runner.launch_boutiques_run(participant_id, "BL")
+    mocked_run_command.assert_not_called()
+
+    runner._write_simulated_command_lines()
+    if dry_run:
+        assert not fpath_output.exists()
+        return
+
+    lines = fpath_output.read_text().splitlines()
+    assert len(lines) == 5
+    assert lines[0].startswith("# dummy_pipeline 1.0.0")
+    assert lines[1] == "# participant_id=01 session_id=BL"
+    assert lines[3] == "# participant_id=02 session_id=BL"
+    assert lines[2] == runner._simulated_command_lines[("01", "BL")]
+    assert lines[4] == runner._simulated_command_lines[("02", "BL")]
+    assert "[[NIPOPPY_" not in lines[2]
+
+
+@pytest.mark.parametrize(
+    "simulate_output,write_subcohort,expected_write",
+    [
+        (None, None, False),
+        ("commands.txt", None, True),
+        ("commands.txt", "subcohort.tsv", False),
+    ],
+)
+def test_run_main_simulate_output(
+    runner: Runner,
+    simulate_output,
+    write_subcohort,
+    expected_write,
+    mocker: pytest_mock.MockFixture,
+):
+    runner.simulate_output = simulate_output
+    runner.write_subcohort = write_subcohort
+    mocker.patch("nipoppy.workflows.pipeline.BasePipelineWorkflow.run_main")
+    mocked_write = mocker.patch.object(runner, "_write_simulated_command_lines")
+
+    runner.run_main()
+
+    assert mocked_write.called == expected_write
+
+
+def test_validate_invocation(runner: Runner):
+    descriptor_str = json.dumps(
+        {
+            "name": "test",
+            "tool-version": "1.0",
+            "description": "test",
+            "command-line": "echo [ARG1]",
+            "schema-version": "0.5",
+            "inputs": [
+                {
+                    "id": "arg1",
+                    "name": "arg1",
+                    "type": "Number",
+                    "value-key": "[ARG1]",
+                    "default-value": 1,
+                },
+            ],
+        }
+    )
+    runner.validate_invocation("{}", descriptor_str)
+    runner.validate_invocation('{"arg1": 2}', descriptor_str)
+    with pytest.raises(InvocationValidationError):
+        runner.validate_invocation('{"arg1": "not a number"}', descriptor_str)
+    assert list(runner._validated_descriptors) == [descriptor_str]
+
+
 @pytest.mark.parametrize(
     "container_handler,expected_container_opts",
     [
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -10,11 +11,18 @@ import pytest_mock
 
 from nipoppy.config.pipeline_step import AnalysisLevelType
 from nipoppy.env import DEFAULT_PIPELINE_STEP_NAME
+from nipoppy.exceptions import FileOperationError, ReturnCode, WorkflowError
 from nipoppy.tabular.curation_status import CurationStatusTable
 from nipoppy.tabular.manifest import Manifest
 from nipoppy.tabular.processing_status import ProcessingStatusTable
+from nipoppy.utils import fileops
 from nipoppy.workflows.processing_runner import ProcessingRunner
-from nipoppy.workflows.tracker import PipelineTracker
+from nipoppy.workflows.tracker import (
+    MultiPipelineTracker,
+    PipelineTracker,
+    TrackerFingerprints,
+    update_processing_status_file,
+)
 from tests.conftest import (
     create_empty_dataset,
     create_pipeline_config_files,
@@ -162,6 +170,28 @@ def test_check_status(tracker: PipelineTracker, relative_paths, expected_status)
     assert tracker.check_status(relative_paths) == expected_status
 
 
+def test_check_status_output_dir_traversed_once(
+    tracker: PipelineTracker, mocker: pytest_mock.MockerFixture
+):
+    for relative_path in ["dirA/file.txt", "dirB/file.txt"]:
+        fpath = tracker.dpath_pipeline_output / relative_path
+        fpath.parent.mkdir(parents=True)
+        fpath.touch()
+    mocked_list_files = mocker.spy(fileops, "list_files")
+
+    for _ in range(3):
+        assert (
+            tracker.check_status(["dirA/*.txt"]) == ProcessingStatusTable.status_success
+        )
+    # only the directory that can contain matches is traversed
+    mocked_list_files.assert_called_once_with(
+        [tracker.dpath_pipeline_output / "dirA"],
+        n_jobs=tracker.n_jobs,
+        include_dirs=True,
+        follow_symlinks=True,
+    )
+
+
 @pytest.mark.parametrize(
     "relative_paths,relative_dpath_to_tar,expected_status",
     [
@@ -176,8 +206,8 @@ def test_check_status(tracker: PipelineTracker, relative_paths, expected_status)
             ProcessingStatusTable.status_success,
         ),
         (["**/*.txt"], "dirA", ProcessingStatusTable.status_success),
-        # # FAILING, see note in check_status
-        # (["*file.txt"], "dirA", ProcessingStatus.status_fail),
+        (["*file.txt"], "dirA", ProcessingStatusTable.status_fail),
+        (["other_dir/*.txt"], "dirA", ProcessingStatusTable.status_fail),
         (
             ["dirA/01_ses-1.txt", "dirA/dirB/file.txt", "missing.txt"],
             "dirA",
@@ -195,6 +225,7 @@ def test_check_status_with_tarball(
     relative_paths: list[str],
     relative_dpath_to_tar: str,
     expected_status,
+    mocker: pytest_mock.MockerFixture,
 ):
     for relative_path_to_write in ["dirA/01_ses-1.txt", "dirA/dirB/file.txt"]:
         fpath = tracker.dpath_pipeline_output / relative_path_to_write
@@ -208,9 +239,16 @@ def test_check_status_with_tarball(
     ).tar_directory(dpath_to_tar)
 
     assert not dpath_to_tar.exists()
+    # tarballs are only read to create missing member listing files
+    fileops.get_fpath_tar_members(dpath_to_tar.with_suffix(".tar")).unlink()
+    assert (
+        tracker.check_status(relative_paths, relative_dpath_to_tar) == expected_status
+    )
+    mocked_open = mocker.patch("tarfile.open")
     assert (
         tracker.check_status(relative_paths, relative_dpath_to_tar) == expected_status
     )
+    mocked_open.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -352,12 +390,469 @@ def test_update_status_file(
     ).equals(expected_processing_status_table)
 
 
+def _concurrent_record(pipeline_name: str, pipeline_version: str) -> dict:
+    # e.g. written by a processing runner with --track
+    return {
+        ProcessingStatusTable.col_participant_id: "99",
+        ProcessingStatusTable.col_session_id: "1",
+        ProcessingStatusTable.col_pipeline_name: pipeline_name,
+        ProcessingStatusTable.col_pipeline_version: pipeline_version,
+        ProcessingStatusTable.col_pipeline_step: "default",
+        ProcessingStatusTable.col_status: ProcessingStatusTable.status_success,
+    }
+
+
+def test_run_main_keeps_concurrent_updates(tracker: PipelineTracker):
+    prepare_dataset(
+        participants_and_sessions_manifest={"01": ["1"]},
+        participants_and_sessions_bidsified={"01": ["1"]},
+        dpath_bidsified=tracker.study.layout.dpath_bids,
+    )
+    tracker.run_setup()
+    update_processing_status_file(
+        [_concurrent_record(tracker.pipeline_name, tracker.pipeline_version)],
+        tracker.study.layout,
+    )
+
+    tracker.run_main()
+
+    processing_status_table = ProcessingStatusTable.load(
+        tracker.study.layout.fpath_processing_status
+    )
+    assert set(processing_status_table[ProcessingStatusTable.col_participant_id]) == {
+        "01",
+        "99",
+    }
+
+
 def test_run_main(tracker: PipelineTracker, mocker: pytest_mock.MockFixture):
     mocked_update_status_file = mocker.patch.object(tracker, "_update_status_file")
     tracker.run_main()
     mocked_update_status_file.assert_called_once()
 
 
+def test_get_fingerprint(tracker: PipelineTracker):
+    dpath = tracker.dpath_pipeline_output / "01" / "ses-1"
+    fingerprint_missing = tracker.get_fingerprint("01", "1")
+    fingerprint_other = tracker.get_fingerprint("01", "2")
+
+    (dpath / "anat").mkdir(parents=True)
+    fingerprint_dir = tracker.get_fingerprint("01", "1")
+    assert fingerprint_dir != fingerprint_missing
+
+    # changes in direct subdirectories are detected
+    (dpath / "anat" / "T1w.nii.gz").touch()
+    mtime_ns = dpath.stat().st_mtime_ns + 10**9
+    os.utime(dpath / "anat", ns=(mtime_ns, mtime_ns))
+    assert tracker.get_fingerprint("01", "1") != fingerprint_dir
+
+    # other participants/sessions have separate fingerprints
+    assert tracker.get_fingerprint("01", "2") == fingerprint_other
+
+
+@pytest.mark.parametrize(
+    "relative_path,relative_path_changed",
+    [
+        (
+            "[[NIPOPPY_PARTICIPANT_ID]]/[[NIPOPPY_BIDS_SESSION_ID]]/a/b/*.txt",
+            "01/ses-1/a/b/results.txt",
+        ),
+        (
+            "[[NIPOPPY_PARTICIPANT_ID]]/stats/[[NIPOPPY_BIDS_SESSION_ID]].txt",
+            "01/stats/ses-1.txt",
+        ),
+        ("group/**/*.txt", "group/results.txt"),
+        ("file.txt", "file.txt"),
+    ],
+)
+def test_get_fingerprint_tracked_paths(
+    tracker: PipelineTracker, relative_path: str, relative_path_changed: str
+):
+    tracker.tracker_config.PATHS = [relative_path]
+    fpath_changed = tracker.dpath_pipeline_output / relative_path_changed
+    fpath_changed.parent.mkdir(parents=True, exist_ok=True)
+    (tracker.dpath_pipeline_output / "01" / "ses-1").mkdir(parents=True, exist_ok=True)
+    fingerprint = tracker.get_fingerprint("01", "1")
+
+    # new outputs deep inside (or outside of) the participant-session directory
+    fpath_changed.touch()
+    assert tracker.get_fingerprint("01", "1") != fingerprint
+
+
+def test_get_fingerprint_new_participant(tracker: PipelineTracker):
+    tracker.tracker_config.PATHS = ["[[NIPOPPY_PARTICIPANT_ID]]_*.html"]
+    fingerprint = tracker.get_fingerprint("01", "1")
+    (tracker.dpath_pipeline_output / "02").mkdir(parents=True)
+    assert tracker.get_fingerprint("01", "1") == fingerprint
+
+
+def test_get_fingerprint_no_participant_session_dir(tracker: PipelineTracker):
+    tracker.tracker_config.PARTICIPANT_SESSION_DIR = None
+    assert tracker.get_fingerprint("01", "1") is None
+
+
+def test_get_fingerprint_tarball(tracker: PipelineTracker):
+    fingerprint = tracker.get_fingerprint("01", "1")
+    (tracker.dpath_pipeline_output / "01").mkdir(parents=True)
+    (tracker.dpath_pipeline_output / "01" / "ses-1.tar").touch()
+    assert tracker.get_fingerprint("01", "1") != fingerprint
+
+
+def test_tracker_fingerprints(tmp_path: Path):
+    fpath = tmp_path / ".nipoppy" / "fingerprints.sqlite"
+    with TrackerFingerprints(fpath) as fingerprints_table:
+        fingerprints_table.update(
+            {("01", "1"): "a", ("01", "2"): "b"}, "pipeline", "1.0", "step"
+        )
+        fingerprints_table.update({("01", "1"): "c"}, "pipeline", "1.0", "step")
+        fingerprints_table.update({("01", "1"): "d"}, "pipeline", "2.0", "step")
+
+    with TrackerFingerprints(fpath) as fingerprints_table:
+        assert fingerprints_table.load("pipeline", "1.0", "step") == {
+            ("01", "1"): "c",
+            ("01", "2"): "b",
+        }
+        assert fingerprints_table.load("pipeline", "1.0", "other_step") == {}
+
+
+def test_tracker_fingerprints_not_open(tmp_path: Path):
+    with pytest.raises(FileOperationError, match="Index is not open"):
+        TrackerFingerprints(tmp_path / "fingerprints.sqlite").load("a", "b", "c")
+
+
+def _rerun_tracker(tracker: PipelineTracker, **kwargs) -> PipelineTracker:
+    tracker = PipelineTracker(
+        dpath_root=tracker.dpath_root,
+        pipeline_name=tracker.pipeline_name,
+        pipeline_version=tracker.pipeline_version,
+        pipeline_step=tracker.pipeline_step,
+        **kwargs,
+    )
+    tracker.study.config = get_config()
+    tracker.run()
+    return tracker
+
+
+@pytest.mark.parametrize("full", [False, True])
+def test_run_skip_unchanged(
+    tracker: PipelineTracker, full: bool, caplog: pytest.LogCaptureFixture
+):
+    prepare_dataset(
+        participants_and_sessions_manifest={"01": ["1", "2"], "02": ["1", "2"]},
+        participants_and_sessions_bidsified={"01": ["1", "2"], "02": ["1", "2"]},
+        dpath_bidsified=tracker.study.layout.dpath_bids,
+    )
+    fpath = tracker.dpath_pipeline_output / "01" / "ses-1" / "results.txt"
+    fpath.parent.mkdir(parents=True)
+    fpath.touch()
+    tracker.run()
+    assert tracker.n_total == 4
+    assert tracker.n_skipped == 0
+    assert tracker.study.layout.fpath_tracker_fingerprints.exists()
+
+    # new outputs for one participant-session
+    (tracker.dpath_pipeline_output / "02" / "ses-2").mkdir(parents=True)
+
+    tracker = _rerun_tracker(tracker, full=full)
+    if full:
+        assert tracker.n_total == 4
+        assert tracker.n_skipped == 0
+    else:
+        assert tracker.n_total == 1
+        assert tracker.n_skipped == 3
+        assert "Skipping 3 participants or sessions" in caplog.text
+    # skipped participants/sessions keep their status
+    assert len(tracker.processing_status_table) == 4
+
+
+def test_run_skip_unchanged_not_in_status_file(tracker: PipelineTracker):
+    prepare_dataset(
+        participants_and_sessions_manifest={"01": ["1", "2"], "02": ["1", "2"]},
+        participants_and_sessions_bidsified={"01": ["1", "2"], "02": ["1", "2"]},
+        dpath_bidsified=tracker.study.layout.dpath_bids,
+    )
+    tracker.run()
+    tracker.study.layout.fpath_processing_status.unlink()
+
+    tracker = _rerun_tracker(tracker)
+    assert tracker.n_skipped == 0
+    assert tracker.n_total == 4
+
+
+def test_run_skip_unchanged_dry_run(tracker: PipelineTracker):
+    tracker.dry_run = True
+    tracker.run()
+    assert not tracker.study.layout.fpath_tracker_fingerprints.exists()
+
+
+def test_log_summary_message_all_skipped(
+    tracker: PipelineTracker, caplog: pytest.LogCaptureFixture
+):
+    tracker.n_skipped = 4
+    tracker._log_summary_message()
+    assert tracker.return_code == ReturnCode.SUCCESS
+    assert "No participants or sessions to check" in caplog.text
+
+
+def test_update_processing_status_file(tracker: PipelineTracker):
+    def get_record(participant_id: str) -> dict:
+        return {
+            ProcessingStatusTable.col_participant_id: participant_id,
+            ProcessingStatusTable.col_session_id: "1",
+            ProcessingStatusTable.col_pipeline_name: tracker.pipeline_name,
+            ProcessingStatusTable.col_pipeline_version: tracker.pipeline_version,
+            ProcessingStatusTable.col_pipeline_step: tracker.pipeline_step,
+            ProcessingStatusTable.col_status: ProcessingStatusTable.status_success,
+        }
+
+    # records written by another process are kept
+    ProcessingStatusTable().add_or_update_records([get_record("01")]).save_with_backup(
+        tracker.study.layout.fpath_processing_status
+    )
+    processing_status_table = update_processing_status_file(
+        [get_record("02")], tracker.study.layout
+    )
+
+    assert len(processing_status_table) == 2
+    assert (
+        len(ProcessingStatusTable.load(tracker.study.layout.fpath_processing_status))
+        == 2
+    )
+    assert tracker.study.layout.fpath_processing_status_lock.exists()
+
+
+def test_hpc_runner(tracker: PipelineTracker):
+    assert tracker.hpc_runner.subcommand == "track-processing"
+
+
+@pytest.mark.parametrize("n_jobs_submitted", [2, 1])
+def test_submit_hpc_job(
+    tracker: PipelineTracker, n_jobs_submitted: int, mocker: pytest_mock.MockFixture
+):
+    mocked_submit = mocker.patch.object(
+        tracker.hpc_runner, "submit", return_value=n_jobs_submitted
+    )
+    tracker.hpc = "slurm"
+    tracker.shard_size = 3
+    tracker.full = True
+    participants_sessions = [("01", "1"), ("01", "2"), ("02", "1"), ("02", "2")]
+
+    tracker._submit_hpc_job(participants_sessions)
+
+    assert tracker.n_success == n_jobs_submitted
+    assert tracker.n_total == 2
+    kwargs = mocked_submit.call_args.kwargs
+    dpath_shards = kwargs["dpath_work"]
+    assert dpath_shards.parent == tracker.dpath_partial_results
+    assert kwargs["participant_ids"] == ["", ""]
+    commands = kwargs["job_array_commands"]
+    assert len(commands) == 2
+    for i_shard, command in enumerate(commands, start=1):
+        assert command.startswith("nipoppy track-processing")
+        assert f"--use-subcohort {dpath_shards / f'shard-000{i_shard}.tsv'}" in command
+        assert (
+            f"--partial-status-file {dpath_shards / f'status-000{i_shard}.tsv'}"
+            in command
+        )
+        assert "--full" in command
+    assert pd.read_csv(
+        dpath_shards / "shard-0001.tsv", header=None, sep="\t", dtype=str
+    ).values.tolist() == [["01", "1"], ["01", "2"], ["02", "1"]]
+    # shards that were not submitted are removed
+    assert (dpath_shards / "shard-0002.tsv").exists() == (n_jobs_submitted == 2)
+
+
+def test_submit_hpc_job_none_submitted(
+    tracker: PipelineTracker, mocker: pytest_mock.MockFixture
+):
+    mocker.patch.object(tracker.hpc_runner, "submit", return_value=0)
+    tracker._submit_hpc_job([("01", "1")])
+    assert not any(tracker.dpath_partial_results.iterdir())
+
+
+def test_submit_hpc_job_skips_pending_shards(
+    tracker: PipelineTracker,
+    mocker: pytest_mock.MockFixture,
+    caplog: pytest.LogCaptureFixture,
+):
+    mocked_submit = mocker.patch.object(tracker.hpc_runner, "submit", return_value=1)
+    dpath_shards = tracker.dpath_partial_results / "submission"
+    dpath_shards.mkdir(parents=True)
+    # task still running (or failed)
+    (dpath_shards / "shard-0001.tsv").write_text("01\t1\n")
+    # task completed
+    (dpath_shards / "shard-0002.tsv").write_text("02\t1\n")
+    (dpath_shards / "status-0002.tsv").touch()
+
+    tracker._submit_hpc_job([("01", "1"), ("02", "1")])
+
+    fpath_shard = Path(
+        mocked_submit.call_args.kwargs["job_array_commands"][0]
+        .split("--use-subcohort ")[1]
+        .split()[0]
+    )
+    assert fpath_shard.read_text() == "02\t1\n"
+    assert "Skipping 1 participant(s)/session(s)" in caplog.text
+    assert "--merge-only" in caplog.text
+
+
+def test_submit_hpc_job_all_pending(
+    tracker: PipelineTracker, mocker: pytest_mock.MockFixture
+):
+    mocked_submit = mocker.patch.object(tracker.hpc_runner, "submit")
+    dpath_shards = tracker.dpath_partial_results / "submission"
+    dpath_shards.mkdir(parents=True)
+    (dpath_shards / "shard-0001.tsv").write_text("01\t1\n")
+
+    tracker._submit_hpc_job([("01", "1")])
+
+    mocked_submit.assert_not_called()
+    assert tracker.n_total == 0
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_run_merge_only(tracker: PipelineTracker, dry_run: bool):
+    dpath_completed = tracker.dpath_partial_results / "submission1"
+    dpath_completed.mkdir(parents=True)
+    (dpath_completed / "shard-0001.tsv").write_text("01\t1\n")
+    ProcessingStatusTable().add_or_update_records(
+        [
+            {
+                ProcessingStatusTable.col_participant_id: "01",
+                ProcessingStatusTable.col_session_id: "1",
+                ProcessingStatusTable.col_pipeline_name: tracker.pipeline_name,
+                ProcessingStatusTable.col_pipeline_version: tracker.pipeline_version,
+                ProcessingStatusTable.col_pipeline_step: tracker.pipeline_step,
+                ProcessingStatusTable.col_status: ProcessingStatusTable.status_success,
+            }
+        ]
+    ).to_csv(dpath_completed / "status-0001.tsv", sep="\t", index=False)
+    dpath_failed = tracker.dpath_partial_results / "submission2"
+    dpath_failed.mkdir(parents=True)
+    (dpath_failed / "shard-0001.tsv").write_text("02\t1\n")
+
+    tracker = _rerun_tracker(tracker, merge_only=True, dry_run=dry_run)
+
+    assert tracker.return_code == ReturnCode.SUCCESS
+    assert tracker.n_total == 0
+    assert tracker.study.layout.fpath_processing_status.exists() == (not dry_run)
+    assert dpath_completed.exists() == dry_run
+    assert dpath_failed.exists() == dry_run
+
+
+def test_run_hpc(tracker: PipelineTracker, mocker: pytest_mock.MockFixture):
+    mocked_submit_hpc_job = mocker.patch.object(tracker, "_submit_hpc_job")
+    tracker.hpc = "slurm"
+    tracker.run()
+    mocked_submit_hpc_job.assert_called_once()
+    assert not tracker.study.layout.fpath_processing_status.exists()
+
+
+def test_run_partial_status_file_and_merge(tracker: PipelineTracker):
+    prepare_dataset(
+        participants_and_sessions_manifest={"01": ["1", "2"], "02": ["1", "2"]},
+        participants_and_sessions_bidsified={"01": ["1", "2"], "02": ["1", "2"]},
+        dpath_bidsified=tracker.study.layout.dpath_bids,
+    )
+    (tracker.dpath_pipeline_output / "01" / "ses-1").mkdir(parents=True)
+    dpath_shards = tracker.dpath_partial_results / "submission"
+    dpath_shards.mkdir(parents=True)
+    fpath_shard = dpath_shards / "shard-0001.tsv"
+    fpath_shard.write_text("01\t1\n02\t1\n")
+    fpath_partial_status = dpath_shards / "status-0001.tsv"
+
+    # HPC job array task, which merges its results when it finishes
+    task = _rerun_tracker(
+        tracker, use_subcohort=fpath_shard, partial_status_file=fpath_partial_status
+    )
+    assert task.n_total == 2
+    assert (
+        len(ProcessingStatusTable.load(tracker.study.layout.fpath_processing_status))
+        == 2
+    )
+    assert not dpath_shards.exists()
+
+    # fingerprints were merged too
+    tracker = _rerun_tracker(tracker)
+    assert tracker.n_skipped == 2
+    assert tracker.n_total == 2
+    assert (
+        len(ProcessingStatusTable.load(tracker.study.layout.fpath_processing_status))
+        == 4
+    )
+    assert not dpath_shards.exists()
+
+
+def test_merge_partial_results_reloads_status_file(
+    tracker: PipelineTracker, mocker: pytest_mock.MockFixture
+):
+    records = [
+        {
+            ProcessingStatusTable.col_participant_id: participant_id,
+            ProcessingStatusTable.col_session_id: "1",
+            ProcessingStatusTable.col_pipeline_name: tracker.pipeline_name,
+            ProcessingStatusTable.col_pipeline_version: tracker.pipeline_version,
+            ProcessingStatusTable.col_pipeline_step: tracker.pipeline_step,
+            ProcessingStatusTable.col_status: ProcessingStatusTable.status_success,
+        }
+        for participant_id in ("01", "02")
+    ]
+    # written by another job array task after this one was set up
+    ProcessingStatusTable().add_or_update_records(records[:1]).save_with_backup(
+        tracker.study.layout.fpath_processing_status
+    )
+    dpath_shards = tracker.dpath_partial_results / "submission"
+    dpath_shards.mkdir(parents=True)
+    (dpath_shards / "shard-0002.tsv").write_text("02\t1\n")
+    ProcessingStatusTable().add_or_update_records(records[1:]).to_csv(
+        dpath_shards / "status-0002.tsv", sep="\t", index=False
+    )
+    tracker.processing_status_table = ProcessingStatusTable()
+
+    spy = mocker.patch(
+        "nipoppy.workflows.tracker.update_processing_status_file",
+        wraps=update_processing_status_file,
+    )
+
+    tracker.merge_partial_results()
+
+    # records are added under the processing status file lock
+    spy.assert_called_once()
+    assert (tracker.dpath_partial_results / "merge.lock").exists()
+
+    assert (
+        len(ProcessingStatusTable.load(tracker.study.layout.fpath_processing_status))
+        == 2
+    )
+    assert not dpath_shards.exists()
+
+
+def test_merge_partial_results_dry_run(tracker: PipelineTracker):
+    dpath_shards = tracker.dpath_partial_results / "submission"
+    dpath_shards.mkdir(parents=True)
+    fpath_partial_status = dpath_shards / "status-0001.tsv"
+    ProcessingStatusTable().add_or_update_records(
+        [
+            {
+                ProcessingStatusTable.col_participant_id: "01",
+                ProcessingStatusTable.col_session_id: "1",
+                ProcessingStatusTable.col_pipeline_name: tracker.pipeline_name,
+                ProcessingStatusTable.col_pipeline_version: tracker.pipeline_version,
+                ProcessingStatusTable.col_pipeline_step: tracker.pipeline_step,
+                ProcessingStatusTable.col_status: ProcessingStatusTable.status_success,
+            }
+        ]
+    ).to_csv(fpath_partial_status, sep="\t", index=False)
+    tracker.dry_run = True
+    tracker.processing_status_table = ProcessingStatusTable()
+
+    tracker.merge_partial_results()
+
+    assert len(tracker.processing_status_table) == 1
+    assert fpath_partial_status.exists()
+    assert not tracker.study.layout.fpath_processing_status.exists()
+
+
 def test_run_no_create_work_directory(tracker: PipelineTracker):
     tracker.run()
     assert not tracker.dpath_pipeline_work.exists()
@@ -367,3 +862,162 @@ def test_run_no_rm_work_directory(tracker: PipelineTracker):
     tracker.dpath_pipeline_work.mkdir(parents=True)
     tracker.run()
     assert tracker.dpath_pipeline_work.exists()
+
+
+@pytest.fixture(scope="function")
+def multi_tracker(tracker: PipelineTracker) -> MultiPipelineTracker:
+    prepare_dataset(
+        participants_and_sessions_manifest={"01": ["1", "2"], "02": ["1", "2"]},
+        participants_and_sessions_bidsified={"01": ["1", "2"], "02": ["1", "2"]},
+        dpath_bidsified=tracker.study.layout.dpath_bids,
+    )
+    create_pipeline_config_files(
+        tracker.study.layout.dpath_pipelines,
+        processing_pipelines=[
+            {
+                "NAME": tracker.pipeline_name,
+                "VERSION": "0.2.0",
+                "STEPS": [
+                    {"NAME": "default", "TRACKER_CONFIG_FILE": "tracker_config.json"}
+                ],
+            },
+            {
+                "NAME": "other_pipeline",
+                "VERSION": "1.0.0",
+                "STEPS": [
+                    {"NAME": "step1", "TRACKER_CONFIG_FILE": "tracker_config.json"},
+                    {"NAME": "step2"},
+                ],
+            },
+        ],
+    )
+    fpath_tracker_config = tracker.dpath_pipeline_bundle / "tracker_config.json"
+    for dname_bundle in ("test_pipeline-0.2.0", "other_pipeline-1.0.0"):
+        (
+            fpath_tracker_config.parent.parent / dname_bundle / "tracker_config.json"
+        ).write_text(fpath_tracker_config.read_text())
+
+    multi_tracker = MultiPipelineTracker(
+        dpath_root=tracker.dpath_root, all_installed=True
+    )
+    multi_tracker.study.config = get_config()
+    return multi_tracker
+
+
+@pytest.mark.parametrize(
+    "all_installed,pipeline_names,expected_tags",
+    [
+        (
+            True,
+            None,
+            [
+                "other_pipeline-1.0.0-step1",
+                "test_pipeline-0.1.0-default",
+                "test_pipeline-0.2.0-default",
+            ],
+        ),
+        (False, ["test_pipeline"], ["test_pipeline-0.2.0-default"]),
+    ],
+)
+def test_multi_tracker_get_trackers(
+    multi_tracker: MultiPipelineTracker,
+    all_installed: bool,
+    pipeline_names: list[str],
+    expected_tags: list[str],
+):
+    multi_tracker.all_installed = all_installed
+    multi_tracker.pipeline_names = pipeline_names
+    trackers = multi_tracker.get_trackers()
+    assert sorted(multi_tracker._get_tag(tracker) for tracker in trackers) == (
+        expected_tags
+    )
+    for tracker in trackers:
+        assert tracker.study is multi_tracker.study
+
+
+def test_multi_tracker_no_pipelines(tmp_path: Path):
+    with pytest.raises(WorkflowError, match="Pipeline names must be specified"):
+        MultiPipelineTracker(dpath_root=tmp_path)
+
+
+def test_multi_tracker_run(
+    multi_tracker: MultiPipelineTracker, mocker: pytest_mock.MockFixture
+):
+    spy_load = mocker.spy(ProcessingStatusTable, "load")
+    spy_save = mocker.spy(ProcessingStatusTable, "save_with_backup")
+
+    multi_tracker.run()
+
+    assert spy_load.call_count == 0  # no processing status file yet
+    assert spy_save.call_count == 1
+    processing_status_table = ProcessingStatusTable.load(
+        multi_tracker.study.layout.fpath_processing_status
+    )
+    assert len(processing_status_table) == 12
+    assert set(processing_status_table[ProcessingStatusTable.col_pipeline_name]) == {
+        "test_pipeline",
+        "other_pipeline",
+    }
+
+    # unchanged outputs are skipped by the next run
+    multi_tracker = MultiPipelineTracker(
+        dpath_root=multi_tracker.dpath_root, all_installed=True
+    )
+    multi_tracker.study.config = get_config()
+    multi_tracker.run()
+    assert all(tracker.n_skipped == 4 for tracker in multi_tracker.trackers)
+    assert all(tracker.n_total == 0 for tracker in multi_tracker.trackers)
+
+
+def test_multi_tracker_run_keeps_concurrent_updates(
+    multi_tracker: MultiPipelineTracker,
+):
+    multi_tracker.run_setup()
+    update_processing_status_file(
+        [_concurrent_record("test_pipeline", "0.2.0")], multi_tracker.study.layout
+    )
+
+    multi_tracker.run_main()
+
+    assert (
+        len(
+            ProcessingStatusTable.load(
+                multi_tracker.study.layout.fpath_processing_status
+            )
+        )
+        == 13
+    )
+
+
+def test_multi_tracker_run_merges_partial_results(
+    multi_tracker: MultiPipelineTracker,
+):
+    multi_tracker.run_setup()
+    tracker = multi_tracker.trackers[0]
+    dpath_shards = tracker.dpath_partial_results / "submission"
+    dpath_shards.mkdir(parents=True)
+    fpath_partial_status = dpath_shards / "status-0001.tsv"
+    ProcessingStatusTable().add_or_update_records(
+        [
+            {
+                ProcessingStatusTable.col_participant_id: "03",
+                ProcessingStatusTable.col_session_id: "1",
+                ProcessingStatusTable.col_pipeline_name: tracker.pipeline_name,
+                ProcessingStatusTable.col_pipeline_version: tracker.pipeline_version,
+                ProcessingStatusTable.col_pipeline_step: tracker.pipeline_step,
+                ProcessingStatusTable.col_status: ProcessingStatusTable.status_success,
+            }
+        ]
+    ).to_csv(fpath_partial_status, sep="\t", index=False)
+
+    multi_tracker.run_main()
+
+    assert (
+        len(
+            ProcessingStatusTable.load(
+                multi_tracker.study.layout.fpath_processing_status
+            )
+        )
+        == 13
+    )
+    assert not dpath_shards.exists()